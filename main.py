@@ -199,6 +199,7 @@ from scripts.game_structure.discord_rpc import _DiscordRPC
 from scripts.cat.sprites import sprites
 from scripts.utility import (
     quit,
+    enable_sprite_disk_cache,
 )  # pylint: disable=redefined-builtin
 
 # from scripts.debug_menu import debugmode
@@ -219,20 +220,28 @@ game.rpc.start_rpc.set()
 
 # LOAD cats & clan
 finished_loading = False
+loading_progress = 0.0
+"""How far along loading the cats is, from 0 to 1. Set by the loading thread."""
+
+
+def set_loading_progress(value: float):
+    global loading_progress
+    loading_progress = value
 
 
 def load_data():
     global finished_loading
 
-    # load in the spritesheets
+    # find the sprites, the spritesheets are loaded when they're first needed
     sprites.load_all()
+    enable_sprite_disk_cache()
 
     clan_list = read_clans()
     if clan_list:
         switch_set_value(Switch.clan_list, clan_list)
         switch_set_value(Switch.clan_name, clan_list[0])
         try:
-            load_cats()
+            load_cats(progress=set_loading_progress)
             version_info = clan_class.load_clan()
             version_convert(version_info)
             game.load_events()
@@ -269,11 +278,15 @@ def loading_animation(scale: float = 1):
             images.append(im)
         del im
 
+    bar_color = color.get_at((0, 0))
+
     # Cleanup
     del color
 
     x = screen.get_width() / 2
     y = screen.get_height() / 2
+    bar_width = 200 * scale
+    bar_top = y + images[0].get_height() / 2 + 10 * scale
 
     i = 0
     total_frames = len(images)
@@ -288,6 +301,20 @@ def loading_animation(scale: float = 1):
         screen.blit(
             images[i], (x - images[i].get_width() / 2, y - images[i].get_height() / 2)
         )
+        if loading_progress > 0:
+            pygame.draw.rect(
+                screen,
+                bar_color,
+                pygame.Rect(x - bar_width / 2, bar_top, bar_width, 4 * scale),
+                width=max(1, int(scale)),
+            )
+            pygame.draw.rect(
+                screen,
+                bar_color,
+                pygame.Rect(
+                    x - bar_width / 2, bar_top, bar_width * loading_progress, 4 * scale
+                ),
+            )
 
         i += 1
         if i >= total_frames:
@@ -325,8 +352,6 @@ def load_game():
     del loading_thread
 
 
-# load spritesheets
-sprites.load_all()
 load_game()
 
 pygame.mixer.pre_init(buffer=44100)
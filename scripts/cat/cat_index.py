@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: ascii -*-
+"""
+Keeps the living Clan cats and their ranks at hand, so the many places that look for "every living
+cat in the Clan" or "every living warrior" don't need to check every cat in all_cats each time.
+
+The index is built from all_cats the first time it's needed and built again whenever a cat is added
+to or removed from all_cats, or any cat's status changes (rank changes, deaths, cats joining or
+leaving). Between those it's only looked up.
+
+Also keeps every cat's name in lower case for the name searches, so typing in a search bar doesn't
+put together every cat's name again on each keystroke.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+from scripts.game_structure import game
+
+_status_changes = 0
+
+
+def status_changed():
+    """Tells the index that a cat's group or rank changed, so it's built again before it's used."""
+    global _status_changes
+    _status_changes += 1
+
+
+class CatIndex:
+    """Living Clan cats, all of them and by rank, in all_cats order"""
+
+    def __init__(self):
+        self.alive: list = []
+        """Cats currently alive in the player Clan"""
+        self.by_rank: Dict[str, list] = {}
+        """Cats currently alive in the player Clan with each rank"""
+        self.positions: Dict[str, int] = {}
+        """Where each cat is in all_cats, so lookups come out in the same order as all_cats"""
+        self._all_cats = None
+        self._signature = None
+
+    def clear(self):
+        """Forget everything, the index is built again the next time it's needed."""
+        self.alive = []
+        self.by_rank = {}
+        self.positions = {}
+        self._all_cats = None
+        self._signature = None
+
+    def sync(self, all_cats: dict):
+        """
+        Build the index again if all_cats or any cat's status changed since it was built.
+        :param all_cats: Cat.all_cats
+        """
+        # cats are only ever added to the end, so the length and last ID change whenever the cats do
+        signature = (
+            len(all_cats),
+            next(reversed(all_cats), None),
+            _status_changes,
+            id(game.used_group_IDs),
+            len(game.used_group_IDs),
+        )
+        if all_cats is self._all_cats and signature == self._signature:
+            return
+
+        self.clear()
+        for position, (cat_id, cat) in enumerate(all_cats.items()):
+            self.positions[cat_id] = position
+            if not cat.status.alive_in_player_clan:
+                continue
+            self.alive.append(cat)
+            self.by_rank.setdefault(cat.status.rank, []).append(cat)
+        self._all_cats = all_cats
+        self._signature = signature
+
+    def alive_in_clan(self, all_cats: dict) -> list:
+        """
+        :param all_cats: Cat.all_cats
+        :return: The cats currently alive in the player Clan, in all_cats order
+        """
+        self.sync(all_cats)
+        return list(self.alive)
+
+    def count_alive_in_clan(self, all_cats: dict) -> int:
+        """
+        :param all_cats: Cat.all_cats
+        :return: How many cats are currently alive in the player Clan
+        """
+        self.sync(all_cats)
+        return len(self.alive)
+
+    def with_rank(self, all_cats: dict, ranks: Iterable[str]) -> List:
+        """
+        :param all_cats: Cat.all_cats
+        :param ranks: The ranks to look for
+        :return: The cats currently alive in the player Clan with any of these ranks, in all_cats order
+        """
+        self.sync(all_cats)
+        found = []
+        ranks_found = 0
+        for rank in set(ranks):
+            cats = self.by_rank.get(rank)
+            if cats:
+                found.extend(cats)
+                ranks_found += 1
+        if ranks_found > 1:
+            found.sort(key=lambda cat: self.positions[cat.ID])
+        return found
+
+
+cat_index = CatIndex()
+
+
+class NameSearch:
+    """Cats' names in lower case, for searching cats by name"""
+
+    def __init__(self):
+        self.names: Dict[str, Tuple[tuple, str]] = {}
+        """Each cat's name in lower case, with what it was worked out from"""
+
+    def clear(self):
+        """Forget every name, they're worked out again the next time they're needed."""
+        self.names = {}
+
+    def lower_name(self, cat) -> str:
+        """
+        :param cat: The cat
+        :return: The cat's name as it's shown, in lower case
+        """
+        # the name shown is put together from the prefix, suffix and the cat's status. Names are
+        # changed in several places, so check those are the same rather than have each place say so
+        name = cat.name
+        signature = (name.prefix, name.suffix, name.specsuffix_hidden, _status_changes)
+        found = self.names.get(cat.ID)
+        if found is not None and found[0] == signature:
+            return found[1]
+        lowered = str(name).lower()
+        self.names[cat.ID] = (signature, lowered)
+        return lowered
+
+    def search(self, cats: Iterable, search_text: str) -> list:
+        """
+        :param cats: The cats to search
+        :param search_text: The text to look for in the cats' names, in any case
+        :return: The cats with the text in their name, in the same order as given
+        """
+        search_text = search_text.lower()
+        return [cat for cat in cats if search_text in self.lower_name(cat)]
+
+
+name_search = NameSearch()
@@ -16,6 +16,7 @@ import ujson  # type: ignore
 
 import scripts.game_structure.localization as pronouns
 from scripts.cat import save_load
+from scripts.cat.cat_index import cat_index
 from scripts.cat.enums import CatAge, CatRank, CatSocial, CatGroup
 from scripts.cat.history import History
 from scripts.cat.names import Name
@@ -25,7 +26,7 @@ from scripts.cat.skills import CatSkills
 from scripts.cat.status import Status, StatusDict
 from scripts.cat.thoughts import Thoughts
 from scripts.cat_relations.inheritance import Inheritance
-from scripts.cat_relations.relationship import Relationship
+from scripts.cat_relations.relationship import Relationship, RelationshipStore
 from scripts.cat_relations.enums import RelType, RelTier, rel_type_tiers
 from scripts.clan_package.settings import get_clan_setting
 from scripts.conditions import (
@@ -38,7 +39,10 @@ from scripts.conditions import (
 from scripts.event_class import Single_Event
 from scripts.events_module.generate_events import GenerateEvents
 from scripts.game_structure import image_cache, constants, game
-from scripts.game_structure.game.save_load import safe_save
+from scripts.game_structure.game.save_load.clan_files import (
+    ClanFiles,
+    get_clan_files,
+)
 from scripts.game_structure.game.settings import game_setting_get
 from scripts.game_structure.game.switches import switch_get_value, Switch
 from scripts.game_structure.localization import load_lang_resource
@@ -159,6 +163,8 @@ class Cat:
         """
 
         self._history = None
+        self._saved_relationship_ids = None
+        """IDs of the cats in the relationship file as it was last saved or loaded"""
 
         if (
             faded
@@ -190,7 +196,7 @@ class Cat:
         self.patrol_with_mentor = 0
         self.apprentice = []
         self.former_apprentices = []
-        self.relationships = {}
+        self.relationships = RelationshipStore(self)
         self.mate = []
         self.previous_mates = []
         self._pronouns: Dict[str, List[Dict[str, Union[str, int]]]] = {}
@@ -1066,10 +1072,9 @@ class Cat:
             print("WARNING: History failed to load, no Clan in switches?")
             return
 
-        history_directory = f"{get_save_dir()}/{clanname}/history/"
-        cat_history_directory = history_directory + self.ID + "_history.json"
+        history_text = get_clan_files(clanname).read(f"history/{self.ID}_history.json")
 
-        if not os.path.exists(cat_history_directory):
+        if history_text is None:
             self._history = History(
                 beginning={},
                 mentor_influence={},
@@ -1083,44 +1088,39 @@ class Cat:
             )
             return
         try:
-            with open(cat_history_directory, "r", encoding="utf-8") as read_file:
-                history_data = ujson.loads(read_file.read())
+            history_data = ujson.loads(history_text)
 
-                self._history = History(
-                    beginning=(
-                        history_data["beginning"] if "beginning" in history_data else {}
-                    ),
-                    mentor_influence=(
-                        history_data["mentor_influence"]
-                        if "mentor_influence" in history_data
-                        else {}
-                    ),
-                    app_ceremony=(
-                        history_data["app_ceremony"]
-                        if "app_ceremony" in history_data
-                        else {}
-                    ),
-                    lead_ceremony=(
-                        history_data["lead_ceremony"]
-                        if "lead_ceremony" in history_data
-                        else None
-                    ),
-                    possible_history=(
-                        history_data["possible_history"]
-                        if "possible_history" in history_data
-                        else {}
-                    ),
-                    died_by=(
-                        history_data["died_by"] if "died_by" in history_data else []
-                    ),
-                    scar_events=(
-                        history_data["scar_events"]
-                        if "scar_events" in history_data
-                        else []
-                    ),
-                    murder=history_data["murder"] if "murder" in history_data else {},
-                    cat=self,
-                )
+            self._history = History(
+                beginning=(
+                    history_data["beginning"] if "beginning" in history_data else {}
+                ),
+                mentor_influence=(
+                    history_data["mentor_influence"]
+                    if "mentor_influence" in history_data
+                    else {}
+                ),
+                app_ceremony=(
+                    history_data["app_ceremony"]
+                    if "app_ceremony" in history_data
+                    else {}
+                ),
+                lead_ceremony=(
+                    history_data["lead_ceremony"]
+                    if "lead_ceremony" in history_data
+                    else None
+                ),
+                possible_history=(
+                    history_data["possible_history"]
+                    if "possible_history" in history_data
+                    else {}
+                ),
+                died_by=(history_data["died_by"] if "died_by" in history_data else []),
+                scar_events=(
+                    history_data["scar_events"] if "scar_events" in history_data else []
+                ),
+                murder=history_data["murder"] if "murder" in history_data else {},
+                cat=self,
+            )
         except Exception:
             self._history = None
             print(
@@ -1129,18 +1129,14 @@ class Cat:
                 f"you'd like to preserve!"
             )
 
-    def save_history(self, history_dir):
+    def save_history(self, clan_files: ClanFiles):
         """Save this cat's history.
 
-        :param history_dir: Directory to save cat's history to
-        :type history_dir: str
+        :param clan_files: Storage of the clan's cat files, from get_clan_files
         """
-        if not os.path.exists(history_dir):
-            os.makedirs(history_dir)
-
         history_dict = self.history.make_dict()
         try:
-            safe_save(f"{history_dir}/{self.ID}_history.json", history_dict)
+            clan_files.write(f"history/{self.ID}_history.json", history_dict)
         except:
             self.history = History(
                 beginning={},
@@ -1604,8 +1600,8 @@ class Cat:
         """Randomly choose a cat of the Clan and have an interaction with them."""
         cats_to_choose = [
             iter_cat
-            for iter_cat in Cat.all_cats.values()
-            if iter_cat.ID != self.ID and iter_cat.status.alive_in_player_clan
+            for iter_cat in cat_index.alive_in_clan(Cat.all_cats)
+            if iter_cat.ID != self.ID
         ]
         # if there are no cats to interact, stop
         if not cats_to_choose:
@@ -2206,26 +2202,30 @@ class Cat:
                 )
                 self.get_ill(illness_name)
 
-    def save_condition(self):
+    def save_condition(self, clan_files: ClanFiles = None):
+        """Save this cat's conditions.
+
+        :param clan_files: Storage of the clan's cat files, defaults to the current clan's
+        """
         # save conditions for each cat
-        clanname = None
-        if switch_get_value(Switch.clan_name) != "":
-            clanname = switch_get_value(Switch.clan_name)
-        elif len(switch_get_value(Switch.clan_list)) > 0:
-            clanname = switch_get_value(Switch.clan_list)[0]
-        elif game.clan is not None:
-            clanname = game.clan.name
+        if clan_files is None:
+            clanname = None
+            if switch_get_value(Switch.clan_name) != "":
+                clanname = switch_get_value(Switch.clan_name)
+            elif len(switch_get_value(Switch.clan_list)) > 0:
+                clanname = switch_get_value(Switch.clan_list)[0]
+            elif game.clan is not None:
+                clanname = game.clan.name
+            clan_files = get_clan_files(clanname)
 
-        condition_directory = get_save_dir() + "/" + clanname + "/conditions"
-        condition_file_path = condition_directory + "/" + self.ID + "_conditions.json"
+        condition_file_name = f"conditions/{self.ID}_conditions.json"
 
         if (
             (not self.is_ill() and not self.is_injured() and not self.is_disabled())
             or self.dead
             or self.status.is_outsider
         ):
-            if os.path.exists(condition_file_path):
-                os.remove(condition_file_path)
+            clan_files.delete(condition_file_name)
             return
 
         conditions = {}
@@ -2239,7 +2239,7 @@ class Cat:
         if self.is_disabled():
             conditions["permanent conditions"] = self.permanent_condition
 
-        safe_save(condition_file_path, conditions)
+        clan_files.write(condition_file_name, conditions)
 
     def load_conditions(self):
         if switch_get_value(Switch.clan_name) != "":
@@ -2247,17 +2247,15 @@ class Cat:
         else:
             clanname = switch_get_value(Switch.clan_list)[0]
 
-        condition_directory = get_save_dir() + "/" + clanname + "/conditions/"
-        condition_cat_directory = condition_directory + self.ID + "_conditions.json"
-        if not os.path.exists(condition_cat_directory):
-            return
-
         try:
-            with open(condition_cat_directory, "r", encoding="utf-8") as read_file:
-                rel_data = ujson.loads(read_file.read())
-                self.illnesses = rel_data.get("illnesses", {})
-                self.injuries = rel_data.get("injuries", {})
-                self.permanent_condition = rel_data.get("permanent conditions", {})
+            rel_data = get_clan_files(clanname).read_json(
+                f"conditions/{self.ID}_conditions.json"
+            )
+            if rel_data is None:
+                return
+            self.illnesses = rel_data.get("illnesses", {})
+            self.injuries = rel_data.get("injuries", {})
+            self.permanent_condition = rel_data.get("permanent conditions", {})
 
             if "paralyzed" in self.permanent_condition and not self.pelt.paralyzed:
                 self.pelt.paralyzed = True
@@ -2710,14 +2708,28 @@ class Cat:
                 )
                 self.relationships[the_cat.ID] = rel
 
-    def save_relationship_of_cat(self, relationship_dir):
-        # save relationships for each cat
+    def save_relationship_of_cat(self, clan_files: ClanFiles):
+        """Save this cat's relationships, if any of them changed since they were last saved or loaded.
+
+        :param clan_files: Storage of the clan's cat files, from get_clan_files
+        :return: True if the file was written"""
+        relation_file_name = f"relationships/{self.ID}_relations.json"
+        if (
+            self._saved_relationship_ids is not None
+            and self.relationships.keys() == self._saved_relationship_ids
+            and not self.relationships.dirty
+            and clan_files.exists(relation_file_name)
+        ):
+            return False
 
-        rel = []
-        for r in self.relationships.values():
-            rel.append(r.to_dict())
+        clan_files.write(relation_file_name, self.relationships.to_list())
+        self.mark_relationships_saved()
+        return True
 
-        safe_save(f"{relationship_dir}/{self.ID}_relations.json", rel)
+    def mark_relationships_saved(self):
+        """Marks the relationships as matching what's in the relationship file"""
+        self.relationships.mark_saved()
+        self._saved_relationship_ids = set(self.relationships)
 
     def load_relationship_of_cat(self):
         if switch_get_value(Switch.clan_name) != "":
@@ -2725,57 +2737,62 @@ class Cat:
         else:
             clanname = switch_get_value(Switch.clan_list)[0]
 
-        relation_directory = get_save_dir() + "/" + clanname + "/relationships/"
-        relation_cat_directory = relation_directory + self.ID + "_relations.json"
+        clan_files = get_clan_files(clanname)
 
-        self.relationships = {}
-        if os.path.exists(relation_directory):
-            if not os.path.exists(relation_cat_directory):
+        self.relationships = RelationshipStore(self)
+        self._saved_relationship_ids = None
+        if clan_files.has_folder("relationships"):
+            rel_data = clan_files.read_json(f"relationships/{self.ID}_relations.json")
+            if rel_data is None:
                 self.init_all_relationships()
                 for cat in Cat.all_cats.values():
                     cat.create_one_relationship(self)
                 return
             try:
-                with open(relation_cat_directory, "r", encoding="utf-8") as read_file:
-                    rel_data = ujson.loads(read_file.read())
-
-                    for rel in rel_data:
-                        # checking validity
-                        cat_to = self.all_cats.get(rel["cat_to_id"])
-                        if cat_to is None or rel["cat_to_id"] == self.ID:
-                            continue
-
-                        # converting old saves
-                        if "platonic_like" in rel:
-                            # romance
-                            rel["romance"] = rel["romantic_love"]
-                            rel.pop("romantic_love")
-                            # like
-                            rel["like"] = rel["platonic_like"] - rel["dislike"]
-                            rel.pop("platonic_like")
-                            rel.pop("dislike")
-                            # respect
-                            rel["respect"] = rel["admiration"] - rel["jealousy"]
-                            rel.pop("admiration")
-                            rel.pop("jealousy")
-                            # comfort
-                            rel["comfort"] = rel["comfortable"]
-                            rel.pop("comfortable")
-
-                        # create relationship
-                        new_rel = Relationship(
-                            cat_from=self,
-                            cat_to=cat_to,
-                            mates=rel["mates"] or False,
-                            family=rel["family"] or False,
-                            romance=(rel["romance"] or 0),
-                            like=(rel["like"] or 0),
-                            respect=rel["respect"] or 0,
-                            comfort=rel["comfort"] or 0,
-                            trust=rel["trust"] or 0,
-                            log=rel["log"],
-                        )
-                        self.relationships[rel["cat_to_id"]] = new_rel
+                # if anything in the file gets dropped or converted, it has to be written again
+                matches_file = True
+                for rel in rel_data:
+                    # checking validity
+                    cat_to = self.all_cats.get(rel["cat_to_id"])
+                    if cat_to is None or rel["cat_to_id"] == self.ID:
+                        matches_file = False
+                        continue
+
+                    # converting old saves
+                    if "platonic_like" in rel:
+                        matches_file = False
+                        # romance
+                        rel["romance"] = rel["romantic_love"]
+                        rel.pop("romantic_love")
+                        # like
+                        rel["like"] = rel["platonic_like"] - rel["dislike"]
+                        rel.pop("platonic_like")
+                        rel.pop("dislike")
+                        # respect
+                        rel["respect"] = rel["admiration"] - rel["jealousy"]
+                        rel.pop("admiration")
+                        rel.pop("jealousy")
+                        # comfort
+                        rel["comfort"] = rel["comfortable"]
+                        rel.pop("comfortable")
+
+                    # create relationship
+                    new_rel = Relationship(
+                        cat_from=self,
+                        cat_to=cat_to,
+                        mates=rel.get("mates") or False,
+                        family=rel.get("family") or False,
+                        romance=rel.get("romance") or 0,
+                        like=rel.get("like") or 0,
+                        respect=rel.get("respect") or 0,
+                        comfort=rel.get("comfort") or 0,
+                        trust=rel.get("trust") or 0,
+                        log=rel.get("log"),
+                    )
+                    self.relationships[rel["cat_to_id"]] = new_rel
+
+                if matches_file:
+                    self.mark_relationships_saved()
 
             except KeyError:
                 print(
@@ -2958,12 +2975,19 @@ class Cat:
             return None
         if ID in Cat.all_cats:
             return Cat.all_cats[ID]
-        else:
-            return ob if (ob := Cat.load_faded_cat(ID)) else None
+
+        faded_cat = save_load.faded_cat_cache.get(ID)
+        if faded_cat is None:
+            faded_cat = Cat.load_faded_cat(ID)
+            if not faded_cat:
+                return None
+            save_load.faded_cat_cache.put(faded_cat)
+        return faded_cat
 
     @staticmethod
     def load_faded_cat(cat: str):
-        """Loads a faded cat, returning the cat object. This object is saved nowhere else."""
+        """Loads a faded cat from its file, returning the cat object. fetch_cat keeps the cats it loads
+        in save_load.faded_cat_cache, this doesn't."""
 
         # just preventing any attempts to load something that isn't a cat ID
         if not cat.isdigit():
@@ -1,10 +1,12 @@
 import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import TYPE_CHECKING, Type, List
+from typing import TYPE_CHECKING, Type, List, Optional
 
 import ujson
 
 from scripts.game_structure.game.save_load import safe_save
+from scripts.game_structure.game.save_load.clan_files import get_clan_files
 from scripts.game_structure.game.settings.settings import game_setting_get
 from scripts.housekeeping.datadir import get_save_dir
 
@@ -18,40 +20,112 @@ faded_ids = []
 cat_to_fade = []
 """Cats who have been faded since the last save"""
 
+FADED_CAT_CACHE_SIZE = 500
+"""How many faded cats are kept loaded at once"""
+
+
+class FadedCatCache:
+    """
+    Faded cats loaded by Cat.fetch_cat, so they aren't read from their files and made again every
+    time they're looked up. Once it's full, the least recently used cat is dropped.
+    """
+
+    def __init__(self, max_size: int = FADED_CAT_CACHE_SIZE):
+        """
+        :param max_size: How many faded cats to keep
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._cats: "OrderedDict[str, Cat]" = OrderedDict()
+        """Faded cats by ID, least recently used first"""
+
+    def get(self, cat_id: str) -> Optional["Cat"]:
+        """
+        :param cat_id: ID of the faded cat
+        :return: The faded cat, or None if it isn't loaded
+        """
+        cat = self._cats.get(cat_id)
+        if cat is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._cats.move_to_end(cat_id)
+        return cat
+
+    def put(self, cat: "Cat"):
+        """
+        Keep a faded cat that was just loaded
+        :param cat: The faded cat
+        """
+        self._cats[cat.ID] = cat
+        self._cats.move_to_end(cat.ID)
+        while len(self._cats) > self.max_size:
+            self._cats.popitem(last=False)
+
+    def discard(self, cat_id: str):
+        """
+        Drop a faded cat, so it's read from its file the next time. Use this whenever the file changes.
+        :param cat_id: ID of the faded cat
+        """
+        self._cats.pop(cat_id, None)
+
+    def clear(self):
+        """Drop every faded cat and reset the counts"""
+        self._cats.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """How often a looked up faded cat was already loaded, between 0 and 1"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self):
+        return len(self._cats)
+
+
+faded_cat_cache = FadedCatCache()
+"""The faded cats of the current Clan that were looked up recently"""
+
 
 def save_cats(clanname, cat_class: Type["Cat"], game: "Game"):
-    """Save the cat data."""
+    """Save the cat data.
+    Only files whose contents changed since they were last saved or loaded are written.
+    """
 
     directory = Path(get_save_dir()) / clanname
-    history_dir = directory / "history"
-    relationships_dir = directory / "relationships"
-
     if not directory.exists():
         directory.mkdir(parents=True)
-
-    # Delete all existing relationship files
-    if not relationships_dir.exists():
-        relationships_dir.mkdir()
-    for f in relationships_dir.glob("*.json"):
-        f.unlink()
+    clan_files = get_clan_files(clanname)
 
     save_faded_cats(clanname, cat_class, game)  # Fades cat and saves them, if needed
 
     clan_cats = []
+    living_relation_files = set()
     for inter_cat in cat_class.all_cats.values():
         cat_data = inter_cat.get_save_dict()
         clan_cats.append(cat_data)
 
-        inter_cat.save_condition()
+        inter_cat.save_condition(clan_files)
 
-        if inter_cat.history:
-            inter_cat.save_history(history_dir)
+        # a history that was never loaded can't have changed
+        if inter_cat._history:
+            inter_cat.save_history(clan_files)
             # after saving, dump the history info
             inter_cat.history = None
         if not inter_cat.dead:
-            inter_cat.save_relationship_of_cat(relationships_dir)
+            living_relation_files.add(f"relationships/{inter_cat.ID}_relations.json")
+            inter_cat.save_relationship_of_cat(clan_files)
+
+    # Delete the relationship files of cats that died or faded
+    for file_name in clan_files.list("relationships"):
+        if file_name not in living_relation_files:
+            clan_files.delete(file_name)
 
-    safe_save(f"{get_save_dir()}/{clanname}/clan_cats.json", clan_cats)
+    clan_files.write("clan_cats.json", clan_cats)
+    clan_files.commit()
 
 
 def save_faded_cats(clanname, cat_class: Type["Cat"], game: "Game"):
@@ -97,6 +171,7 @@ def save_faded_cats(clanname, cat_class: Type["Cat"], game: "Game"):
         cat_data = inter_cat.get_save_dict(faded=True)
         cat_path = fade_cat_dir / f"{cat}.json"
         safe_save(cat_path, cat_data)
+        faded_cat_cache.discard(cat)
 
         # Remove the cat from the active cats lists
         game.clan.remove_cat(
@@ -154,6 +229,7 @@ def add_faded_offspring_to_faded_cat(clanname, parent: str, offspring: str):
     cat_info["faded_offspring"].append(offspring)
 
     safe_save(faded_parent_path, cat_info)
+    faded_cat_cache.discard(parent)
 
     return True
 
@@ -168,6 +244,7 @@ def get_faded_ids():
 
 def load_faded_cat_ids(clanname):
     global faded_ids
+    faded_cat_cache.clear()
     fade_cat_dir = Path(get_save_dir()) / clanname / "faded_cats"
     if not fade_cat_dir.exists():
         faded_ids = []
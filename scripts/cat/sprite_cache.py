@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: ascii -*-
+"""
+Keeps composed cat sprites on disk between sessions, so cats that were drawn before don't need the
+spritesheets loaded or their layers put together again.
+
+Every sprite is stored as raw RGBA in a file named after a hash of its sprite key. The files live in
+a folder named after a fingerprint of the sprite files, tint dicts and sprite config. Changing any of
+those starts a new folder and removes the old one. The folder is kept under a size limit by removing
+the least recently used sprites.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import pygame
+
+from scripts.game_structure import constants
+
+logger = logging.getLogger(__name__)
+
+SPRITE_CACHE_VERSION = 1
+"""Change this when the way sprites are composed changes, so old cached sprites aren't used"""
+
+SPRITE_DISK_CACHE_BYTES = 64 * 1024 * 1024
+"""How much space cached sprites may take up on disk"""
+
+
+def sprite_fingerprint(
+    spritesheet_files: Dict[str, str], sprite_folder: str = "sprites"
+) -> str:
+    """
+    :param spritesheet_files: Which file each spritesheet is loaded from
+    :param sprite_folder: The folder with the spritesheets and tint dicts
+    :return: A hash that changes whenever anything that goes into a composed sprite changes
+    """
+    files = []
+    for root, _, filenames in os.walk(sprite_folder):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            stat = os.stat(path)
+            files.append((path.replace("\\", "/"), stat.st_mtime_ns, stat.st_size))
+    files.sort()
+
+    fingerprint = repr(
+        (
+            SPRITE_CACHE_VERSION,
+            sorted(spritesheet_files.items()),
+            files,
+            constants.CONFIG.get("cat_sprites"),
+        )
+    )
+    return hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:16]
+
+
+class SpriteDiskCache:
+    """Composed cat sprites saved in a cache folder"""
+
+    def __init__(
+        self,
+        folder: str,
+        fingerprint: str,
+        max_bytes: int = SPRITE_DISK_CACHE_BYTES,
+    ):
+        """
+        :param folder: Folder to keep the cache in. Anything else in it is removed.
+        :param fingerprint: The sprite fingerprint, see sprite_fingerprint
+        :param max_bytes: How much space the cached sprites may take up
+        """
+        self.folder = os.path.join(folder, fingerprint)
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._files: "OrderedDict[str, int]" = OrderedDict()
+        """Sizes of the cached files, least recently used first"""
+
+        try:
+            # sprites cached for a different set of sprite files are no use anymore
+            if os.path.isdir(folder):
+                for old_folder in os.listdir(folder):
+                    if old_folder != fingerprint:
+                        shutil.rmtree(os.path.join(folder, old_folder))
+            os.makedirs(self.folder, exist_ok=True)
+
+            found = []
+            for entry in os.scandir(self.folder):
+                stat = entry.stat()
+                found.append((stat.st_mtime_ns, entry.name, stat.st_size))
+        except OSError:
+            logger.warning("Couldn't set up the sprite cache", exc_info=True)
+            found = []
+
+        for _, filename, size in sorted(found):
+            self._files[filename] = size
+            self.total_bytes += size
+        self._evict()
+
+    @staticmethod
+    def _filename(key: tuple) -> str:
+        return hashlib.sha1(repr(key).encode("utf-8")).hexdigest() + ".rgba"
+
+    def get(self, key: tuple, size: int) -> Optional[pygame.Surface]:
+        """
+        :param key: The sprite's key
+        :param size: Width and height of the sprite
+        :return: The cached sprite, or None if it isn't cached
+        """
+        filename = self._filename(key)
+        if filename not in self._files:
+            return None
+
+        path = os.path.join(self.folder, filename)
+        try:
+            with open(path, "rb") as read_file:
+                data = read_file.read()
+            if len(data) != size * size * 4:
+                raise ValueError(f"{path} isn't a {size}x{size} sprite")
+            os.utime(path)
+        except (OSError, ValueError):
+            logger.warning("Couldn't load cached sprite", exc_info=True)
+            self._remove(filename)
+            return None
+
+        self._files.move_to_end(filename)
+        return pygame.image.frombytes(data, (size, size), "RGBA")
+
+    def put(self, key: tuple, sprite: pygame.Surface):
+        """
+        Saves a sprite in the cache
+        :param key: The sprite's key
+        :param sprite: The composed sprite
+        """
+        filename = self._filename(key)
+        data = pygame.image.tobytes(sprite, "RGBA")
+        try:
+            with open(os.path.join(self.folder, filename), "wb") as write_file:
+                write_file.write(data)
+        except OSError:
+            logger.warning("Couldn't cache sprite", exc_info=True)
+            return
+
+        self.total_bytes += len(data) - self._files.pop(filename, 0)
+        self._files[filename] = len(data)
+        self._evict()
+
+    def _remove(self, filename: str):
+        self.total_bytes -= self._files.pop(filename, 0)
+        try:
+            os.remove(os.path.join(self.folder, filename))
+        except OSError:
+            pass
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes and self._files:
+            self._remove(next(iter(self._files)))
+
+    def __len__(self):
+        return len(self._files)
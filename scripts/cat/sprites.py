@@ -1,6 +1,8 @@
 import logging
 import os
+from collections.abc import Mapping
 from copy import copy
+from typing import Dict, Tuple
 
 import pygame
 import ujson
@@ -13,6 +15,47 @@ from scripts.special_dates import SpecialDate, is_today
 logger = logging.getLogger(__name__)
 
 
+class SpriteRegistry(Mapping):
+    """
+    Every sprite's name and where it is, by spritesheet and pixel offset. A spritesheet is only loaded
+    when one of its sprites is first asked for, and each sprite is only cut from it once.
+    """
+
+    def __init__(self, owner: "Sprites"):
+        self._owner = owner
+        self._locations: Dict[str, Tuple[str, int, int]] = {}
+        self._sprites: Dict[str, pygame.Surface] = {}
+
+    def register(self, name: str, spritesheet: str, x: int, y: int):
+        """
+        Adds a sprite without cutting it out yet
+        :param name: The sprite's name
+        :param spritesheet: Name of the spritesheet it's on
+        :param x: Pixel offset of the sprite's left edge
+        :param y: Pixel offset of the sprite's top edge
+        """
+        self._locations[name] = (spritesheet, x, y)
+        self._sprites.pop(name, None)
+
+    def __getitem__(self, name: str) -> pygame.Surface:
+        sprite = self._sprites.get(name)
+        if sprite is None:
+            spritesheet, x, y = self._locations[name]
+            sprite = self._sprites[name] = self._owner.cut_sprite(
+                name, spritesheet, x, y
+            )
+        return sprite
+
+    def __contains__(self, name) -> bool:
+        return name in self._locations
+
+    def __iter__(self):
+        return iter(self._locations)
+
+    def __len__(self):
+        return len(self._locations)
+
+
 class Sprites:
     cat_tints = {}
     white_patches_tints = {}
@@ -25,9 +68,11 @@ class Sprites:
         this value."""
         self.symbol_dict = None
         self.size = None
+        self.loaded = False
+        self.spritesheet_files = {}
         self.spritesheets = {}
         self.images = {}
-        self.sprites = {}
+        self.sprites = SpriteRegistry(self)
 
         # Shared empty sprite for placeholders
         self.blank_sprite = None
@@ -51,13 +96,26 @@ class Sprites:
 
     def spritesheet(self, a_file, name):
         """
-        Add spritesheet called name from a_file.
+        Add spritesheet called name from a_file. The file isn't loaded until one of its sprites is needed.
 
         Parameters:
         a_file -- Path to the file to create a spritesheet from.
         name -- Name to call the new spritesheet.
         """
-        self.spritesheets[name] = pygame.image.load(a_file).convert_alpha()
+        self.spritesheet_files[name] = a_file
+        self.spritesheets.pop(name, None)
+
+    def get_spritesheet(self, name):
+        """
+        :param name: Name of the spritesheet
+        :return: The spritesheet, loaded from its file if this is the first time it's needed
+        """
+        sheet = self.spritesheets.get(name)
+        if sheet is None:
+            sheet = self.spritesheets[name] = pygame.image.load(
+                self.spritesheet_files[name]
+            ).convert_alpha()
+        return sheet
 
     def make_group(
         self, spritesheet, pos, name, sprites_x=3, sprites_y=7, no_index=False
@@ -76,7 +134,7 @@ class Sprites:
         group_y_ofs = pos[1] * sprites_y * self.size
         i = 0
 
-        # splitting group into singular sprites and storing into self.sprites section
+        # the sprites are only cut out of the spritesheet when they're first used
         for y in range(sprites_y):
             for x in range(sprites_x):
                 if no_index:
@@ -84,28 +142,44 @@ class Sprites:
                 else:
                     full_name = f"{name}{i}"
 
-                try:
-                    new_sprite = pygame.Surface.subsurface(
-                        self.spritesheets[spritesheet],
-                        group_x_ofs + x * self.size,
-                        group_y_ofs + y * self.size,
-                        self.size,
-                        self.size,
-                    )
-
-                except ValueError:
-                    # Fallback for non-existent sprites
-                    print(f"WARNING: nonexistent sprite - {full_name}")
-                    if not self.blank_sprite:
-                        self.blank_sprite = pygame.Surface(
-                            (self.size, self.size), pygame.HWSURFACE | pygame.SRCALPHA
-                        )
-                    new_sprite = self.blank_sprite
-
-                self.sprites[full_name] = new_sprite
+                self.sprites.register(
+                    full_name,
+                    spritesheet,
+                    group_x_ofs + x * self.size,
+                    group_y_ofs + y * self.size,
+                )
                 i += 1
 
+    def cut_sprite(self, name, spritesheet, x, y):
+        """
+        Cut a single sprite out of its spritesheet
+        :param name: The sprite's name
+        :param spritesheet: Name of the spritesheet it's on
+        :param x: Pixel offset of the sprite's left edge
+        :param y: Pixel offset of the sprite's top edge
+        :return: The sprite, or a blank sprite if it's not on the spritesheet
+        """
+        try:
+            return pygame.Surface.subsurface(
+                self.get_spritesheet(spritesheet), x, y, self.size, self.size
+            )
+        except ValueError:
+            # Fallback for non-existent sprites
+            print(f"WARNING: nonexistent sprite - {name}")
+            if not self.blank_sprite:
+                self.blank_sprite = pygame.Surface(
+                    (self.size, self.size), pygame.HWSURFACE | pygame.SRCALPHA
+                )
+            return self.blank_sprite
+
     def load_all(self):
+        """
+        Work out where every sprite is. Only done once, later calls do nothing.
+        """
+        if self.loaded:
+            return
+        self.loaded = True
+
         # get the width and height of the spritesheet
         lineart = pygame.image.load("sprites/lineart.png")
         width, height = lineart.get_size()
@@ -760,6 +834,7 @@ class Sprites:
             "Z",
         ]
 
+        self.clan_symbols = []
         # sprite names will format as "symbol{PREFIX}{INDEX}", ex. "symbolSPRING0"
         y_pos = 1
         for letter in letters:
@@ -3,6 +3,7 @@ from itertools import groupby
 from random import choice
 from typing import TypedDict, Optional, List, Dict
 
+from scripts.cat.cat_index import status_changed
 from scripts.cat.enums import CatRank, CatSocial, CatStanding, CatAge, CatGroup
 from scripts.game_structure import game
 
@@ -83,6 +84,8 @@ class Status:
         if self.group_history and not self.standing_history:
             self._start_standing()
 
+        status_changed()
+
     # SAVE/LOAD
     @staticmethod
     def _convert_old_group_saves(entry):
@@ -221,6 +224,7 @@ class Status:
                 new_history["rank"] = choice(possible_ranks)
 
         self.group_history = [new_history]
+        status_changed()
 
     def _start_standing(self):
         """
@@ -424,6 +428,7 @@ class Status:
         self.group_history.append(
             {"group": new_group_ID, "rank": new_rank, "moons_as": 0}
         )
+        status_changed()
 
         # add member standing for new group
         self.change_standing(CatStanding.MEMBER)
@@ -556,6 +561,7 @@ class Status:
         cat.rank_change() should typically be called instead, since it will handle mentor switches and other complex
         changes.
         """
+        status_changed()
         saved_group = None
         # checks that we don't add a duplicate group/rank pairing
         if self.group_history:
@@ -1,6 +1,6 @@
 import traceback
 from random import choice
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
 import i18n
 
@@ -14,6 +14,12 @@ if TYPE_CHECKING:
 
 
 class Thoughts:
+    thought_index: Dict[tuple, List[Tuple[dict, bool]]] = {}
+    """
+    Thoughts that can happen in a place, each with whether it needs a random cat.
+    Keyed by language, thought files, rank, biome, season and camp.
+    """
+
     @staticmethod
     def thought_fulfill_rel_constraints(main_cat, random_cat, constraint) -> bool:
         """Check if the relationship fulfills the interaction relationship constraints."""
@@ -49,6 +55,16 @@ class Thoughts:
         main_cat: "Cat", random_cat: "Cat", thought, game_mode, biome, season, camp
     ) -> bool:
         """Check if the two cats fulfills the thought constraints."""
+        if not Thoughts.thought_fits_place(thought, biome, season, camp):
+            return False
+
+        return Thoughts.cats_fulfill_cat_constraints(
+            main_cat, random_cat, thought, Thoughts.needs_random_cat(thought)
+        )
+
+    @staticmethod
+    def thought_fits_place(thought, biome, season, camp) -> bool:
+        """Check if the thought can happen in the Clan's biome, season and camp."""
 
         # This is for checking biome
         if "biome" in thought:
@@ -65,16 +81,29 @@ class Thoughts:
             if camp not in thought["camp"]:
                 return False
 
+        return True
+
+    @staticmethod
+    def needs_random_cat(thought) -> bool:
+        """Check if any of the thought's texts mention the random cat."""
+        return any("r_c" in thought_str for thought_str in thought["thoughts"])
+
+    @staticmethod
+    def cats_fulfill_cat_constraints(
+        main_cat: "Cat", random_cat: "Cat", thought, r_c_in: bool
+    ) -> bool:
+        """
+        Check if the two cats fulfill the thought constraints that depend on the cats.
+        :param r_c_in: whether the thought needs a random cat, see needs_random_cat
+        """
+
         # This is for checking the 'not_working' status
         if "not_working" in thought:
             if thought["not_working"] != main_cat.not_working():
                 return False
 
         # This is for checking if another cat is needed and there is another cat
-        r_c_in = [
-            thought_str for thought_str in thought["thoughts"] if "r_c" in thought_str
-        ]
-        if len(r_c_in) > 0 and not random_cat:
+        if r_c_in and not random_cat:
             return False
 
         # This is for filtering certain relationship types between the main cat and random cat.
@@ -166,7 +195,7 @@ class Thoughts:
             ):  # makes sure that outsiders can get thoughts all the time
                 pass
             else:
-                if outside_status and outside_status != "clancat" and len(r_c_in) > 0:
+                if outside_status and outside_status != "clancat" and r_c_in:
                     return False
 
         if "has_injuries" in thought:
@@ -308,26 +337,71 @@ class Thoughts:
             spec_dir = ""
 
         # newborns only pull from their status thoughts. this is done for convenience
-        try:
-            if main_cat.age == "newborn":
-                loaded_thoughts = load_lang_resource(
-                    f"thoughts/{life_dir}{spec_dir}/newborn.json"
-                )
-            else:
-                thoughts = load_lang_resource(
-                    f"thoughts/{life_dir}{spec_dir}/{rank}.json"
-                )
-                genthoughts = load_lang_resource(
-                    f"thoughts/{life_dir}{spec_dir}/general.json"
-                )
-                loaded_thoughts = thoughts + genthoughts
+        if main_cat.age == "newborn":
+            locations = (f"thoughts/{life_dir}{spec_dir}/newborn.json",)
+        else:
+            locations = (
+                f"thoughts/{life_dir}{spec_dir}/{rank}.json",
+                f"thoughts/{life_dir}{spec_dir}/general.json",
+            )
 
-            final_thoughts = Thoughts.create_thoughts(
-                loaded_thoughts, main_cat, other_cat, game_mode, biome, season, camp
+        try:
+            placed_thoughts = Thoughts.thoughts_for_place(
+                locations, main_cat.status.rank, biome, season, camp
             )
-            return final_thoughts
         except IOError:
             print("ERROR: loading thoughts")
+            return
+
+        return [
+            thought
+            for thought, r_c_in in placed_thoughts
+            if Thoughts.cats_fulfill_cat_constraints(
+                main_cat, other_cat, thought, r_c_in
+            )
+        ]
+
+    @staticmethod
+    def thoughts_for_place(
+        locations: Tuple[str, ...], rank, biome, season, camp
+    ) -> List[Tuple[dict, bool]]:
+        """
+        Loads thought files and keeps the thoughts that can happen in the given place, and that
+        don't rule out cats of the given rank. This is only worked out once for each place.
+        :param locations: the thought files, in the order their thoughts should be in
+        :param rank: the main cat's rank
+        :return: the thoughts, each with whether it needs a random cat
+        """
+        key = (
+            str(i18n.config.get("locale")),
+            locations,
+            rank,
+            biome,
+            season,
+            camp,
+        )
+        placed_thoughts = Thoughts.thought_index.get(key)
+        if placed_thoughts is not None:
+            return placed_thoughts
+
+        placed_thoughts = []
+        for location in locations:
+            for thought in load_lang_resource(location):
+                if not Thoughts.thought_fits_place(thought, biome, season, camp):
+                    continue
+                # a lost cat can match whatever its rank, so that's left to the cat checks
+                statuses = thought.get("main_status_constraint")
+                if (
+                    statuses
+                    and "any" not in statuses
+                    and "lost" not in statuses
+                    and rank not in statuses
+                ):
+                    continue
+                placed_thoughts.append((thought, Thoughts.needs_random_cat(thought)))
+
+        Thoughts.thought_index[key] = placed_thoughts
+        return placed_thoughts
 
     @staticmethod
     def get_chosen_thought(main_cat, other_cat, game_mode, biome, season, camp):
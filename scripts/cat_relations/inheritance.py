@@ -8,6 +8,8 @@ while mating and for the display of the family tree screen.
 
 """
 
+from typing import Dict, Iterable, List, Set, Tuple
+
 import i18n
 from strenum import StrEnum  # pylint: disable=no-name-in-module
 
@@ -31,8 +33,91 @@ BLOOD_RELATIVE_TYPES = [
 ]
 
 
+class FamilyGraph:
+    """
+    Which cats each cat is a parent of, by blood or adoption. Shared by all inheritances, so they can
+    find kits, siblings and the like without looking through every cat.
+
+    The graph is built from all_cats and built again whenever cats are added to or removed from it.
+    Changes to a cat's parents are picked up when its inheritance is updated.
+    """
+
+    def __init__(self):
+        self.children: Dict[str, Set[str]] = {}
+        """IDs of the kits of each parent"""
+        self.positions: Dict[str, int] = {}
+        """Where each cat is in all_cats, so lookups come out in the same order as all_cats"""
+        self._parents: Dict[str, Tuple[str, ...]] = {}
+        self._all_cats = None
+        self._signature = None
+
+    def clear(self):
+        """Forget everything, the graph is built again the next time it's needed."""
+        self.children.clear()
+        self.positions.clear()
+        self._parents.clear()
+        self._all_cats = None
+        self._signature = None
+
+    def sync(self, all_cats: dict):
+        """
+        Build the graph again if cats were added to or removed from all_cats since it was built.
+        :param all_cats: Cat.all_cats
+        """
+        # cats are only ever added to the end, so this changes whenever the cats change
+        signature = (len(all_cats), next(reversed(all_cats), None))
+        if all_cats is self._all_cats and signature == self._signature:
+            return
+
+        self.clear()
+        for position, (cat_id, cat) in enumerate(all_cats.items()):
+            self.positions[cat_id] = position
+            self._add(cat_id, cat)
+        self._all_cats = all_cats
+        self._signature = signature
+
+    def update_cat(self, cat):
+        """Pick up changes to the parents of a cat in the graph."""
+        if cat.ID not in self.positions:
+            return
+        if self._parent_ids(cat) != self._parents.get(cat.ID):
+            self._remove(cat.ID)
+            self._add(cat.ID, cat)
+
+    @staticmethod
+    def _parent_ids(cat) -> Tuple[str, ...]:
+        """The same parents as Inheritance.get_parents"""
+        blood_parents = ()
+        if cat.parent1:
+            blood_parents = (
+                (cat.parent1, cat.parent2) if cat.parent2 else (cat.parent1,)
+            )
+        return blood_parents + tuple(cat.adoptive_parents)
+
+    def _add(self, cat_id: str, cat):
+        parents = self._parent_ids(cat)
+        self._parents[cat_id] = parents
+        for parent_id in parents:
+            self.children.setdefault(parent_id, set()).add(cat_id)
+
+    def _remove(self, cat_id: str):
+        for parent_id in self._parents.pop(cat_id, ()):
+            self.children[parent_id].discard(cat_id)
+
+    def children_of(self, parent_ids: Iterable[str]) -> List[str]:
+        """
+        :param parent_ids: IDs of the parents
+        :return: IDs of the cats with any of these parents, in all_cats order
+        """
+        found = set()
+        for parent_id in parent_ids:
+            found.update(self.children.get(parent_id, ()))
+        return sorted(found, key=self.positions.__getitem__)
+
+
 class Inheritance:
     all_inheritances = {}  # ID: object
+    family = FamilyGraph()
 
     def __init__(self, cat, born=False):
         self.need_update = False
@@ -90,9 +175,23 @@ class Inheritance:
         # mates
         self.init_mates()
 
-        for inter_id, inter_cat in self.cat.all_cats.items():
+        all_cats = self.cat.all_cats
+        self.family.sync(all_cats)
+        self.family.update_cat(self.cat)
+
+        # only the kits of the cat, its parents, its grandparents and their kits can be related,
+        # aunts/uncles are kits of the grandparents and cousins are their kits
+        grand_parent_ids = list(self.grand_parents)
+        relative_ids = self.family.children_of(
+            [self.cat.ID]
+            + self.get_parents()
+            + grand_parent_ids
+            + self.family.children_of(grand_parent_ids)
+        )
+        for inter_id in relative_ids:
             if inter_id == self.cat.ID:
                 continue
+            inter_cat = all_cats[inter_id]
 
             # kits + their mates
             self.init_kits(inter_id, inter_cat)
@@ -107,12 +206,12 @@ class Inheritance:
             self.init_cousins(inter_id, inter_cat)
 
         # since grand kits depending on kits, ALL KITS HAVE TO BE SET FIRST!
-        for inter_id, inter_cat in self.cat.all_cats.items():
+        for inter_id in self.family.children_of(list(self.kits)):
             if inter_id == self.cat.ID:
                 continue
 
             # grand kits
-            self.init_grand_kits(inter_id, inter_cat)
+            self.init_grand_kits(inter_id, all_cats[inter_id])
 
         # relations to faded cats - these must occur after all non-faded
         # cats have been handled, and in the following order.
@@ -495,8 +594,9 @@ class Inheritance:
                 }
                 self.other_mates.append(mate_id)
 
-            # iterate over all cats, to get the children of the sibling
-            for _c in self.cat.all_cats.values():
+            # get the children of the sibling
+            for _c_id in self.family.children_of([inter_id]):
+                _c = self.cat.all_cats[_c_id]
                 _c_parents = self.get_parents(_c)
                 _c_adoptive = self.get_adoptive_parents(_c)
                 if inter_id in _c_parents:
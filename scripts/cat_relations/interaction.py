@@ -1,7 +1,14 @@
+from typing import Dict, List
+
 import i18n
 
 from scripts.cat_relations.enums import RelType
-from scripts.events_module.event_filters import event_for_cat
+from scripts.events_module.event_filters import (
+    event_for_cat,
+    event_for_location,
+    event_for_season,
+)
+from scripts.game_structure import game
 from scripts.game_structure.localization import load_lang_resource
 
 
@@ -111,33 +118,31 @@ class GroupInteraction:
 
 
 def cats_fulfill_single_interaction_constraints(
-    main_cat, random_cat, interaction
+    main_cat, random_cat, interaction, main_results=None, random_results=None
 ) -> bool:
-    """Check if the two cats fulfills the interaction constraints."""
-
-    main_constraint_dict = {
-        "status": interaction.main_status_constraint,
-        "trait": interaction.main_trait_constraint,
-        "backstory": interaction.backstory_constraint.get("m_c"),
-        "skills": interaction.main_skill_constraint,
-        "relationship_status": interaction.relationship_constraint,
-    }
-    random_constraint_dict = {
-        "status": interaction.random_status_constraint,
-        "trait": interaction.random_trait_constraint,
-        "backstory": interaction.backstory_constraint.get("r_c"),
-        "skill": interaction.random_skill_constraint,
-    }
-
-    main_cat_satisfied = event_for_cat(
-        main_constraint_dict, main_cat, [main_cat, random_cat], event_id=interaction.id
-    )
-    random_cat_satisfied = event_for_cat(
-        random_constraint_dict,
-        random_cat,
-        [random_cat, main_cat],
+    """Check if the two cats fulfills the interaction constraints.
+
+    :param main_cat: The cat starting the interaction
+    :param random_cat: The other cat
+    :param interaction: The interaction
+    :param main_results: Results to use for the main cat's own constraints, see cat_constraint_results.
+        Only for interactions from the master dict.
+    :param random_results: Results to use for the random cat's own constraints
+    :return: True if the cats fulfill the constraints
+    """
+    if not cat_fulfills_interaction(main_cat, interaction, True, main_results):
+        return False
+    if not cat_fulfills_interaction(random_cat, interaction, False, random_results):
+        return False
+
+    # the relationship and injury constraints depend on both cats
+    if interaction.relationship_constraint and not event_for_cat(
+        {"relationship_status": interaction.relationship_constraint},
+        main_cat,
+        [main_cat, random_cat],
         event_id=interaction.id,
-    )
+    ):
+        return False
 
     if len(interaction.has_injuries) >= 1:
         if "m_c" in interaction.has_injuries:
@@ -159,10 +164,82 @@ def cats_fulfill_single_interaction_constraints(
             if len(injuries_in_needed) <= 0:
                 return False
 
-    if main_cat_satisfied and random_cat_satisfied:
-        return True
+    return True
+
+
+def cat_fulfills_interaction(
+    cat, interaction, main: bool, results: Dict[SingleInteraction, bool] = None
+) -> bool:
+    """
+    Checks the constraints of an interaction that only depend on one of its cats: status, trait,
+    backstory and skill.
+    :param cat: The cat
+    :param interaction: The interaction
+    :param main: True for the cat starting the interaction, False for the other cat
+    :param results: Results of earlier checks for cats like this one, see cat_constraint_results
+    :return: True if the cat fulfills them
+    """
+    if results is not None:
+        fulfills = results.get(interaction)
+        if fulfills is not None:
+            return fulfills
+
+    if main:
+        constraint_dict = {
+            "status": interaction.main_status_constraint,
+            "trait": interaction.main_trait_constraint,
+            "backstory": interaction.backstory_constraint.get("m_c"),
+            "skills": interaction.main_skill_constraint,
+        }
+    else:
+        constraint_dict = {
+            "status": interaction.random_status_constraint,
+            "trait": interaction.random_trait_constraint,
+            "backstory": interaction.backstory_constraint.get("r_c"),
+            "skill": interaction.random_skill_constraint,
+        }
+    fulfills = event_for_cat(constraint_dict, cat, event_id=interaction.id)
+
+    if results is not None:
+        results[interaction] = fulfills
+    return fulfills
 
-    return False
+
+_constraint_results: Dict[tuple, Dict[SingleInteraction, bool]] = {}
+"""Results of cat_fulfills_interaction, by cat_constraint_key"""
+
+
+def cat_constraint_key(cat, main: bool) -> tuple:
+    """
+    :param cat: The cat
+    :param main: True for the cat starting the interaction, False for the other cat
+    :return: Everything about the cat that cat_fulfills_interaction looks at
+    """
+    skills = cat.skills
+    return (
+        main,
+        cat.status.rank,
+        cat.status.is_lost(),
+        cat.personality.trait,
+        cat.backstory,
+        (skills.primary.path, skills.primary.tier) if skills.primary else None,
+        (skills.secondary.path, skills.secondary.tier) if skills.secondary else None,
+        skills.hidden,
+    )
+
+
+def cat_constraint_results(cat, main: bool) -> Dict[SingleInteraction, bool]:
+    """
+    :param cat: The cat
+    :param main: True for the cat starting the interaction, False for the other cat
+    :return: The results of cat_fulfills_interaction so far, for every cat with the same status,
+        trait, backstory and skills. Use only with interactions from the master dict.
+    """
+    key = cat_constraint_key(cat, main)
+    results = _constraint_results.get(key)
+    if results is None:
+        results = _constraint_results[key] = {}
+    return results
 
 
 # ---------------------------------------------------------------------------- #
@@ -244,12 +321,46 @@ INTERACTION_MASTER_DICT = {x: {} for x in [*RelType]}
 
 relationship_lang = None
 
+_interaction_buckets: Dict[tuple, List[SingleInteraction]] = {}
+"""Interactions from the master dict, by rel_type, direction, intensity, place and season"""
+
+
+def get_interaction_bucket(
+    rel_type: str, direction: str, intensity: str
+) -> List[SingleInteraction]:
+    """
+    :param rel_type: The rel_type the interaction changes
+    :param direction: "increase" or "decrease"
+    :param intensity: "low", "medium" or "high"
+    :return: The interactions that have the intensity and can happen in the clan's biome, camp and
+        season, in the master dict's order. Their cat constraints still need checking. Don't change the list.
+    """
+    clan = game.clan
+    key = (rel_type, direction, intensity)
+    if clan:
+        key += (clan.biome, clan.override_biome, clan.camp_bg, clan.current_season)
+
+    bucket = _interaction_buckets.get(key)
+    if bucket is None:
+        bucket = [
+            interact
+            for interact in INTERACTION_MASTER_DICT[rel_type][direction]
+            if interact.intensity == intensity
+            and event_for_location(interact.biome)
+            and event_for_season(interact.season)
+        ]
+        _interaction_buckets[key] = bucket
+    return bucket
+
 
 def rebuild_relationship_dicts():
     global INTERACTION_MASTER_DICT, relationship_lang
     if relationship_lang == i18n.config.get("locale"):
         return
 
+    _interaction_buckets.clear()
+    _constraint_results.clear()
+
     for rel in [*RelType]:
         INTERACTION_MASTER_DICT[rel]["increase"] = create_interaction(
             load_lang_resource(
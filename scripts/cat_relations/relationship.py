@@ -1,6 +1,8 @@
 import random
+import weakref
+from collections.abc import MutableMapping
 from random import choice
-from typing import Optional
+from typing import Dict, List, Optional, Sequence
 
 import i18n
 
@@ -16,6 +18,136 @@ from scripts.game_structure import game
 from scripts.utility import get_personality_compatibility, process_text
 import scripts.cat_relations.interaction as interactions
 
+MATES, FAMILY, ROMANCE, LIKE, RESPECT, COMFORT, TRUST, LOG = range(8)
+"""Where each value is in a relationship's row"""
+
+DEFAULT_ROW = (False, False, 0, 0, 0, 0, 0, ())
+"""The values of a relationship that hasn't changed yet"""
+
+
+def default_row() -> list:
+    """
+    :return: A new row with the values of a relationship that hasn't changed yet
+    """
+    return [False, False, 0, 0, 0, 0, 0, []]
+
+
+def row_to_dict(cat_from_id: str, cat_to_id: str, row: Sequence) -> dict:
+    """
+    :param cat_from_id: ID of the cat the relationship belongs to
+    :param cat_to_id: ID of the other cat
+    :param row: The relationship's values
+    :return: The relationship as it's saved
+    """
+    return {
+        "cat_from_id": cat_from_id,
+        "cat_to_id": cat_to_id,
+        "mates": row[MATES],
+        "family": row[FAMILY],
+        "romance": row[ROMANCE],
+        "like": row[LIKE],
+        "respect": row[RESPECT],
+        "comfort": row[COMFORT],
+        "trust": row[TRUST],
+        "log": list(row[LOG]),
+    }
+
+
+TIER_NAMES = {
+    RelType.ROMANCE: (
+        {
+            "neutral": RelTier.UNINTERESTED,
+            "low_pos": RelTier.FANCIES,
+            "mid_pos": RelTier.ADORES,
+        },
+        RelTier.LOVES,
+    ),
+    RelType.LIKE: (
+        {
+            "extreme_neg": RelTier.LOATHES,
+            "mid_neg": RelTier.HATES,
+            "low_neg": RelTier.DISLIKES,
+            "neutral": RelTier.KNOWS_OF,
+            "low_pos": RelTier.LIKES,
+            "mid_pos": RelTier.ENJOYS,
+        },
+        RelTier.CHERISHES,
+    ),
+    RelType.RESPECT: (
+        {
+            "extreme_neg": RelTier.RESENTS,
+            "mid_neg": RelTier.ENVIES,
+            "low_neg": RelTier.BEGRUDGES,
+            "neutral": RelTier.ACKNOWLEDGES,
+            "low_pos": RelTier.PRAISES,
+            "mid_pos": RelTier.RESPECTS,
+        },
+        RelTier.ADMIRES,
+    ),
+    RelType.COMFORT: (
+        {
+            "extreme_neg": RelTier.RUNS_FROM,
+            "mid_neg": RelTier.FEARS,
+            "low_neg": RelTier.AVOIDS,
+            "neutral": RelTier.CONSIDERS,
+            "low_pos": RelTier.RELATES_TO,
+            "mid_pos": RelTier.UNDERSTANDS,
+        },
+        RelTier.KNOWS_DEEPLY,
+    ),
+    RelType.TRUST: (
+        {
+            "extreme_neg": RelTier.LOATHES,
+            "mid_neg": RelTier.DISTRUSTS,
+            "low_neg": RelTier.DOUBTS,
+            "neutral": RelTier.OBSERVES,
+            "low_pos": RelTier.LISTENS_TO,
+            "mid_pos": RelTier.TRUSTS,
+        },
+        RelTier.CONFIDES_IN,
+    ),
+}
+"""The tier of each value level, and the tier of any level above those, by rel_type"""
+
+_tier_tables: Dict[str, List[RelTier]] = {}
+"""The tier of every value from -100 to 100, by rel_type"""
+_tier_tables_intervals = None
+"""The value intervals the tier tables were made for"""
+
+
+def tier_group(value) -> Optional[str]:
+    """
+    :param value: A relationship value
+    :return: The value level it's in, from the relationship config
+    """
+    for group, interval in constants.CONFIG["relationship"]["value_intervals"].items():
+        if value <= interval:
+            return group
+
+    return None
+
+
+def tier_of(rel_type: RelType, value) -> RelTier:
+    """
+    :param rel_type: The kind of value
+    :param value: The value
+    :return: The tier the value is in
+    """
+    global _tier_tables_intervals
+    intervals = constants.CONFIG["relationship"]["value_intervals"]
+    if intervals is not _tier_tables_intervals:
+        _tier_tables.clear()
+        _tier_tables_intervals = intervals
+
+    names, top_tier = TIER_NAMES[rel_type]
+    if type(value) is int and -100 <= value <= 100:
+        table = _tier_tables.get(rel_type)
+        if table is None:
+            table = [names.get(tier_group(v), top_tier) for v in range(-100, 101)]
+            _tier_tables[rel_type] = table
+        return table[value + 100]
+    return names.get(tier_group(value), top_tier)
+
 
 # ---------------------------------------------------------------------------- #
 #                           START Relationship class                           #
@@ -23,7 +155,22 @@ import scripts.cat_relations.interaction as interactions
 
 
 class Relationship:
-    used_interaction_ids = []
+    __slots__ = (
+        "_store",
+        "_row",
+        "_dirty",
+        "chosen_interaction",
+        "cat_from",
+        "cat_to",
+        "opposite_relationship",
+        "interaction_str",
+        "triggered_event",
+        "_used_interaction_ids",
+        "__weakref__",
+    )
+
+    _shared_interaction_ids = []
+    """Used interaction IDs of every relationship that hasn't reset its own"""
     currently_loaded_lang = None
 
     def __init__(
@@ -39,6 +186,12 @@ class Relationship:
         comfort: int = 0,
         log: list = None,
     ) -> None:
+        self._store: Optional["RelationshipStore"] = None
+        """The store this relationship is kept in, if it's in one"""
+        self._row: Optional[list] = None
+        """The values of this relationship, see RelationshipStore. None while they're all the defaults."""
+        self.dirty = True
+        """True if this relationship changed since it was last saved or loaded"""
         self.chosen_interaction = None
         self.cat_from = cat_from
         self.cat_to = cat_to
@@ -49,10 +202,9 @@ class Relationship:
         )
         self.interaction_str = ""
         self.triggered_event = False
+        self._used_interaction_ids: Optional[List[str]] = None
         if log:
-            self.log = log
-        else:
-            self.log = []
+            self._new_row()[LOG] = log
 
         # romance operates on a 0-100 scale, 0 is no romantic interest and 100 is full romantic interest
         self.romance = romance
@@ -64,19 +216,86 @@ class Relationship:
         self.trust = trust
         self.comfort = comfort
 
+    @classmethod
+    def from_row(
+        cls, cat_from, cat_to, row: Optional[list], store: "RelationshipStore"
+    ):
+        """
+        Makes the Relationship for a row of a RelationshipStore
+        :param cat_from: The cat the relationship belongs to
+        :param cat_to: The other cat
+        :param row: The relationship's values, or None if it has the default values
+        :param store: The store the row is in
+        :return: The Relationship
+        """
+        relationship = cls.__new__(cls)
+        relationship._store = store
+        relationship._row = row
+        relationship._dirty = False
+        relationship.chosen_interaction = None
+        relationship.cat_from = cat_from
+        relationship.cat_to = cat_to
+        relationship.opposite_relationship = None
+        relationship.interaction_str = ""
+        relationship.triggered_event = False
+        relationship._used_interaction_ids = None
+        return relationship
+
     def to_dict(self):
-        return {
-            "cat_from_id": self.cat_from.ID,
-            "cat_to_id": self.cat_to.ID,
-            "mates": self.mates,
-            "family": self.family,
-            "romance": self.romance,
-            "like": self.like,
-            "respect": self.respect,
-            "comfort": self.comfort,
-            "trust": self.trust,
-            "log": self.log,
-        }
+        return row_to_dict(
+            self.cat_from.ID,
+            self.cat_to.ID,
+            DEFAULT_ROW if self._row is None else self._row,
+        )
+
+    @property
+    def used_interaction_ids(self) -> List[str]:
+        """
+        IDs of the interactions that were used lately. They're shared by every relationship,
+        until one resets them by setting a new list, which is then kept for that relationship only.
+        """
+        if self._used_interaction_ids is None:
+            return Relationship._shared_interaction_ids
+        return self._used_interaction_ids
+
+    @used_interaction_ids.setter
+    def used_interaction_ids(self, value: List[str]):
+        self._used_interaction_ids = value
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    @dirty.setter
+    def dirty(self, value: bool):
+        self._dirty = value
+        if value and self._store is not None:
+            self._store.dirty = True
+
+    @property
+    def log(self) -> Sequence[str]:
+        """The relationship log. Use add_log to add to it, it's an empty tuple until then."""
+        return DEFAULT_ROW[LOG] if self._row is None else self._row[LOG]
+
+    def _new_row(self) -> list:
+        """Gives this relationship a row of default values, and hands it to the store"""
+        self._row = default_row()
+        if self._store is not None:
+            self._store._values[self.cat_to.ID] = self._row
+        return self._row
+
+    def _set(self, index: int, value):
+        """Changes one of the values in the row"""
+        if self._row is not None:
+            self._row[index] = value
+        elif value != DEFAULT_ROW[index]:
+            self._new_row()[index] = value
+        self.dirty = True
+
+    def add_log(self, text: str):
+        """Adds a line to the relationship log"""
+        (self._new_row() if self._row is None else self._row)[LOG].append(text)
+        self.dirty = True
 
     def link_relationship(self):
         """Add the other relationship object to this easily access and change the other side."""
@@ -117,12 +336,11 @@ class Relationship:
         # choose any type of intensity
         intensity = random.choices(("low", "medium", "high"), weights=[4, 3, 2])[0]
 
-        all_interactions = interactions.INTERACTION_MASTER_DICT[rel_type][
-            "increase" if positive else "decrease"
-        ].copy()
-
+        direction = "increase" if positive else "decrease"
         possible_interactions = self.get_relevant_interactions(
-            all_interactions, intensity
+            interactions.INTERACTION_MASTER_DICT[rel_type][direction],
+            intensity,
+            bucket=(rel_type, direction),
         )
 
         # return if there are no possible interactions.
@@ -215,7 +433,7 @@ class Relationship:
             effect = i18n.t(f"relationships.negative_postscript_{intensity}")
 
         interaction_str = interaction_str + effect
-        self.log.append(
+        self.add_log(
             interaction_str
             + i18n.t(
                 "relationships.age_postscript",
@@ -448,6 +666,7 @@ class Relationship:
         self,
         possible_interactions: list,
         intensity: str = None,
+        bucket: tuple = None,
     ) -> list:
         """
         Filter interactions based on the status and other constraints.
@@ -458,6 +677,10 @@ class Relationship:
                 the interactions which need to be filtered
             intensity : str
                 the intensity of the interactions
+            bucket : tuple
+                (rel_type, direction) if possible_interactions is that list of the master dict.
+                Its interactions are then looked up by intensity, place and season, and the
+                results of the cats' own constraints are reused.
 
             Returns
             -------
@@ -471,18 +694,28 @@ class Relationship:
                 f"No possible relationship interactions found for cat_from: {self.cat_from.ID} and cat_to: {self.cat_to.ID}"
             )
 
+        main_results = None
+        random_results = None
+        if bucket is not None:
+            possible_interactions = interactions.get_interaction_bucket(
+                *bucket, intensity
+            )
+            main_results = interactions.cat_constraint_results(self.cat_from, True)
+            random_results = interactions.cat_constraint_results(self.cat_to, False)
+
         for interact in possible_interactions:
-            if not event_for_location(interact.biome):
-                continue
+            if bucket is None:
+                if not event_for_location(interact.biome):
+                    continue
 
-            if not event_for_season(interact.season):
-                continue
+                if not event_for_season(interact.season):
+                    continue
 
-            if intensity is not None and interact.intensity != intensity:
-                continue
+                if intensity is not None and interact.intensity != intensity:
+                    continue
 
             cats_fulfill_conditions = cats_fulfill_single_interaction_constraints(
-                self.cat_from, self.cat_to, interact
+                self.cat_from, self.cat_to, interact, main_results, random_results
             )
             if not cats_fulfill_conditions:
                 continue
@@ -557,10 +790,26 @@ class Relationship:
             and self.respect_tier.is_neutral
         )
 
+    @property
+    def mates(self) -> bool:
+        return self._row[MATES] if self._row else False
+
+    @mates.setter
+    def mates(self, value: bool):
+        self._set(MATES, value)
+
+    @property
+    def family(self) -> bool:
+        return self._row[FAMILY] if self._row else False
+
+    @family.setter
+    def family(self, value: bool):
+        self._set(FAMILY, value)
+
     @property
     def romance(self) -> int:
         """0-100 scale, 0 is no romantic interest and 100 is full romantic interest"""
-        return self._romance
+        return self._row[ROMANCE] if self._row else 0
 
     @romance.setter
     def romance(self, value):
@@ -568,24 +817,15 @@ class Relationship:
             value = 100
         elif value < 0:
             value = 0
-        self._romance = value
+        self._set(ROMANCE, value)
 
     @property
     def romance_tier(self) -> Optional[RelTier]:
-        group = self._get_tier_group(self.romance)
-
-        if group == "neutral":
-            return RelTier.UNINTERESTED
-        elif group == "low_pos":
-            return RelTier.FANCIES
-        elif group == "mid_pos":
-            return RelTier.ADORES
-        else:
-            return RelTier.LOVES
+        return tier_of(RelType.ROMANCE, self.romance)
 
     @property
     def like(self) -> int:
-        return self._like
+        return self._row[LIKE] if self._row else 0
 
     @like.setter
     def like(self, value):
@@ -593,30 +833,15 @@ class Relationship:
             value = 100
         elif value < -100:
             value = -100
-        self._like = value
+        self._set(LIKE, value)
 
     @property
     def like_tier(self) -> Optional[RelTier]:
-        group = self._get_tier_group(self.like)
-
-        if group == "extreme_neg":
-            return RelTier.LOATHES
-        elif group == "mid_neg":
-            return RelTier.HATES
-        elif group == "low_neg":
-            return RelTier.DISLIKES
-        elif group == "neutral":
-            return RelTier.KNOWS_OF
-        elif group == "low_pos":
-            return RelTier.LIKES
-        elif group == "mid_pos":
-            return RelTier.ENJOYS
-        else:
-            return RelTier.CHERISHES
+        return tier_of(RelType.LIKE, self.like)
 
     @property
     def respect(self) -> int:
-        return self._respect
+        return self._row[RESPECT] if self._row else 0
 
     @respect.setter
     def respect(self, value):
@@ -624,30 +849,15 @@ class Relationship:
             value = 100
         elif value < -100:
             value = -100
-        self._respect = value
+        self._set(RESPECT, value)
 
     @property
     def respect_tier(self) -> Optional[RelTier]:
-        group = self._get_tier_group(self.respect)
-
-        if group == "extreme_neg":
-            return RelTier.RESENTS
-        elif group == "mid_neg":
-            return RelTier.ENVIES
-        elif group == "low_neg":
-            return RelTier.BEGRUDGES
-        elif group == "neutral":
-            return RelTier.ACKNOWLEDGES
-        elif group == "low_pos":
-            return RelTier.PRAISES
-        elif group == "mid_pos":
-            return RelTier.RESPECTS
-        else:
-            return RelTier.ADMIRES
+        return tier_of(RelType.RESPECT, self.respect)
 
     @property
     def comfort(self) -> int:
-        return self._comfort
+        return self._row[COMFORT] if self._row else 0
 
     @comfort.setter
     def comfort(self, value):
@@ -655,30 +865,15 @@ class Relationship:
             value = 100
         elif value < -100:
             value = -100
-        self._comfort = value
+        self._set(COMFORT, value)
 
     @property
     def comfort_tier(self) -> Optional[RelTier]:
-        group = self._get_tier_group(self.comfort)
-
-        if group == "extreme_neg":
-            return RelTier.RUNS_FROM
-        elif group == "mid_neg":
-            return RelTier.FEARS
-        elif group == "low_neg":
-            return RelTier.AVOIDS
-        elif group == "neutral":
-            return RelTier.CONSIDERS
-        elif group == "low_pos":
-            return RelTier.RELATES_TO
-        elif group == "mid_pos":
-            return RelTier.UNDERSTANDS
-        else:
-            return RelTier.KNOWS_DEEPLY
+        return tier_of(RelType.COMFORT, self.comfort)
 
     @property
     def trust(self) -> int:
-        return self._trust
+        return self._row[TRUST] if self._row else 0
 
     @trust.setter
     def trust(self, value):
@@ -686,36 +881,99 @@ class Relationship:
             value = 100
         elif value < -100:
             value = -100
-        self._trust = value
+        self._set(TRUST, value)
 
     @property
     def trust_tier(self) -> Optional[RelTier]:
-        group = self._get_tier_group(self.trust)
-
-        if group == "extreme_neg":
-            return RelTier.LOATHES
-        elif group == "mid_neg":
-            return RelTier.DISTRUSTS
-        elif group == "low_neg":
-            return RelTier.DOUBTS
-        elif group == "neutral":
-            return RelTier.OBSERVES
-        elif group == "low_pos":
-            return RelTier.LISTENS_TO
-        elif group == "mid_pos":
-            return RelTier.TRUSTS
-        else:
-            return RelTier.CONFIDES_IN
+        return tier_of(RelType.TRUST, self.trust)
+
+
+class RelationshipStore(MutableMapping):
+    """
+    The relationships of one cat, by the ID of the other cat.
 
-    @staticmethod
-    def _get_tier_group(rel_type) -> Optional[str]:
+    The values are kept in rows, and a Relationship is only made when it's asked for. While
+    something holds on to it, the same Relationship is handed out again. Pairs that still have
+    all the default values don't have a row at all, so a clan where most cats barely know each
+    other takes up little memory.
+    """
+
+    def __init__(self, cat_from):
         """
-        Returns the tier group for the given value.
+        :param cat_from: The cat whose relationships these are
         """
-        for group, interval in constants.CONFIG["relationship"][
-            "value_intervals"
-        ].items():
-            if rel_type <= interval:
-                return group
+        self.cat_from = cat_from
+        self.dirty = False
+        """True if any relationship changed since the store was last saved or loaded"""
+        self._cats: Dict[str, object] = {}
+        """The other cat of every relationship, in the order they were added"""
+        self._values: Dict[str, list] = {}
+        """Rows of the relationships that don't have the default values"""
+        self._objects: "weakref.WeakValueDictionary[str, Relationship]" = (
+            weakref.WeakValueDictionary()
+        )
+        """Relationships that have been made and are still in use"""
 
-        return None
+    def __getitem__(self, cat_id: str) -> Relationship:
+        relationship = self._objects.get(cat_id)
+        if relationship is None:
+            relationship = Relationship.from_row(
+                self.cat_from, self._cats[cat_id], self._values.get(cat_id), self
+            )
+            self._objects[cat_id] = relationship
+        return relationship
+
+    def __setitem__(self, cat_id: str, relationship: Relationship):
+        self._detach(cat_id)
+        self._cats[cat_id] = relationship.cat_to
+        if relationship._row is None:
+            self._values.pop(cat_id, None)
+        else:
+            self._values[cat_id] = relationship._row
+        relationship._store = self
+        self._objects[cat_id] = relationship
+        self.dirty = True
+
+    def __delitem__(self, cat_id: str):
+        del self._cats[cat_id]
+        self._values.pop(cat_id, None)
+        self._detach(cat_id)
+        self.dirty = True
+
+    def __contains__(self, cat_id) -> bool:
+        return cat_id in self._cats
+
+    def __iter__(self):
+        return iter(self._cats)
+
+    def __len__(self) -> int:
+        return len(self._cats)
+
+    def clear(self):
+        for cat_id in list(self._objects.keys()):
+            self._detach(cat_id)
+        self._cats.clear()
+        self._values.clear()
+        self.dirty = True
+
+    def _detach(self, cat_id: str):
+        """Stops a Relationship that was replaced or removed from changing the store"""
+        relationship = self._objects.pop(cat_id, None)
+        if relationship is not None:
+            relationship._store = None
+
+    def mark_saved(self):
+        """Marks every relationship as matching what's in the relationship file"""
+        self.dirty = False
+        for relationship in list(self._objects.values()):
+            relationship._dirty = False
+
+    def to_list(self) -> list:
+        """
+        :return: The relationships as they're saved. Pairs with the default values are written
+            out in full too, so older versions of the game can still read the file.
+        """
+        return [
+            row_to_dict(self.cat_from.ID, cat_id, self._values.get(cat_id, DEFAULT_ROW))
+            for cat_id in self._cats
+        ]
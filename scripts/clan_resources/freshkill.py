@@ -4,6 +4,7 @@ from typing import List
 
 import i18n
 
+from scripts.cat.cat_index import cat_index
 from scripts.cat.cats import Cat
 from scripts.cat.enums import CatRank
 from scripts.cat.skills import SkillPath
@@ -85,8 +86,10 @@ class FreshkillPile:
             self.total_amount = game.prey_config["start_amount"]
         self.nutrition_info = {}
         self.living_cats = []
-        self.already_fed = []
+        self.already_fed = set()
         self.needed_prey = 0
+        self._food_needed = None
+        """What the Clan needs while a feeding round is going on, it doesn't change until it's over"""
 
     def add_freshkill(self, amount) -> None:
         """
@@ -193,9 +196,9 @@ class FreshkillPile:
                 event_list.append(i18n.t("hardcoded.expired_prey", count=amount))
         self.total_amount = sum(self.pile.values())
         value_diff = self.total_amount
-        self.already_fed = []
+        self.already_fed.clear()
         self.feed_cats(living_cats)
-        self.already_fed = []
+        self.already_fed.clear()
         value_diff -= sum(self.pile.values())
         event_list.append(i18n.t("hardcoded.consumed_prey", count=value_diff))
         self._update_needed_food(living_cats)
@@ -211,6 +214,14 @@ class FreshkillPile:
             :param additional_food_round: Whether this is a manual feeding from the freshkill pile, default False
         """
         self.update_nutrition(living_cats)
+        # who's fed doesn't change who needs food, so it's only worked out once
+        self._food_needed = self.amount_food_needed()
+        try:
+            self._feed_by_tactic(living_cats, additional_food_round)
+        finally:
+            self._food_needed = None
+
+    def _feed_by_tactic(self, living_cats: list, additional_food_round) -> None:
         # NOTE: this is for testing purposes
         if not game.clan:
             self.tactic_status(living_cats, additional_food_round)
@@ -237,12 +248,16 @@ class FreshkillPile:
 
         :return int|float needed_prey: The amount of prey the Clan needs
         """
-        living_cats = [
-            cat for cat in Cat.all_cats.values() if cat.status.alive_in_player_clan
-        ]
+        living_cats = cat_index.alive_in_clan(Cat.all_cats)
         self._update_needed_food(living_cats)
         return self.needed_prey
 
+    def _food_needed_this_round(self):
+        """The amount of freshkill the clan needs, worked out only once per feeding round."""
+        if self._food_needed is None:
+            return self.amount_food_needed()
+        return self._food_needed
+
     def clan_has_enough_food(self) -> bool:
         """Check if the amount of the prey is enough for one moon
 
@@ -263,14 +278,14 @@ class FreshkillPile:
         :param bool additional_food_round: Determines if not player-initiated, default False
         """
         queen_dict, kits = get_alive_clan_queens(living_cats)
-        fed_kits = []
+        fed_kits = set()
         relevant_queens = []
         # kits under 3 months are feed by the queen
         for queen_id, their_kits in queen_dict.items():
             queen = Cat.fetch_cat(queen_id)
             young_kits = [kit for kit in their_kits if kit.moons < 3]
             if len(young_kits) > 0:
-                fed_kits.extend(young_kits)
+                fed_kits.update(young_kits)
                 relevant_queens.append(queen)
 
         pregnant_cats = [
@@ -278,6 +293,7 @@ class FreshkillPile:
             for cat in living_cats
             if "pregnant" in cat.injuries and cat.ID not in queen_dict.keys()
         ]
+        queens_and_pregnant = set(relevant_queens + pregnant_cats)
 
         for feeding_status in FEEDING_ORDER:
             if feeding_status == CatRank.NEWBORN:
@@ -300,9 +316,7 @@ class FreshkillPile:
                 ]
                 # remove all cats, which are also queens / pregnant
                 relevant_group = [
-                    cat
-                    for cat in relevant_group
-                    if cat not in relevant_queens and cat not in pregnant_cats
+                    cat for cat in relevant_group if cat not in queens_and_pregnant
                 ]
 
             if len(relevant_group) == 0:
@@ -340,20 +354,20 @@ class FreshkillPile:
 
         # first get special groups, which need to be looked out for when feeding
         queen_dict, kits = get_alive_clan_queens(living_cats)
-        fed_kits = []
+        fed_kits = set()
         relevant_queens = []
         # kits under 3 months are feed by the queen
         for queen_id, their_kits in queen_dict.items():
             queen = Cat.fetch_cat(queen_id)
             young_kits = [kit for kit in their_kits if kit.moons < 3]
             if len(young_kits) > 0:
-                fed_kits.extend(young_kits)
+                fed_kits.update(young_kits)
                 relevant_queens.append(queen)
-        pregnant_cats = [
+        pregnant_cats = {
             cat
             for cat in living_cats
             if "pregnant" in cat.injuries and cat.ID not in queen_dict.keys()
-        ]
+        }
 
         # first split nutrition information into low nutrition and satisfied
         ration_prey = get_clan_setting("ration prey")
@@ -376,6 +390,7 @@ class FreshkillPile:
 
         # use living_cats to fetch cat for testing
         fetch_cat = living_cats[0]
+        food_needed = self._food_needed_this_round()
 
         # first feed the cats with the lowest nutrition
         for cat_id, v in sorted_nutrition.items():
@@ -401,12 +416,12 @@ class FreshkillPile:
                     feeding_amount = feeding_amount / 2
 
             if (
-                self.amount_food_needed() < self.total_amount * 1.2
+                food_needed < self.total_amount * 1.2
                 and self.nutrition_info[cat.ID].percentage < 100
             ):
                 feeding_amount += 1
             elif (
-                self.amount_food_needed() < self.total_amount
+                food_needed < self.total_amount
                 and self.nutrition_info[cat.ID].percentage < 100
             ):
                 feeding_amount += 0.5
@@ -489,13 +504,14 @@ class FreshkillPile:
         :param list group: Cats to feed
         :param bool additional_food_round: Determines if not player-initiated, default False
         :param bool queens_only: if this group is exclusively queens/pregnant cats, default False
-        :param list fed_kits: list of kits in the group
+        :param set fed_kits: kits in the group that are fed by their queen
         """
         if len(group) == 0:
             return
 
         # first split nutrition information into low nutrition and satisfied
         ration_prey = get_clan_setting("ration prey")
+        food_needed = self._food_needed_this_round()
 
         # first feed the cats with the lowest nutrition
         for cat in group:
@@ -522,22 +538,22 @@ class FreshkillPile:
                     feeding_amount = feeding_amount / 2
 
             if (
-                self.total_amount * 2 > self.amount_food_needed()
+                self.total_amount * 2 > food_needed
                 and self.nutrition_info[cat.ID].percentage < 100
             ):
                 feeding_amount += 2
             if (
-                self.total_amount * 1.8 > self.amount_food_needed()
+                self.total_amount * 1.8 > food_needed
                 and self.nutrition_info[cat.ID].percentage < 100
             ):
                 feeding_amount += 1.5
             elif (
-                self.total_amount * 1.2 > self.amount_food_needed()
+                self.total_amount * 1.2 > food_needed
                 and self.nutrition_info[cat.ID].percentage < 100
             ):
                 feeding_amount += 1
             elif (
-                self.total_amount > self.amount_food_needed()
+                self.total_amount > food_needed
                 and self.nutrition_info[cat.ID].percentage < 100
             ):
                 feeding_amount += 0.5
@@ -565,7 +581,7 @@ class FreshkillPile:
         order = ["expires_in_1", "expires_in_2", "expires_in_3", "expires_in_4"]
         for key in order:
             remaining_amount = self.take_from_pile(key, remaining_amount)
-        self.already_fed.append(cat)
+        self.already_fed.add(cat)
 
         if remaining_amount > 0 and amount_difference == 0:
             self.nutrition_info[cat.ID].current_score -= remaining_amount
@@ -654,21 +670,24 @@ class FreshkillPile:
                         current_score / previous_max * required_max
                     )
             else:
-                self.add_cat_to_nutrition(cat)
+                self.add_cat_to_nutrition(cat, queen_dict)
 
-    def add_cat_to_nutrition(self, cat: Cat) -> None:
+    def add_cat_to_nutrition(self, cat: Cat, queen_dict: dict = None) -> None:
         """
         Parameters
         ----------
         cat : Cat
             the cat, which should be added to the nutrition info
+        queen_dict : dict
+            the queens of the living cats, from get_alive_clan_queens. Found if not given.
         """
         nutrition = Nutrition()
         factor = 3
         if cat.status.rank in [CatRank.NEWBORN, CatRank.KITTEN, CatRank.ELDER]:
             factor = 2
 
-        queen_dict, kits = get_alive_clan_queens(self.living_cats)
+        if queen_dict is None:
+            queen_dict, kits = get_alive_clan_queens(self.living_cats)
         prey_status = cat.status.rank
         if cat.ID in queen_dict.keys() or "pregnant" in cat.injuries:
             prey_status = "queen/pregnant"
@@ -6,6 +6,7 @@ from scripts.debug_commands.command import Command
 from scripts.debug_commands.eval import EvalCommand, UnderstandRisksCommand
 from scripts.debug_commands.fps import FpsCommand
 from scripts.debug_commands.help import HelpCommand
+from scripts.debug_commands.profile import ProfileCommand
 from scripts.debug_commands.settings import ToggleCommand, SetCommand, GetCommand
 from scripts.debug_commands.cat_pregnancy import PregnanciesCommand
 from scripts.debug_commands.clan import ClanCommand
@@ -24,6 +25,7 @@ commandList: List[Command] = [
     CatsCommand(),
     ClanCommand(),
     PregnanciesCommand(),
+    ProfileCommand(),
 ]
 
 helpCommand = HelpCommand(commandList)
@@ -4,6 +4,11 @@ from scripts.cat.cats import Cat
 from scripts.cat.save_load import save_cats
 from scripts.debug_commands.command import Command
 from scripts.debug_commands.utils import add_output_line_to_log
+from scripts.game_structure.game.save_load.clan_files import (
+    is_packed,
+    pack_clan,
+    unpack_clan,
+)
 from scripts.game_structure.game.settings import game_settings_save
 from scripts.game_structure.game.switches import (
     switch_set_value,
@@ -39,12 +44,51 @@ class ReloadClanCommand(Command):
             )
 
 
+def _save_current_clan():
+    save_cats(switch_get_value(Switch.clan_name), Cat, game)
+    game.clan.save_clan()
+    game.clan.save_pregnancy(game.clan)
+    game.save_events()
+
+
+class PackClanCommand(Command):
+    name = "pack"
+    description = (
+        "Saves the current clan, then stores its cat files in a single packed file"
+    )
+
+    def callback(self, args: List[str]):
+        clan_name = switch_get_value(Switch.clan_name)
+        if is_packed(clan_name):
+            add_output_line_to_log(f"{clan_name} is already packed")
+            return
+        _save_current_clan()
+        count = pack_clan(clan_name)
+        add_output_line_to_log(f"Packed {count} files of {clan_name}")
+
+
+class UnpackClanCommand(Command):
+    name = "unpack"
+    description = (
+        "Saves the current clan, then turns its packed file back into separate files"
+    )
+
+    def callback(self, args: List[str]):
+        clan_name = switch_get_value(Switch.clan_name)
+        if not is_packed(clan_name):
+            add_output_line_to_log(f"{clan_name} isn't packed")
+            return
+        _save_current_clan()
+        count = unpack_clan(clan_name)
+        add_output_line_to_log(f"Unpacked {count} files of {clan_name}")
+
+
 class ClanCommand(Command):
     name = "clan"
     description = "Manage current loaded clan"
     aliases = ["clan", "cl"]
 
-    sub_commands = [ReloadClanCommand()]
+    sub_commands = [ReloadClanCommand(), PackClanCommand(), UnpackClanCommand()]
 
     def callback(self, args: List[str]):
         add_output_line_to_log("Please specify a subcommand")
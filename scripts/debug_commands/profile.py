@@ -0,0 +1,65 @@
+from typing import List
+
+from scripts.debug_commands.command import Command
+from scripts.debug_commands.utils import add_output_line_to_log
+from scripts.housekeeping.moon_profiler import moon_profiler, MoonProfiler
+
+
+class ProfileOnCommand(Command):
+    name = "on"
+    description = "Start timing each phase of the moon skip"
+    aliases = ["start"]
+
+    def callback(self, args: List[str]):
+        moon_profiler.enable()
+        add_output_line_to_log(
+            f"Moon profiling on, reports go to {moon_profiler.output_path}"
+        )
+
+
+class ProfileOffCommand(Command):
+    name = "off"
+    description = "Stop timing the moon skip"
+    aliases = ["stop"]
+
+    def callback(self, args: List[str]):
+        moon_profiler.disable()
+        add_output_line_to_log("Moon profiling off")
+
+
+class ProfileLastCommand(Command):
+    name = "last"
+    description = "Show the slowest phases of the last profiled moon"
+    usage = "[count]"
+    aliases = ["l"]
+
+    def callback(self, args: List[str]):
+        report = moon_profiler.last_report
+        if report is None:
+            add_output_line_to_log("No moon has been profiled yet")
+            return
+
+        limit = int(args[0]) if args and args[0].isnumeric() else 10
+        add_output_line_to_log(
+            f"Moon {report.get('moon')}: {report['total']:.3f}s "
+            f"for {report.get('cats')} cats"
+        )
+        if report.get("faded_cat_lookups"):
+            add_output_line_to_log(
+                f"Faded cats already loaded for {report['faded_cat_hit_rate']:.0%} "
+                f"of {report['faded_cat_lookups']} lookups this moon"
+            )
+        for line in MoonProfiler.format_phases(report["phases"], limit):
+            add_output_line_to_log(line)
+
+
+class ProfileCommand(Command):
+    name = "profile"
+    description = "Time the phases of the moon skip"
+    aliases = ["prof"]
+
+    sub_commands = [ProfileOnCommand(), ProfileOffCommand(), ProfileLastCommand()]
+
+    def callback(self, args: List[str]):
+        state = "on" if moon_profiler.enabled else "off"
+        add_output_line_to_log(f"Moon profiling is {state}")
@@ -14,6 +14,7 @@ import traceback
 import i18n
 
 from scripts.cat import save_load
+from scripts.cat.cat_index import cat_index
 from scripts.cat.cats import Cat, cat_class, BACKSTORIES
 from scripts.cat.enums import CatAge, CatRank, CatGroup, CatStanding, CatSocial
 from scripts.cat.names import Name
@@ -25,7 +26,7 @@ from scripts.conditions import (
     get_amount_cat_for_one_medic,
 )
 from scripts.event_class import Single_Event
-from scripts.events_module.generate_events import GenerateEvents, generate_events
+from scripts.events_module.generate_events import generate_events
 from scripts.events_module.outsider_events import OutsiderEvents
 from scripts.events_module.patrol.patrol import Patrol
 from scripts.events_module.relationship.pregnancy_events import Pregnancy_Events
@@ -41,6 +42,7 @@ from scripts.game_structure.game.switches import (
 from scripts.game_structure import game
 from scripts.game_structure.localization import load_lang_resource
 from scripts.game_structure.windows import SaveError
+from scripts.housekeeping.moon_profiler import moon_profiler
 from scripts.utility import (
     change_clan_relations,
     change_clan_reputation,
@@ -78,6 +80,24 @@ class Events:
         """
         Handles the moon skipping of the whole Clan.
         """
+        faded_cat_cache = save_load.faded_cat_cache
+        # the cache counts lookups since the clan was loaded, only this moon's are reported
+        hits, misses = faded_cat_cache.hits, faded_cat_cache.misses
+        with moon_profiler.moon() as report:
+            self._one_moon()
+            report["moon"] = game.clan.age
+            report["cats"] = len(Cat.all_cats)
+            hits = faded_cat_cache.hits - hits
+            misses = faded_cat_cache.misses - misses
+            report["faded_cat_lookups"] = hits + misses
+            report["faded_cat_hit_rate"] = (
+                hits / (hits + misses) if hits + misses else 0.0
+            )
+
+    def _one_moon(self):
+        """
+        The moon skip itself. Its phases are timed by the moon profiler, if that's enabled.
+        """
         game.cur_events_list = []
         game.herb_events_list = []
         game.freshkill_events_list = []
@@ -113,133 +133,47 @@ class Events:
                     Cat.all_cats.values(),
                 )
             )
-            game.clan.freshkill_pile.time_skip(relevant_cats, game.freshkill_event_list)
-            # get the moonskip freshkill
-            self.get_moon_freshkill()
+            with moon_profiler.phase("freshkill"):
+                game.clan.freshkill_pile.time_skip(
+                    relevant_cats, game.freshkill_event_list
+                )
+                # get the moonskip freshkill
+                self.get_moon_freshkill()
 
         # Adding in any potential lead den events that have been saved
         if get_clan_setting("lead_den_interaction"):
-            self.handle_lead_den_event()
+            with moon_profiler.phase("lead_den"):
+                self.handle_lead_den_event()
 
         # checking if a lost cat returns on their own
         rejoin_upperbound = constants.CONFIG["lost_cat"]["rejoin_chance"]
         if random.randint(1, rejoin_upperbound) == 1:
-            self.handle_lost_cats_return()
+            with moon_profiler.phase("lost_cats_return"):
+                self.handle_lost_cats_return()
 
-        self.handle_future_events()
+        with moon_profiler.phase("future_events"):
+            self.handle_future_events()
 
         # Calling of "one_moon" functions.
         other_clan_cats = [c for c in Cat.all_cats_list if c.status.is_other_clancat]
         for cat in Cat.all_cats_list.copy():
             if cat.status.alive_in_player_clan or cat.status.group.is_afterlife():
-                self.one_moon_cat(cat)
+                with moon_profiler.phase("one_moon_cat"):
+                    self.one_moon_cat(cat)
             elif not cat.status.group or cat.status.is_other_clancat:
-                self.one_moon_outside_cat(cat, other_clan_cats)
+                with moon_profiler.phase("one_moon_outside_cat"):
+                    self.one_moon_outside_cat(cat, other_clan_cats)
 
         # keeping this commented out till disasters are more polished
         # self.disaster_events.handle_disasters()
 
-        # Handle grief events.
-        if Cat.grief_strings:
-            # Grab all the dead or outside cats, who should not have grief text
-            for ID in Cat.grief_strings.copy():
-                check_cat = Cat.all_cats.get(ID)
-                if isinstance(check_cat, Cat):
-                    if check_cat.dead or not check_cat.status.alive_in_player_clan:
-                        Cat.grief_strings.pop(ID)
-
-            # Generate events
-
-            for cat_id, values in Cat.grief_strings.items():
-                for _val in values:
-                    if _val[2] == "minor":
-                        # Apply the grief message as a thought to the cat
-                        text = event_text_adjust(
-                            Cat,
-                            _val[0],
-                            main_cat=Cat.fetch_cat(cat_id),
-                            random_cat=Cat.fetch_cat(_val[1][0]),
-                        )
-
-                        Cat.fetch_cat(cat_id).thought = text
-                    else:
-                        game.cur_events_list.append(
-                            Single_Event(_val[0], ["birth_death", "relation"], _val[1])
-                        )
-
-            Cat.grief_strings.clear()
+        with moon_profiler.phase("grief"):
+            self.handle_grief()
 
         if Cat.dead_cats:
-            ghost_names = []
-            shaken_cats = []
-            extra_event = None
-            for ghost in Cat.dead_cats:
-                ghost_names.append(str(ghost.name))
-            insert = adjust_list_text(ghost_names)
-
-            if len(Cat.dead_cats) > 1:
-                event = i18n.t(
-                    "hardcoded.event_deaths", count=len(Cat.dead_cats), insert=insert
-                )
-
-                if len(ghost_names) > 2:
-                    alive_cats = [
-                        kitty
-                        for kitty in Cat.all_cats.values()
-                        if kitty.status.alive_in_player_clan
-                    ]
-
-                    # finds a percentage of the living Clan to become shaken
-
-                    if len(alive_cats) == 0:
-                        return
-                    else:
-                        shaken_cats = random.sample(
-                            alive_cats,
-                            k=max(
-                                int((len(alive_cats) * random.randint(4, 6)) / 100),
-                                1,
-                            ),
-                        )
-
-                    shaken_cat_names = []
-                    for cat in shaken_cats:
-                        shaken_cat_names.append(str(cat.name))
-                        cat.get_injured(
-                            "shock",
-                            event_triggered=False,
-                            lethal=False,
-                            severity="minor",
-                        )
-
-                    insert = adjust_list_text(shaken_cat_names)
-
-                    extra_event = i18n.t(
-                        "hardcoded.event_shaken_grief",
-                        count=len(shaken_cat_names),
-                        insert=insert,
-                    )
-
-            else:
-                event = i18n.t("hardcoded.event_deaths", count=1)
-
-            game.cur_events_list.append(
-                Single_Event(
-                    event,
-                    ["birth_death"],
-                    [i.ID for i in Cat.dead_cats],
-                    cat_dict=(
-                        {"m_c": Cat.dead_cats[0]} if len(Cat.dead_cats) == 1 else None
-                    ),
-                )
-            )
-            if extra_event:
-                game.cur_events_list.append(
-                    Single_Event(
-                        extra_event, ["birth_death"], [i.ID for i in shaken_cats]
-                    )
-                )
-            Cat.dead_cats.clear()
+            with moon_profiler.phase("dead_cats"):
+                if not self.handle_dead_cats():
+                    return
 
         if (
             game.clan.game_mode in ("expanded", "cruel season")
@@ -254,18 +188,20 @@ class Events:
                 game.cur_events_list.insert(0, Single_Event(event_string))
                 game.freshkill_event_list.append(event_string)
 
-        self.handle_focus()
+        with moon_profiler.phase("focus"):
+            self.handle_focus()
 
         # handle the herb supply for the moon
-        game.clan.herb_supply.handle_moon(
-            clan_size=get_living_clan_cat_count(Cat),
-            clan_cats=Cat.all_cats_list,
-            med_cats=find_alive_cats_with_rank(
-                Cat,
-                ranks=[CatRank.MEDICINE_CAT, CatRank.MEDICINE_APPRENTICE],
-                working=True,
-            ),
-        )
+        with moon_profiler.phase("herb_supply"):
+            game.clan.herb_supply.handle_moon(
+                clan_size=get_living_clan_cat_count(Cat),
+                clan_cats=Cat.all_cats_list,
+                med_cats=find_alive_cats_with_rank(
+                    Cat,
+                    ranks=[CatRank.MEDICINE_CAT, CatRank.MEDICINE_APPRENTICE],
+                    working=True,
+                ),
+            )
 
         if game.clan.game_mode in ("expanded", "cruel season"):
             amount_per_med = get_amount_cat_for_one_medic(game.clan)
@@ -290,25 +226,136 @@ class Events:
         game.just_died.clear()
 
         # Promote leader and deputy, if needed.
-        self.check_and_promote_leader()
-        self.check_and_promote_deputy()
+        with moon_profiler.phase("promote_leader"):
+            self.check_and_promote_leader()
+        with moon_profiler.phase("promote_deputy"):
+            self.check_and_promote_deputy()
 
         # Resort
         if switch_get_value(Switch.sort_type) != "id":
-            Cat.sort_cats()
-
-        # Clear all the loaded event dicts.
-        GenerateEvents.clear_loaded_events()
+            with moon_profiler.phase("sort_cats"):
+                Cat.sort_cats()
 
         # autosave
         if get_clan_setting("autosave") and game.clan.age % 5 == 0:
-            try:
-                save_cats(switch_get_value(Switch.clan_name), Cat, game)
-                game.clan.save_clan()
-                game.clan.save_pregnancy(game.clan)
-                game.save_events()
-            except:
-                SaveError(traceback.format_exc())
+            with moon_profiler.phase("autosave"):
+                try:
+                    save_cats(switch_get_value(Switch.clan_name), Cat, game)
+                    game.clan.save_clan()
+                    game.clan.save_pregnancy(game.clan)
+                    game.save_events()
+                except:
+                    SaveError(traceback.format_exc())
+
+    @staticmethod
+    def handle_grief():
+        """
+        Turns the grief strings collected during the moon into thoughts and events.
+        """
+        if Cat.grief_strings:
+            # Grab all the dead or outside cats, who should not have grief text
+            for ID in Cat.grief_strings.copy():
+                check_cat = Cat.all_cats.get(ID)
+                if isinstance(check_cat, Cat):
+                    if check_cat.dead or not check_cat.status.alive_in_player_clan:
+                        Cat.grief_strings.pop(ID)
+
+            # Generate events
+
+            for cat_id, values in Cat.grief_strings.items():
+                for _val in values:
+                    if _val[2] == "minor":
+                        # Apply the grief message as a thought to the cat
+                        text = event_text_adjust(
+                            Cat,
+                            _val[0],
+                            main_cat=Cat.fetch_cat(cat_id),
+                            random_cat=Cat.fetch_cat(_val[1][0]),
+                        )
+
+                        Cat.fetch_cat(cat_id).thought = text
+                    else:
+                        game.cur_events_list.append(
+                            Single_Event(_val[0], ["birth_death", "relation"], _val[1])
+                        )
+
+            Cat.grief_strings.clear()
+
+    @staticmethod
+    def handle_dead_cats() -> bool:
+        """
+        Creates the death events for the cats that died this moon, and shakes up the Clan if many died.
+        :return: False if there are no living cats left in the Clan, which ends the moon early
+        """
+        ghost_names = []
+        shaken_cats = []
+        extra_event = None
+        for ghost in Cat.dead_cats:
+            ghost_names.append(str(ghost.name))
+        insert = adjust_list_text(ghost_names)
+
+        if len(Cat.dead_cats) > 1:
+            event = i18n.t(
+                "hardcoded.event_deaths", count=len(Cat.dead_cats), insert=insert
+            )
+
+            if len(ghost_names) > 2:
+                alive_cats = [
+                    kitty
+                    for kitty in Cat.all_cats.values()
+                    if kitty.status.alive_in_player_clan
+                ]
+
+                # finds a percentage of the living Clan to become shaken
+
+                if len(alive_cats) == 0:
+                    return False
+                else:
+                    shaken_cats = random.sample(
+                        alive_cats,
+                        k=max(
+                            int((len(alive_cats) * random.randint(4, 6)) / 100),
+                            1,
+                        ),
+                    )
+
+                shaken_cat_names = []
+                for cat in shaken_cats:
+                    shaken_cat_names.append(str(cat.name))
+                    cat.get_injured(
+                        "shock",
+                        event_triggered=False,
+                        lethal=False,
+                        severity="minor",
+                    )
+
+                insert = adjust_list_text(shaken_cat_names)
+
+                extra_event = i18n.t(
+                    "hardcoded.event_shaken_grief",
+                    count=len(shaken_cat_names),
+                    insert=insert,
+                )
+
+        else:
+            event = i18n.t("hardcoded.event_deaths", count=1)
+
+        game.cur_events_list.append(
+            Single_Event(
+                event,
+                ["birth_death"],
+                [i.ID for i in Cat.dead_cats],
+                cat_dict=(
+                    {"m_c": Cat.dead_cats[0]} if len(Cat.dead_cats) == 1 else None
+                ),
+            )
+        )
+        if extra_event:
+            game.cur_events_list.append(
+                Single_Event(extra_event, ["birth_death"], [i.ID for i in shaken_cats])
+            )
+        Cat.dead_cats.clear()
+        return True
 
     def handle_future_events(self):
         """
@@ -913,15 +960,18 @@ class Events:
         cat.status.increase_current_moons_as()
 
         if cat.dead:
-            cat.thoughts()
+            with moon_profiler.phase("thoughts"):
+                cat.thoughts()
             if cat.ID in game.just_died:
                 cat.moons += 1
-            self.handle_fading(cat)  # Deal with fading.
+            with moon_profiler.phase("fading"):
+                self.handle_fading(cat)  # Deal with fading.
             return
 
         # all actions, which do not trigger an event display and
         # are connected to cats are located in there
-        cat.one_moon()
+        with moon_profiler.phase("cat_one_moon"):
+            cat.one_moon()
 
         if constants.CONFIG["event_generation"]["debug_type_override"]:
             debug_type_override = constants.CONFIG["event_generation"][
@@ -935,7 +985,8 @@ class Events:
                 self.invite_new_cats(cat)
 
         # Handle Mediator Events
-        self.mediator_events(cat)
+        with moon_profiler.phase("mediator"):
+            self.mediator_events(cat)
 
         # handle nutrition amount
         # (CARE: the cats have to be fed before this happens - should be handled in "one_moon" function)
@@ -943,88 +994,101 @@ class Events:
             game.clan.game_mode in ("expanded", "cruel season")
             and game.clan.freshkill_pile
         ):
-            Condition_Events.handle_nutrient(
-                cat, game.clan.freshkill_pile.nutrition_info
-            )
+            with moon_profiler.phase("nutrition"):
+                Condition_Events.handle_nutrient(
+                    cat, game.clan.freshkill_pile.nutrition_info
+                )
 
             if cat.dead:
                 return
 
         # prevent injured or sick cats from unrealistic Clan events
         if cat.is_ill() or cat.is_injured():
-            if cat.is_ill() and cat.is_injured():
-                if random.getrandbits(1):
-                    triggered_death = Condition_Events.handle_injuries(cat)
-                    if not triggered_death:
-                        Condition_Events.handle_illnesses(cat)
+            with moon_profiler.phase("conditions"):
+                if cat.is_ill() and cat.is_injured():
+                    if random.getrandbits(1):
+                        triggered_death = Condition_Events.handle_injuries(cat)
+                        if not triggered_death:
+                            Condition_Events.handle_illnesses(cat)
+                    else:
+                        triggered_death = Condition_Events.handle_illnesses(cat)
+                        if not triggered_death:
+                            Condition_Events.handle_injuries(cat)
+                elif cat.is_ill():
+                    Condition_Events.handle_illnesses(cat)
                 else:
-                    triggered_death = Condition_Events.handle_illnesses(cat)
-                    if not triggered_death:
-                        Condition_Events.handle_injuries(cat)
-            elif cat.is_ill():
-                Condition_Events.handle_illnesses(cat)
-            else:
-                Condition_Events.handle_injuries(cat)
-            switch_set_value(Switch.skip_conditions, [])
+                    Condition_Events.handle_injuries(cat)
+                switch_set_value(Switch.skip_conditions, [])
             if cat.dead:
                 return
-            self.handle_outbreaks(cat)
+            with moon_profiler.phase("outbreaks"):
+                self.handle_outbreaks(cat)
 
         # newborns don't do much
         if cat.status.rank == CatRank.NEWBORN:
-            cat.relationship_interaction()
-            cat.thoughts()
+            with moon_profiler.phase("relationship_interaction"):
+                cat.relationship_interaction()
+            with moon_profiler.phase("thoughts"):
+                cat.thoughts()
             return
 
-        self.handle_apprentice_EX(cat)  # This must be before perform_ceremonies!
-        # this HAS TO be before the cat.is_disabled() so that disabled kits can choose a med cat or mediator position
-        self.perform_ceremonies(cat)
-        cat.skills.progress_skill(cat)  # This must be done after ceremonies.
+        with moon_profiler.phase("ceremonies"):
+            self.handle_apprentice_EX(cat)  # This must be before perform_ceremonies!
+            # this HAS TO be before the cat.is_disabled() so that disabled kits can choose a med cat or mediator position
+            self.perform_ceremonies(cat)
+            cat.skills.progress_skill(cat)  # This must be done after ceremonies.
 
         # check for death/reveal/risks/retire caused by permanent conditions
         if cat.is_disabled():
-            Condition_Events.handle_already_disabled(cat)
+            with moon_profiler.phase("disabled"):
+                Condition_Events.handle_already_disabled(cat)
             if cat.dead:
                 return
 
         self.coming_out(cat)
-        Pregnancy_Events.handle_having_kits(cat, clan=game.clan)
+        with moon_profiler.phase("pregnancy"):
+            Pregnancy_Events.handle_having_kits(cat, clan=game.clan)
         # Stop the timeskip if the cat died in childbirth
         if cat.dead:
             return
 
-        cat.relationship_interaction()
-        cat.thoughts()
+        with moon_profiler.phase("relationship_interaction"):
+            cat.relationship_interaction()
+        with moon_profiler.phase("thoughts"):
+            cat.thoughts()
 
         # relationships have to be handled separately, because of the ceremony name change
         if cat.status.alive_in_player_clan:
-            Relation_Events.handle_relationships(cat)
+            with moon_profiler.phase("relation_events"):
+                Relation_Events.handle_relationships(cat)
 
         # now we make sure ill and injured cats don't get interactions they shouldn't
         if cat.is_ill() or cat.is_injured():
             return
 
-        self.invite_new_cats(cat)
-        self.other_interactions(cat)
-        self.gain_accessories(cat)
+        with moon_profiler.phase("new_cats"):
+            self.invite_new_cats(cat)
+        with moon_profiler.phase("misc"):
+            self.other_interactions(cat)
+        with moon_profiler.phase("accessories"):
+            self.gain_accessories(cat)
 
         # switches between the two death handles
-        if random.getrandbits(1):
-            triggered_death = self.handle_injuries_or_general_death(cat)
-            if not triggered_death:
-                self.handle_illnesses_or_illness_deaths(cat)
-            else:
-                switch_set_value(Switch.skip_conditions, [])
-                return
-        else:
-            triggered_death = self.handle_illnesses_or_illness_deaths(cat)
-            if not triggered_death:
-                self.handle_injuries_or_general_death(cat)
+        with moon_profiler.phase("deaths"):
+            if random.getrandbits(1):
+                triggered_death = self.handle_injuries_or_general_death(cat)
+                if not triggered_death:
+                    self.handle_illnesses_or_illness_deaths(cat)
             else:
-                switch_set_value(Switch.skip_conditions, [])
-                return
+                triggered_death = self.handle_illnesses_or_illness_deaths(cat)
+                if not triggered_death:
+                    self.handle_injuries_or_general_death(cat)
+        if triggered_death:
+            switch_set_value(Switch.skip_conditions, [])
+            return
 
-        self.handle_murder(cat)
+        with moon_profiler.phase("murder"):
+            self.handle_murder(cat)
 
         switch_set_value(Switch.skip_conditions, [])
 
@@ -1804,11 +1868,8 @@ class Events:
 
         alive_cats = list(
             filter(
-                lambda kitty: (
-                    kitty.status.rank != CatRank.LEADER
-                    and kitty.status.alive_in_player_clan
-                ),
-                Cat.all_cats.values(),
+                lambda kitty: kitty.status.rank != CatRank.LEADER,
+                cat_index.alive_in_clan(Cat.all_cats),
             )
         )
 
@@ -2121,23 +2182,12 @@ class Events:
             return
 
         # check how many kitties are already ill
-        already_sick = list(
-            filter(
-                lambda kitty: (kitty.status.alive_in_player_clan and kitty.is_ill()),
-                Cat.all_cats.values(),
-            )
-        )
+        clan_cats = cat_index.alive_in_clan(Cat.all_cats)
+        already_sick = list(filter(lambda kitty: kitty.is_ill(), clan_cats))
         already_sick_count = len(already_sick)
 
         # round up the living kitties
-        alive_cats = list(
-            filter(
-                lambda kitty: (
-                    kitty.status.alive_in_player_clan and not kitty.is_ill()
-                ),
-                Cat.all_cats.values(),
-            )
-        )
+        alive_cats = list(filter(lambda kitty: not kitty.is_ill(), clan_cats))
         alive_count = len(alive_cats)
 
         # if large amount of the population is already sick, stop spreading
@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 # -*- coding: ascii -*-
 import random
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 import i18n
 import ujson
 
+from scripts.cat.cat_index import cat_index
 from scripts.cat_relations.enums import RelType
 from scripts.events_module.event_filters import (
     event_for_location,
@@ -37,8 +39,53 @@ def get_resource_directory(fallback=False):
 # ---------------------------------------------------------------------------- #
 
 
+class ShortEventBuckets:
+    """
+    The short events of one file and frequency, sorted into buckets by their sub types.
+    Which events of a bucket fit the Clan's biome, camp and season is worked out once for each place.
+    """
+
+    def __init__(self, events: List[ShortEvent]):
+        self.events = events
+        self._by_sub_type: Dict[FrozenSet[str], List[ShortEvent]] = {}
+        for event in events:
+            self._by_sub_type.setdefault(frozenset(event.sub_type), []).append(event)
+        self._placed: Dict[tuple, List[ShortEvent]] = {}
+
+    def candidates(self, sub_types: Optional[List[str]]) -> List[ShortEvent]:
+        """
+        :param sub_types: The sub types an event must have, exactly. None takes every sub type.
+        :return: The events with those sub types that can happen in the Clan's biome, camp and season
+        """
+        sub_type_key = None if sub_types is None else frozenset(sub_types)
+        key = (
+            sub_type_key,
+            game.clan.biome,
+            game.clan.override_biome,
+            game.clan.camp_bg,
+            game.clan.current_season,
+        )
+        placed = self._placed.get(key)
+        if placed is None:
+            bucket = (
+                self.events
+                if sub_type_key is None
+                else self._by_sub_type.get(sub_type_key, [])
+            )
+            placed = [
+                event
+                for event in bucket
+                if event_for_location(event.location) and event_for_season(event.season)
+            ]
+            self._placed[key] = placed
+        return placed
+
+
 class GenerateEvents:
     loaded_events = {}
+    event_buckets: Dict[str, ShortEventBuckets] = {}
+    loaded_for: Optional[Tuple[str, str]] = None
+    """The language and biome the loaded events were loaded for"""
 
     with open(
         f"resources/dicts/conditions/injuries.json", "r", encoding="utf-8"
@@ -100,6 +147,45 @@ class GenerateEvents:
     @staticmethod
     def clear_loaded_events():
         GenerateEvents.loaded_events = {}
+        GenerateEvents.event_buckets = {}
+        GenerateEvents.loaded_for = None
+
+    @staticmethod
+    def check_loaded_events(biome: str):
+        """
+        Throws away the loaded events if the language or the Clan's biome changed since they were loaded
+        :param biome: The biome events are being loaded for
+        """
+        loaded_for = (str(i18n.config.get("locale")), biome)
+        if GenerateEvents.loaded_for != loaded_for:
+            GenerateEvents.clear_loaded_events()
+            GenerateEvents.loaded_for = loaded_for
+
+    @staticmethod
+    def short_event_buckets(event_triggered, biome, frequency) -> ShortEventBuckets:
+        """
+        :return: The short events of a file and frequency, sorted into buckets
+        """
+        load_name = f"{event_triggered}/{biome}.json_{frequency}"
+        buckets = GenerateEvents.event_buckets.get(load_name)
+        if buckets is None:
+            buckets = ShortEventBuckets(
+                GenerateEvents.generate_short_events(event_triggered, biome, frequency)
+                or []
+            )
+            GenerateEvents.event_buckets[load_name] = buckets
+        return buckets
+
+    @staticmethod
+    def _short_event_format_notices(event: ShortEvent) -> List[str]:
+        notices = []
+        if event.history:
+            if not isinstance(event.history, list) or "cats" not in event.history[0]:
+                notices.append(f"{event.event_id} history formatted incorrectly")
+        if event.injury:
+            if not isinstance(event.injury, list) or "cats" not in event.injury[0]:
+                notices.append(f"{event.event_id} injury formatted incorrectly")
+        return notices
 
     @staticmethod
     def generate_short_events(event_triggered, biome, frequency):
@@ -164,6 +250,9 @@ class GenerateEvents:
                     )
                     event_list.append(event)
 
+                    for notice in GenerateEvents._short_event_format_notices(event):
+                        print(notice)
+
                 # Add to loaded events.
                 GenerateEvents.loaded_events[load_name] = event_list
                 return event_list
@@ -223,7 +312,15 @@ class GenerateEvents:
     def possible_short_events(
         frequency,
         event_type=None,
+        sub_types=None,
     ):
+        """
+        :param frequency: How often the events happen
+        :param event_type: Which events to load
+        :param sub_types: If given, only events with exactly these sub types are returned
+        :return: The events of that frequency that can happen in the Clan's biome, camp and season,
+        or all of them if requirements are overridden for debugging
+        """
         event_list = []
 
         # skip the rest of the loading if there is an unrecognised biome
@@ -239,16 +336,16 @@ class GenerateEvents:
             )
 
         biome = temp_biome.lower()
+        GenerateEvents.check_loaded_events(biome)
 
-        # biome specific events
-        event_list.extend(
-            GenerateEvents.generate_short_events(event_type, biome, frequency)
-        )
-
-        # any biome events
-        event_list.extend(
-            GenerateEvents.generate_short_events(event_type, "general", frequency)
-        )
+        for events_biome in (biome, "general"):
+            buckets = GenerateEvents.short_event_buckets(
+                event_type, events_biome, frequency
+            )
+            if constants.CONFIG["event_generation"]["debug_override_requirements"]:
+                event_list.extend(buckets.events)
+            else:
+                event_list.extend(buckets.candidates(sub_types))
 
         return event_list
 
@@ -267,31 +364,8 @@ class GenerateEvents:
         ignore_subtyping=False,
     ):
         final_events = []
-        incorrect_format = []
 
         for event in possible_events:
-            if event.history:
-                if (
-                    not isinstance(event.history, list)
-                    or "cats" not in event.history[0]
-                ):
-                    if (
-                        f"{event.event_id} history formatted incorrectly"
-                        not in incorrect_format
-                    ):
-                        incorrect_format.append(
-                            f"{event.event_id} history formatted incorrectly"
-                        )
-            if event.injury:
-                if not isinstance(event.injury, list) or "cats" not in event.injury[0]:
-                    if (
-                        f"{event.event_id} injury formatted incorrectly"
-                        not in incorrect_format
-                    ):
-                        incorrect_format.append(
-                            f"{event.event_id} injury formatted incorrectly"
-                        )
-
             # check if event is in allowed or excluded
             if allowed_events and event.event_id not in allowed_events:
                 continue
@@ -439,9 +513,7 @@ class GenerateEvents:
         if not final_events:
             return None, None
 
-        cat_list = [
-            c for c in Cat_class.all_cats.values() if c.status.alive_in_player_clan
-        ]
+        cat_list = cat_index.alive_in_clan(Cat_class.all_cats)
         chosen_cat = None
         chosen_event = None
 
@@ -509,9 +581,6 @@ class GenerateEvents:
             else:
                 break
 
-        for notice in incorrect_format:
-            print(notice)
-
         return chosen_event, chosen_cat
 
     @staticmethod
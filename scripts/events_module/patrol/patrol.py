@@ -16,12 +16,12 @@ from scripts.cat.enums import CatAge, CatRank
 from scripts.clan import Clan
 from scripts.clan_package.settings import get_clan_setting
 from scripts.events_module.event_filters import event_for_tags
+from scripts.events_module.patrol.patrol_catalogue import get_patrol_catalogue
 from scripts.events_module.patrol.patrol_event import PatrolEvent
 from scripts.events_module.patrol.patrol_outcome import PatrolOutcome
 from scripts.game_structure import localization, constants
 from scripts.game_structure.game.settings import game_setting_get
 from scripts.game_structure import game
-from scripts.game_structure.localization import load_lang_resource
 from scripts.utility import (
     get_personality_compatibility,
     check_relationship_value,
@@ -299,51 +299,25 @@ class Patrol:
                 for leaf in leaves:
                     biome_dir = f"{biome.lower()}/"
                     self.update_resources(biome_dir, leaf)
-                    possible_patrols.extend(self.generate_patrol_events(self.HUNTING))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.HUNTING_SZN)
-                    )
-                    possible_patrols.extend(self.generate_patrol_events(self.BORDER))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.BORDER_SZN)
-                    )
-                    possible_patrols.extend(self.generate_patrol_events(self.TRAINING))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.TRAINING_SZN)
-                    )
-                    possible_patrols.extend(self.generate_patrol_events(self.MEDCAT))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.MEDCAT_SZN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.HUNTING_GEN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.BORDER_GEN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.TRAINING_GEN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.MEDCAT_GEN)
-                    )
-                    possible_patrols.extend(self.generate_patrol_events(self.DISASTER))
-                    possible_patrols.extend(self.generate_patrol_events(self.NEW_CAT))
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.NEW_CAT_WELCOMING)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.NEW_CAT_HOSTILE)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.OTHER_CLAN)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.OTHER_CLAN_ALLIES)
-                    )
-                    possible_patrols.extend(
-                        self.generate_patrol_events(self.OTHER_CLAN_HOSTILE)
-                    )
+                    possible_patrols.extend(self.HUNTING)
+                    possible_patrols.extend(self.HUNTING_SZN)
+                    possible_patrols.extend(self.BORDER)
+                    possible_patrols.extend(self.BORDER_SZN)
+                    possible_patrols.extend(self.TRAINING)
+                    possible_patrols.extend(self.TRAINING_SZN)
+                    possible_patrols.extend(self.MEDCAT)
+                    possible_patrols.extend(self.MEDCAT_SZN)
+                    possible_patrols.extend(self.HUNTING_GEN)
+                    possible_patrols.extend(self.BORDER_GEN)
+                    possible_patrols.extend(self.TRAINING_GEN)
+                    possible_patrols.extend(self.MEDCAT_GEN)
+                    possible_patrols.extend(self.DISASTER)
+                    possible_patrols.extend(self.NEW_CAT)
+                    possible_patrols.extend(self.NEW_CAT_WELCOMING)
+                    possible_patrols.extend(self.NEW_CAT_HOSTILE)
+                    possible_patrols.extend(self.OTHER_CLAN)
+                    possible_patrols.extend(self.OTHER_CLAN_ALLIES)
+                    possible_patrols.extend(self.OTHER_CLAN_HOSTILE)
 
         # this next one is needed for Classic specifically
         patrol_type = (
@@ -398,49 +372,41 @@ class Patrol:
             welcoming_rep = True
             chance = welcoming_chance
 
-        possible_patrols.extend(self.generate_patrol_events(self.HUNTING))
-        possible_patrols.extend(self.generate_patrol_events(self.HUNTING_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.BORDER))
-        possible_patrols.extend(self.generate_patrol_events(self.BORDER_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.TRAINING))
-        possible_patrols.extend(self.generate_patrol_events(self.TRAINING_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.MEDCAT))
-        possible_patrols.extend(self.generate_patrol_events(self.MEDCAT_SZN))
-        possible_patrols.extend(self.generate_patrol_events(self.HUNTING_GEN))
-        possible_patrols.extend(self.generate_patrol_events(self.BORDER_GEN))
-        possible_patrols.extend(self.generate_patrol_events(self.TRAINING_GEN))
-        possible_patrols.extend(self.generate_patrol_events(self.MEDCAT_GEN))
+        possible_patrols.extend(self.HUNTING)
+        possible_patrols.extend(self.HUNTING_SZN)
+        possible_patrols.extend(self.BORDER)
+        possible_patrols.extend(self.BORDER_SZN)
+        possible_patrols.extend(self.TRAINING)
+        possible_patrols.extend(self.TRAINING_SZN)
+        possible_patrols.extend(self.MEDCAT)
+        possible_patrols.extend(self.MEDCAT_SZN)
+        possible_patrols.extend(self.HUNTING_GEN)
+        possible_patrols.extend(self.BORDER_GEN)
+        possible_patrols.extend(self.TRAINING_GEN)
+        possible_patrols.extend(self.MEDCAT_GEN)
 
         if game_setting_disaster:
             dis_chance = int(random.getrandbits(3))  # disaster patrol chance
             if dis_chance == 1:
-                possible_patrols.extend(self.generate_patrol_events(self.DISASTER))
+                possible_patrols.extend(self.DISASTER)
 
         # new cat patrols
         if chance == 1:
             if welcoming_rep:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.NEW_CAT_WELCOMING)
-                )
+                possible_patrols.extend(self.NEW_CAT_WELCOMING)
             elif neutral_rep:
-                possible_patrols.extend(self.generate_patrol_events(self.NEW_CAT))
+                possible_patrols.extend(self.NEW_CAT)
             elif hostile_rep:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.NEW_CAT_HOSTILE)
-                )
+                possible_patrols.extend(self.NEW_CAT_HOSTILE)
 
         # other Clan patrols
         if other_clan_chance == 1:
             if clan_neutral:
-                possible_patrols.extend(self.generate_patrol_events(self.OTHER_CLAN))
+                possible_patrols.extend(self.OTHER_CLAN)
             elif clan_allies:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.OTHER_CLAN_ALLIES)
-                )
+                possible_patrols.extend(self.OTHER_CLAN_ALLIES)
             elif clan_hostile:
-                possible_patrols.extend(
-                    self.generate_patrol_events(self.OTHER_CLAN_HOSTILE)
-                )
+                possible_patrols.extend(self.OTHER_CLAN_HOSTILE)
         patrol_ids = [patrol.patrol_id for patrol in possible_patrols]
         if self.debug_patrol and self.debug_patrol not in patrol_ids:
             print(
@@ -584,8 +550,27 @@ class Patrol:
         if patrol_type == "general":
             patrol_type = random.choice(["hunting", "border", "training"])
 
+        # the catalogue knows which of its patrols fit the biome, camp, season, type and number of cats
+        catalogue = get_patrol_catalogue()
+        matching = catalogue.matching(
+            biome,
+            camp,
+            current_season,
+            patrol_type,
+            len(self.patrol_cats),
+            game.clan.game_mode,
+        )
+
         # makes sure that it grabs patrols in the correct biomes, season, with the correct number of cats
         for patrol in possible_patrols:
+            # the requested debug patrol goes through every check, so it can say what it failed
+            if (
+                patrol not in matching
+                and patrol in catalogue.indexed
+                and patrol.patrol_id != self.debug_patrol
+            ):
+                continue
+
             if not self._check_constraints(patrol):
                 continue
 
@@ -729,46 +714,6 @@ class Patrol:
 
         return filtered_patrols, romantic_patrols
 
-    def generate_patrol_events(self, patrol_dict):
-        all_patrol_events = []
-        for patrol in patrol_dict:
-            patrol_event = PatrolEvent(
-                patrol_id=patrol.get("patrol_id"),
-                biome=patrol.get("biome"),
-                camp=patrol.get("camp"),
-                season=patrol.get("season"),
-                tags=patrol.get("tags"),
-                weight=patrol.get("weight", 20),
-                types=patrol.get("types"),
-                intro_text=patrol.get("intro_text"),
-                patrol_art=patrol.get("patrol_art"),
-                patrol_art_clean=patrol.get("patrol_art_clean"),
-                success_outcomes=PatrolOutcome.generate_from_info(
-                    patrol.get("success_outcomes")
-                ),
-                fail_outcomes=PatrolOutcome.generate_from_info(
-                    patrol.get("fail_outcomes"), success=False
-                ),
-                decline_text=patrol.get("decline_text"),
-                chance_of_success=patrol.get("chance_of_success"),
-                min_cats=patrol.get("min_cats", 1),
-                max_cats=patrol.get("max_cats", 6),
-                min_max_status=patrol.get("min_max_status"),
-                antag_success_outcomes=PatrolOutcome.generate_from_info(
-                    patrol.get("antag_success_outcomes"), antagonize=True
-                ),
-                antag_fail_outcomes=PatrolOutcome.generate_from_info(
-                    patrol.get("antag_fail_outcomes"), success=False, antagonize=True
-                ),
-                relationship_constraints=patrol.get("relationship_constraint"),
-                pl_skill_constraints=patrol.get("pl_skill_constraint"),
-                pl_trait_constraints=patrol.get("pl_trait_constraints"),
-            )
-
-            all_patrol_events.append(patrol_event)
-
-        return all_patrol_events
-
     def determine_outcome(self, antagonize=False) -> Tuple[str, str, Optional[str]]:
         if self.patrol_event is None:
             raise Exception("No patrol event supplied")
@@ -901,13 +846,9 @@ class Patrol:
             ("TRAINING_GEN", "general/training.json"),
             ("DISASTER", "disaster.json"),
         ]
+        catalogue = get_patrol_catalogue()
         for patrol_property, location in resources:
-            try:
-                setattr(
-                    self, patrol_property, load_lang_resource(f"patrols/{location}")
-                )
-            except:
-                raise Exception("Something went wrong loading patrols!")
+            setattr(self, patrol_property, catalogue.patrols(location))
 
     def balance_hunting(self, possible_patrols: list):
         """Filter the incoming hunting patrol list to balance the different kinds of hunting patrols.
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: ascii -*-
+"""
+The patrols of the loaded language, built once and indexed.
+
+Patrol files are read and turned into PatrolEvents the first time they're asked for, and kept for as
+long as the language doesn't change. Every patrol that has been built is also indexed by the
+requirements that don't depend on the patrol's cats: biome, camp, season, patrol type, the number of
+cats and game mode tags. `PatrolCatalogue.matching` uses that index to tell which patrols can happen
+at all, so the patrol filter only has to look at the cats for those.
+
+The PatrolEvents are shared between patrols, so they mustn't be changed.
+"""
+
+from typing import Dict, FrozenSet, List, Optional, Set
+
+import i18n
+
+from scripts.events_module.patrol.patrol_event import PatrolEvent
+from scripts.events_module.patrol.patrol_outcome import PatrolOutcome
+from scripts.game_structure.localization import load_lang_resource
+
+GAME_MODES = ("classic", "expanded", "cruel_season")
+
+TYPE_REQUIREMENTS = {
+    "hunting": "hunting",
+    "border": "border",
+    "training": "training",
+    "med": "herb_gathering",
+}
+"""Patrol types that need a patrol to have a specific type. Any other patrol type takes every patrol."""
+
+
+def generate_patrol_events(patrol_dicts: List[dict]) -> List[PatrolEvent]:
+    """
+    Builds PatrolEvents from the contents of a patrol file
+    :param patrol_dicts: The patrols, as they are in the file
+    :return: The PatrolEvents, in the same order
+    """
+    all_patrol_events = []
+    for patrol in patrol_dicts:
+        patrol_event = PatrolEvent(
+            patrol_id=patrol.get("patrol_id"),
+            biome=patrol.get("biome"),
+            camp=patrol.get("camp"),
+            season=patrol.get("season"),
+            tags=patrol.get("tags"),
+            weight=patrol.get("weight", 20),
+            types=patrol.get("types"),
+            intro_text=patrol.get("intro_text"),
+            patrol_art=patrol.get("patrol_art"),
+            patrol_art_clean=patrol.get("patrol_art_clean"),
+            success_outcomes=PatrolOutcome.generate_from_info(
+                patrol.get("success_outcomes")
+            ),
+            fail_outcomes=PatrolOutcome.generate_from_info(
+                patrol.get("fail_outcomes"), success=False
+            ),
+            decline_text=patrol.get("decline_text"),
+            chance_of_success=patrol.get("chance_of_success"),
+            min_cats=patrol.get("min_cats", 1),
+            max_cats=patrol.get("max_cats", 6),
+            min_max_status=patrol.get("min_max_status"),
+            antag_success_outcomes=PatrolOutcome.generate_from_info(
+                patrol.get("antag_success_outcomes"), antagonize=True
+            ),
+            antag_fail_outcomes=PatrolOutcome.generate_from_info(
+                patrol.get("antag_fail_outcomes"), success=False, antagonize=True
+            ),
+            relationship_constraints=patrol.get("relationship_constraint"),
+            pl_skill_constraints=patrol.get("pl_skill_constraint"),
+            pl_trait_constraints=patrol.get("pl_trait_constraints"),
+        )
+
+        all_patrol_events.append(patrol_event)
+
+    return all_patrol_events
+
+
+class PatrolCatalogue:
+    """All patrols of one language that have been asked for so far"""
+
+    def __init__(self, locale: str):
+        self.locale = locale
+        self._files: Dict[str, List[PatrolEvent]] = {}
+
+        self.indexed: Set[PatrolEvent] = set()
+        """Every patrol that is in the index"""
+        self._by_biome: Dict[str, Set[PatrolEvent]] = {}
+        self._by_camp: Dict[str, Set[PatrolEvent]] = {}
+        self._by_season: Dict[str, Set[PatrolEvent]] = {}
+        self._by_type: Dict[str, Set[PatrolEvent]] = {}
+        self._by_mode: Dict[str, Set[PatrolEvent]] = {}
+        """Patrols tagged with game modes, by mode"""
+        self._matching: Dict[tuple, FrozenSet[PatrolEvent]] = {}
+
+    def patrols(self, location: str) -> List[PatrolEvent]:
+        """
+        :param location: The patrol file, relative to the language's patrols folder
+        :return: The file's patrols. Don't change the list or the patrols in it.
+        """
+        events = self._files.get(location)
+        if events is None:
+            try:
+                # the catalogue keeps the patrols, there's no need to cache the files too
+                events = generate_patrol_events(
+                    load_lang_resource(f"patrols/{location}", cache=False)
+                )
+            except:
+                raise Exception("Something went wrong loading patrols!")
+            self._files[location] = events
+            self._add_to_index(events)
+        return events
+
+    def _add_to_index(self, events: List[PatrolEvent]):
+        for patrol in events:
+            if patrol in self.indexed:
+                continue
+            self.indexed.add(patrol)
+            for value in patrol.biome:
+                self._by_biome.setdefault(value, set()).add(patrol)
+            for value in patrol.camp:
+                self._by_camp.setdefault(value, set()).add(patrol)
+            for value in patrol.season:
+                self._by_season.setdefault(value, set()).add(patrol)
+            for value in patrol.types:
+                self._by_type.setdefault(value, set()).add(patrol)
+            for mode in GAME_MODES:
+                if mode in patrol.tags:
+                    self._by_mode.setdefault(mode, set()).add(patrol)
+        # anything worked out before doesn't know about the new patrols
+        self._matching.clear()
+
+    def _with_value(self, index: Dict[str, Set[PatrolEvent]], value: str):
+        return index.get(value, set()) | index.get("any", set())
+
+    def matching(
+        self,
+        biome: str,
+        camp: str,
+        season: str,
+        patrol_type: str,
+        patrol_size: int,
+        game_mode: str,
+    ) -> FrozenSet[PatrolEvent]:
+        """
+        :return: The indexed patrols whose biome, camp, season, type, number of cats and game mode tags
+        allow them to happen. Their other requirements still need checking.
+        """
+        key = (biome, camp, season, patrol_type, patrol_size, game_mode)
+        found = self._matching.get(key)
+        if found is not None:
+            return found
+
+        candidates = (
+            self._with_value(self._by_biome, biome)
+            & self._with_value(self._by_camp, camp)
+            & self._with_value(self._by_season, season)
+        )
+        if patrol_type in TYPE_REQUIREMENTS:
+            candidates &= self._by_type.get(TYPE_REQUIREMENTS[patrol_type], set())
+        # a patrol tagged with a game mode can't happen in any other mode
+        for mode, limited in self._by_mode.items():
+            if mode != game_mode:
+                candidates -= limited
+
+        found = frozenset(
+            patrol
+            for patrol in candidates
+            if patrol.min_cats <= patrol_size <= patrol.max_cats
+        )
+        self._matching[key] = found
+        return found
+
+
+_catalogue: Optional[PatrolCatalogue] = None
+
+
+def get_patrol_catalogue() -> PatrolCatalogue:
+    """
+    :return: The patrol catalogue of the loaded language
+    """
+    global _catalogue
+    locale = str(i18n.config.get("locale"))
+    if _catalogue is None or _catalogue.locale != locale:
+        _catalogue = PatrolCatalogue(locale)
+    return _catalogue
@@ -413,7 +413,7 @@ class Pregnancy_Events:
                     CatGroup.PLAYER_CLAN_ID
                 ):
                     kit.backstory = "outsider3"
-                kit.relationships = {}
+                kit.relationships.clear()
                 kit.create_one_relationship(cat)
 
         insert = i18n.t("conditions.pregnancy.kit_amount", count=kits_amount)
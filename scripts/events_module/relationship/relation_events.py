@@ -6,6 +6,7 @@ import ujson
 
 from scripts.game_structure import constants
 from scripts.cat.cats import Cat
+from scripts.cat.cat_index import cat_index
 from scripts.cat.enums import CatRank
 from scripts.events_module.relationship.group_events import GroupEvents
 from scripts.events_module.relationship.romantic_events import RomanticEvents
@@ -181,12 +182,7 @@ class Relation_Events:
 
         if cat.status.is_leader:
             chosen_type = "all"
-        possible_interaction_cats = list(
-            filter(
-                lambda cat: (cat.status.alive_in_player_clan),
-                Cat.all_cats.values(),
-            )
-        )
+        possible_interaction_cats = cat_index.alive_in_clan(Cat.all_cats)
         if cat in possible_interaction_cats:
             possible_interaction_cats.remove(cat)
 
@@ -270,12 +266,7 @@ class Relation_Events:
     @staticmethod
     def cats_with_relationship_constraints(main_cat, constraint):
         """Returns a list of cats, where the relationship from main_cat towards the cat fulfill the given constraints."""
-        cat_list = list(
-            filter(
-                lambda cat: cat.status.alive_in_player_clan,
-                Cat.all_cats.values(),
-            )
-        )
+        cat_list = cat_index.alive_in_clan(Cat.all_cats)
         cat_list.remove(main_cat)
         filtered_cat_list = []
 
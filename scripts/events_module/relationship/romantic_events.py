@@ -284,7 +284,7 @@ class RomanticEvents:
         )
 
         # now add the age of the cats before the string is sent to the cats' relationship logs
-        relationship.log.append(
+        relationship.add_log(
             interaction_str
             + i18n.t(
                 "relationships.age_postscript", name=cat_from.name, count=cat_from.moons
@@ -293,7 +293,7 @@ class RomanticEvents:
 
         if not relationship.opposite_relationship and cat_from.ID != cat_to.ID:
             relationship.link_relationship()
-            relationship.opposite_relationship.log.append(
+            relationship.opposite_relationship.add_log(
                 interaction_str
                 + i18n.t(
                     "relationships.age_postscript",
@@ -100,7 +100,7 @@ class Welcoming_Events:
 
         # add to relationship logs
         if new_cat.ID in clan_cat.relationships:
-            clan_cat.relationships[new_cat.ID].log.append(
+            clan_cat.relationships[new_cat.ID].add_log(
                 interaction_str
                 + i18n.t(
                     "relationships.age_postscript",
@@ -112,7 +112,7 @@ class Welcoming_Events:
             new_cat.relationships[clan_cat.ID].link_relationship()
 
         if clan_cat.ID in new_cat.relationships:
-            clan_cat.relationships[new_cat.ID].log.append(
+            clan_cat.relationships[new_cat.ID].add_log(
                 interaction_str
                 + i18n.t(
                     "relationships.age_postscript",
@@ -1,3 +1,4 @@
+from copy import deepcopy
 from random import choice, choices, randrange, sample, randint
 from typing import List
 
@@ -6,6 +7,7 @@ import i18n
 from scripts.clan_resources.herb.herb import HERBS
 from scripts.events_module.future.future_event import prep_event
 from scripts.cat.cats import Cat
+from scripts.cat.cat_index import cat_index
 from scripts.cat.enums import CatRank
 from scripts.cat.pelts import Pelt
 from scripts.cat_relations.relationship import Relationship
@@ -154,6 +156,7 @@ class HandleShortEvents:
             possible_short_events = GenerateEvents.possible_short_events(
                 frequency,
                 event_type,
+                sub_types=None if ignore_subtyping else self.sub_types,
             )
 
             chosen_event, random_cat = GenerateEvents.filter_possible_short_events(
@@ -177,7 +180,8 @@ class HandleShortEvents:
         #                               do the event                                   #
         # ---------------------------------------------------------------------------- #
         if chosen_event:
-            self.chosen_event = chosen_event
+            # the loaded events are kept between moons, so work on a copy
+            self.chosen_event = deepcopy(chosen_event)
             self.random_cat = random_cat
             self.future_event_failed = False
         else:
@@ -580,7 +584,7 @@ class HandleShortEvents:
         cats that will die are added to self.dead_cats
         """
         # gather living clan cats except leader bc leader lives would be frustrating to handle in these
-        alive_cats = [i for i in Cat.all_cats.values() if i.status.alive_in_player_clan]
+        alive_cats = cat_index.alive_in_clan(Cat.all_cats)
 
         # make sure all cats in the pool fit the event requirements
         requirements = self.chosen_event.m_c
@@ -0,0 +1,105 @@
+"""
+Times how long one freshkill feeding round takes as the clan grows.
+
+Makes clans of warriors and kits that don't need any saves, feeds each of them and
+reports the fastest of a few rounds. Feeding should take about as much longer as there
+are more cats; if it takes the square of that, something is going through every cat for
+every cat fed. Run it from the root of the repository:
+
+    python -m scripts.feeding_benchmark
+    python -m scripts.feeding_benchmark --cats 100 400 1600 --rounds 5
+"""
+
+import os
+
+# these have to be set before pygame is imported anywhere
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import sys
+import time
+from typing import List
+
+import ujson
+
+
+def feeding_time(amount_of_cats: int, rounds: int = 3) -> float:
+    """
+    Feeds a clan of warriors, with a kit for every fourth warrior.
+    :param amount_of_cats: How many warriors the clan has
+    :param rounds: How many times to feed them
+    :return: The fastest feeding round, in seconds
+    """
+    from scripts.cat.cats import Cat
+    from scripts.cat.enums import CatRank
+    from scripts.clan_resources.freshkill import FreshkillPile
+
+    with open("resources/prey_config.json", "r", encoding="utf-8") as read_file:
+        prey_requirement = ujson.loads(read_file.read())["prey_requirement"]
+
+    Cat.all_cats = {}
+    living_cats = []
+    for i in range(amount_of_cats):
+        cat = Cat(status_dict={"rank": CatRank.WARRIOR}, moons=1, disable_random=True)
+        cat.moons = 20 + i % 100
+        living_cats.append(cat)
+        if i % 4 == 0:
+            kit = Cat(
+                status_dict={"rank": CatRank.KITTEN}, moons=1, disable_random=True
+            )
+            kit.parent1 = cat.ID
+            living_cats.append(kit)
+
+    fastest = None
+    for _ in range(rounds):
+        freshkill_pile = FreshkillPile()
+        freshkill_pile.living_cats = living_cats
+        current_amount = prey_requirement["warrior"] * amount_of_cats
+        freshkill_pile.pile["expires_in_4"] = current_amount
+        freshkill_pile.total_amount = current_amount
+
+        start = time.perf_counter()
+        freshkill_pile.feed_cats(living_cats)
+        duration = time.perf_counter() - start
+        fastest = duration if fastest is None else min(fastest, duration)
+    return fastest
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m scripts.feeding_benchmark",
+        description="Time a freshkill feeding round for clans of different sizes.",
+    )
+    parser.add_argument(
+        "--cats",
+        type=int,
+        nargs="+",
+        default=[100, 400],
+        help="warriors in each clan, a kit is added for every fourth (default: 100 400)",
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=3,
+        help="feeding rounds per clan, the fastest is reported (default: 3)",
+    )
+    args = parser.parse_args(argv)
+
+    smallest = None
+    for amount_of_cats in args.cats:
+        duration = feeding_time(amount_of_cats, args.rounds)
+        line = f"{amount_of_cats} warriors: {duration * 1000:.1f}ms"
+        if smallest is None:
+            smallest = (amount_of_cats, duration)
+        elif smallest[1]:
+            line += (
+                f" ({amount_of_cats / smallest[0]:.1f}x the cats, "
+                f"{duration / smallest[1]:.1f}x as long)"
+            )
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -173,6 +173,8 @@ def add_faded_offspring_to_faded_cat(parent, offspring):
     """In order to siblings to work correctly, and not to lose relation info on fading, we have to keep track of
     both active and faded cat's faded offpsring. This will add a faded offspring to a faded parents file.
     """
+    # imported here, the cat package needs this module to be loaded first
+    from scripts.cat.save_load import faded_cat_cache
 
     global clan
 
@@ -192,6 +194,7 @@ def add_faded_offspring_to_faded_cat(parent, offspring):
     cat_info["faded_offspring"].append(offspring)
 
     safe_save(path, cat_info)
+    faded_cat_cache.discard(parent)
 
     return True
 
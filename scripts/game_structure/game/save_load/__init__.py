@@ -1,5 +1,8 @@
 from scripts.game_structure.game.save_load.save_load import (
     safe_save,
+    safe_save_if_changed,
+    remember_saved_file,
+    forget_saved_files,
     save_clanlist,
     read_clans,
 )
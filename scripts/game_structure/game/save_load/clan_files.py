@@ -0,0 +1,374 @@
+"""
+Storage for the per-cat save files of a clan.
+
+A clan's cats are saved as `clan_cats.json` plus one file per cat in each of `relationships/`,
+`conditions/` and `history/`. By default these are loose files in the clan's save folder.
+
+A clan can also be *packed*: the same files are then stored as rows of a single SQLite database,
+`cats.db`, in the clan's save folder. That's one file to open instead of thousands, and a save is one
+transaction with a single sync instead of one sync per file. The contents of every file stay exactly
+the same. A clan is packed if its folder contains `cats.db`, so nothing else has to be configured.
+`pack_clan` and `unpack_clan` convert between the two layouts.
+
+Everything goes through `get_clan_files(clanname)`, which hands out the right storage for the clan.
+File names are relative to the clan folder and always use forward slashes,
+e.g. `relationships/12_relations.json`.
+
+While a clan loads, `prefetch_json` reads and decodes the per-cat files on worker threads, so the
+disk is busy while the main thread builds the cats. `read_json` then picks up the results.
+"""
+
+import os
+import sqlite3
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import ujson
+
+from scripts.game_structure.game.save_load.save_load import (
+    safe_save_if_changed,
+    remember_saved_file,
+    forget_saved_files,
+    _digest,
+)
+from scripts.housekeeping.datadir import get_save_dir
+
+PACKED_FILE_NAME = "cats.db"
+
+CAT_FILE_FOLDERS = ("relationships", "conditions", "history")
+"""Folders of the clan save folder whose files are kept in the packed file"""
+
+PACKED_TOP_LEVEL_FILES = ("clan_cats.json",)
+"""Files directly in the clan save folder that are kept in the packed file"""
+
+
+def _to_text(write_data) -> str:
+    if type(write_data) is not str:
+        return ujson.dumps(write_data, indent=4)
+    return write_data
+
+
+class ClanFiles:
+    """The cat files of a clan, stored as loose files in the clan's save folder."""
+
+    packed = False
+
+    def __init__(self, clanname: str, directory: str = None):
+        """
+        :param clanname: The clan's save folder name
+        :param directory: Where the clan's files are, if not in its save folder
+        """
+        self.clanname = clanname
+        self.directory = directory or f"{get_save_dir()}/{clanname}"
+        self._prefetched: Dict[str, Future] = {}
+
+    def _path(self, name: str) -> str:
+        return f"{self.directory}/{name}"
+
+    def read(self, name: str) -> Optional[str]:
+        """
+        :param name: File name, relative to the clan folder
+        :return: Contents of the file, or None if there's no such file
+        """
+        path = self._path(name)
+        try:
+            with open(path, "r", encoding="utf-8") as read_file:
+                text = read_file.read()
+        except FileNotFoundError:
+            return None
+        remember_saved_file(path, text)
+        return text
+
+    def read_json(self, name: str):
+        """
+        :param name: File name, relative to the clan folder
+        :return: Decoded contents of the file, or None if there's no such file
+        """
+        future = self._prefetched.pop(name, None)
+        if future is not None:
+            return future.result()
+        text = self.read(name)
+        return None if text is None else ujson.loads(text)
+
+    def prefetch_json(self, names: Iterable[str], max_workers: int = None):
+        """
+        Starts reading and decoding files on worker threads. read_json waits for them as needed.
+        :param names: File names, relative to the clan folder
+        :param max_workers: Number of threads, defaults to what ThreadPoolExecutor thinks is sensible
+        """
+        names = [name for name in names if name not in self._prefetched]
+        if not names:
+            return
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="clan_files"
+        )
+        for name in names:
+            self._prefetched[name] = executor.submit(self._read_json_uncached, name)
+        # the threads exit once the queue is empty
+        executor.shutdown(wait=False)
+
+    def _read_json_uncached(self, name: str):
+        text = self.read(name)
+        return None if text is None else ujson.loads(text)
+
+    def drop_prefetched(self):
+        """Forgets prefetched files that were never asked for"""
+        for future in self._prefetched.values():
+            future.cancel()
+        self._prefetched.clear()
+
+    def write(self, name: str, write_data) -> bool:
+        """
+        Saves a file, if its contents changed since it was last read or written.
+        :param name: File name, relative to the clan folder
+        :param write_data: A string, or something to save as json
+        :return: True if the file was written
+        """
+        return safe_save_if_changed(self._path(name), write_data)
+
+    def delete(self, name: str):
+        path = self._path(name)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def exists(self, name: str) -> bool:
+        return os.path.exists(self._path(name))
+
+    def has_folder(self, folder: str) -> bool:
+        """
+        :param folder: One of CAT_FILE_FOLDERS
+        :return: True if the folder exists. A packed clan has a folder if it has any files in it.
+        """
+        return os.path.isdir(self._path(folder))
+
+    def list(self, folder: str) -> List[str]:
+        """
+        :param folder: One of CAT_FILE_FOLDERS
+        :return: Names of the json files in that folder, relative to the clan folder
+        """
+        path = self._path(folder)
+        if not os.path.isdir(path):
+            return []
+        return [
+            f"{folder}/{file_name}"
+            for file_name in os.listdir(path)
+            if file_name.endswith(".json")
+        ]
+
+    def commit(self):
+        """Makes sure everything written so far is on disk. Loose files are synced as they're written."""
+
+    def close(self):
+        self.drop_prefetched()
+
+
+class PackedClanFiles(ClanFiles):
+    """The cat files of a clan, stored in a single SQLite database in the clan's save folder."""
+
+    packed = True
+
+    def __init__(self, clanname: str, directory: str = None):
+        super().__init__(clanname, directory)
+        self.db_path = self._path(PACKED_FILE_NAME)
+        self._digests: Dict[str, bytes] = {}
+        # the game loads on a worker thread and saves on the main one, but never both at once
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS files (name TEXT PRIMARY KEY, data TEXT NOT NULL)"
+        )
+        self.connection.commit()
+
+    def read(self, name: str) -> Optional[str]:
+        row = self.connection.execute(
+            "SELECT data FROM files WHERE name = ?", (name,)
+        ).fetchone()
+        if row is None:
+            return None
+        self._digests[name] = _digest(row[0])
+        return row[0]
+
+    def prefetch_json(self, names: Iterable[str], max_workers: int = None):
+        names = [name for name in names if name not in self._prefetched]
+        if not names:
+            return
+        # the rows are fetched in one go on a connection of its own, only decoding is spread out
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="clan_files"
+        )
+        rows = executor.submit(self._fetch_rows, names)
+        for name in names:
+            self._prefetched[name] = executor.submit(self._decode_row, rows, name)
+        executor.shutdown(wait=False)
+
+    def _fetch_rows(self, names: List[str]) -> Dict[str, str]:
+        wanted = set(names)
+        connection = sqlite3.connect(self.db_path)
+        try:
+            return {
+                name: data
+                for name, data in connection.execute("SELECT name, data FROM files")
+                if name in wanted
+            }
+        finally:
+            connection.close()
+
+    def _decode_row(self, rows: Future, name: str):
+        text = rows.result().get(name)
+        if text is None:
+            return None
+        self._digests[name] = _digest(text)
+        return ujson.loads(text)
+
+    def write(self, name: str, write_data) -> bool:
+        text = _to_text(write_data)
+        digest = _digest(text)
+        if self._digests.get(name) == digest:
+            return False
+        self.connection.execute(
+            "INSERT OR REPLACE INTO files (name, data) VALUES (?, ?)", (name, text)
+        )
+        self._digests[name] = digest
+        return True
+
+    def delete(self, name: str):
+        self.connection.execute("DELETE FROM files WHERE name = ?", (name,))
+        self._digests.pop(name, None)
+
+    def exists(self, name: str) -> bool:
+        return (
+            self.connection.execute(
+                "SELECT 1 FROM files WHERE name = ?", (name,)
+            ).fetchone()
+            is not None
+        )
+
+    @staticmethod
+    def _folder_range(folder: str) -> Tuple[str, str]:
+        # "0" sorts right after "/", so this is every name that starts with "folder/"
+        return f"{folder}/", f"{folder}0"
+
+    def has_folder(self, folder: str) -> bool:
+        return (
+            self.connection.execute(
+                "SELECT 1 FROM files WHERE name >= ? AND name < ? LIMIT 1",
+                self._folder_range(folder),
+            ).fetchone()
+            is not None
+        )
+
+    def list(self, folder: str) -> List[str]:
+        return [
+            row[0]
+            for row in self.connection.execute(
+                "SELECT name FROM files WHERE name >= ? AND name < ?",
+                self._folder_range(folder),
+            )
+        ]
+
+    def commit(self):
+        self.connection.commit()
+
+    def close(self):
+        super().close()
+        self.connection.close()
+
+
+_clan_files: Optional[ClanFiles] = None
+
+
+def is_packed(clanname: str) -> bool:
+    """
+    :return: True if the clan's cat files are stored in a packed file
+    """
+    return os.path.exists(f"{get_save_dir()}/{clanname}/{PACKED_FILE_NAME}")
+
+
+def get_clan_files(clanname: str) -> Union[ClanFiles, PackedClanFiles]:
+    """
+    :param clanname: The clan's save folder name
+    :return: The storage of the clan's cat files, packed or not depending on what's in its folder
+    """
+    global _clan_files
+    if _clan_files is None or _clan_files.clanname != clanname:
+        if _clan_files is not None:
+            _clan_files.close()
+        _clan_files = (
+            PackedClanFiles(clanname) if is_packed(clanname) else ClanFiles(clanname)
+        )
+    return _clan_files
+
+
+def reset_clan_files():
+    """
+    Forgets about the current clan's storage and everything it has read or written.
+    Call this when a clan is loaded or its layout is converted.
+    """
+    global _clan_files
+    if _clan_files is not None:
+        _clan_files.close()
+    _clan_files = None
+    forget_saved_files()
+
+
+def _loose_file_names(clanname: str) -> List[str]:
+    loose = ClanFiles(clanname)
+    names = [name for name in PACKED_TOP_LEVEL_FILES if loose.exists(name)]
+    for folder in CAT_FILE_FOLDERS:
+        names.extend(loose.list(folder))
+    return names
+
+
+def pack_clan(clanname: str) -> int:
+    """
+    Moves the loose cat files of a clan into a packed file. The loose files are only removed once
+    the packed file is safely written.
+    :param clanname: The clan's save folder name
+    :return: The number of files that were packed
+    """
+    reset_clan_files()
+    loose = ClanFiles(clanname)
+    names = _loose_file_names(clanname)
+
+    packed = PackedClanFiles(clanname)
+    try:
+        for name in names:
+            packed.write(name, loose.read(name))
+        packed.commit()
+    finally:
+        packed.close()
+
+    for name in names:
+        loose.delete(name)
+    for folder in CAT_FILE_FOLDERS:
+        if os.path.isdir(f"{loose.directory}/{folder}") and not os.listdir(
+            f"{loose.directory}/{folder}"
+        ):
+            os.rmdir(f"{loose.directory}/{folder}")
+
+    reset_clan_files()
+    return len(names)
+
+
+def unpack_clan(clanname: str) -> int:
+    """
+    Writes the files in a clan's packed file back out as loose files, then removes the packed file.
+    :param clanname: The clan's save folder name
+    :return: The number of files that were unpacked
+    """
+    reset_clan_files()
+    if not is_packed(clanname):
+        return 0
+
+    loose = ClanFiles(clanname)
+    packed = PackedClanFiles(clanname)
+    try:
+        rows = packed.connection.execute("SELECT name, data FROM files").fetchall()
+    finally:
+        packed.close()
+
+    for name, data in rows:
+        loose.write(name, data)
+    os.remove(packed.db_path)
+
+    reset_clan_files()
+    return len(rows)
@@ -1,12 +1,16 @@
+import hashlib
 import os
 from pathlib import Path
 from shutil import move as shutil_move
-from typing import Union, List
+from typing import Union, List, Dict
 
 import ujson
 
 from scripts.housekeeping.datadir import get_temp_dir, get_save_dir
 
+_saved_digests: Dict[str, bytes] = {}
+"""Digest of what is currently in each file that went through safe_save_if_changed, keyed by normalized path"""
+
 
 def safe_save(
     path: Union[str, Path], write_data, check_integrity=False, max_attempts: int = 15
@@ -66,6 +70,42 @@ def safe_save(
             os.fsync(write_file.fileno())
 
 
+def _digest(data: str) -> bytes:
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).digest()
+
+
+def safe_save_if_changed(path: Union[str, Path], write_data) -> bool:
+    """Same as safe_save, but skips the write if the file already holds exactly this data.
+    Only files that were written by this function, or passed to remember_saved_file,
+    are known - anything else is always written.
+
+    :param path: The file to save to
+    :param write_data: A string, or something to save as json
+    :return: True if the file was written"""
+    if type(write_data) is not str:
+        write_data = ujson.dumps(write_data, indent=4)
+
+    key = os.path.normpath(path)
+    digest = _digest(write_data)
+    if _saved_digests.get(key) == digest and os.path.exists(key):
+        return False
+
+    safe_save(path, write_data)
+    _saved_digests[key] = digest
+    return True
+
+
+def remember_saved_file(path: Union[str, Path], file_contents: str):
+    """Tells safe_save_if_changed what a file holds right now, usually just after reading it,
+    so saving the same data back doesn't write it again."""
+    _saved_digests[os.path.normpath(path)] = _digest(file_contents)
+
+
+def forget_saved_files():
+    """Drops everything safe_save_if_changed knows about. Call this when loading a clan."""
+    _saved_digests.clear()
+
+
 def save_clanlist(loaded_clan=None, only_switch=False):
     """
     Save clanlist to file
@@ -2,6 +2,7 @@ import logging
 import os
 from math import floor
 from random import choice
+from typing import Callable
 
 import i18n
 import ujson
@@ -10,6 +11,10 @@ from scripts.cat.cats import Cat, BACKSTORIES
 from ..cat.enums import CatGroup, CatRank
 from scripts.cat.pelts import Pelt
 from scripts.cat_relations.inheritance import Inheritance
+from scripts.game_structure.game.save_load.clan_files import (
+    get_clan_files,
+    reset_clan_files,
+)
 from scripts.game_structure.game.switches import (
     switch_get_value,
     switch_set_value,
@@ -27,9 +32,16 @@ from ..housekeeping.datadir import get_save_dir
 logger = logging.getLogger(__name__)
 
 
-def load_cats():
+def load_cats(progress: Callable[[float], None] = None):
+    """
+    Loads the cats of the clan that's first in the clan list.
+    :param progress: Called now and then with how far along loading is, from 0 to 1.
+        It's called from whichever thread is loading.
+    """
+    # whatever we knew about the files of the previous clan is no use now
+    reset_clan_files()
     try:
-        json_load()
+        json_load(progress)
     except FileNotFoundError:
         try:
             csv_load(Cat.all_cats)
@@ -39,20 +51,27 @@ def load_cats():
             raise
 
 
-def json_load():
+def json_load(progress: Callable[[float], None] = None):
+    if progress is None:
+        progress = _no_progress
+
     Cat.all_cats.clear()
     Cat.all_cats_list.clear()
     Cat.dead_cats.clear()
+    Inheritance.family.clear()
     all_cats = []
     clanname = switch_get_value(Switch.clan_list)[0]
     clan_cats_json_path = f"{get_save_dir()}/{clanname}/clan_cats.json"
+    clan_files = get_clan_files(clanname)
     with open(
         f"resources/dicts/conversion_dict.json", "r", encoding="utf-8"
     ) as read_file:
         convert = ujson.loads(read_file.read())
     try:
-        with open(clan_cats_json_path, "r", encoding="utf-8") as read_file:
-            cat_data = ujson.loads(read_file.read())
+        clan_cats_text = clan_files.read("clan_cats.json")
+        if clan_cats_text is None:
+            raise FileNotFoundError(clan_cats_json_path)
+        cat_data = ujson.loads(clan_cats_text)
     except PermissionError as e:
         switch_set_value(Switch.error_message, f"Can\t open {clan_cats_json_path}!")
         switch_set_value(Switch.traceback, e)
@@ -64,8 +83,20 @@ def json_load():
 
     old_tortie_patches = convert["old_tortie_patches"]
 
+    # the side files get read and decoded on worker threads while the cats are built
+    cat_ids = [cat["ID"] for cat in cat_data if "ID" in cat]
+    clan_files.prefetch_json(
+        [f"conditions/{cat_id}_conditions.json" for cat_id in cat_ids]
+        + [f"relationships/{cat_id}_relations.json" for cat_id in cat_ids]
+    )
+
+    # building the cats and finishing them off take about as long
+    steps = max(len(cat_data) * 2, 1)
+    progress(0.0)
+
     # create new cat objects
     for i, cat in enumerate(cat_data):
+        progress(i / steps)
         try:
             # accounting for old saves
             # checks first if status is in the old format
@@ -312,7 +343,8 @@ def json_load():
 
     # replace cat ids with cat objects and add other needed variables
     other_clan_cats = [c for c in Cat.all_cats_list if c.status.is_other_clancat]
-    for cat in all_cats:
+    for i, cat in enumerate(all_cats):
+        progress((len(cat_data) + i) / steps)
         cat.load_conditions()
 
         # this is here to handle paralyzed cats in old saves
@@ -328,7 +360,7 @@ def json_load():
                 if cat.relationships is not None and len(cat.relationships) < 1:
                     cat.init_all_relationships()
             else:
-                cat.relationships = {}
+                cat.relationships.clear()
         except Exception as e:
             logger.exception(
                 f"There was an error loading relationships for cat #{cat}."
@@ -360,6 +392,13 @@ def json_load():
         if constants.CONFIG["save_load"]["load_integrity_checks"]:
             save_check()
 
+    clan_files.drop_prefetched()
+    progress(1.0)
+
+
+def _no_progress(value: float):
+    pass
+
 
 def csv_load(all_cats):
     if switch_get_value(Switch.clan_list)[0].strip() == "":
@@ -1,5 +1,5 @@
 import os.path
-from typing import List, Dict, Union, Optional
+from typing import List, Dict, Union, Optional, Tuple
 
 import i18n
 import i18n.translations
@@ -14,6 +14,11 @@ _directory_changed: bool = False
 
 default_pronouns: Dict[str, Dict[str, Dict[str, Union[str, int]]]] = {}
 
+_resource_cache: Dict[Tuple[str, str, str, str], object] = {}
+"""Decoded lang resources, keyed by root directory, locale, fallback and location"""
+_resource_cache_stats = {"hits": 0, "misses": 0, "size": 0}
+"""How often load_lang_resource found its resource in the cache, and how much json it holds"""
+
 
 def get_new_pronouns(genderalign: str) -> List[Dict[str, Union[str, int]]]:
     """
@@ -66,17 +71,41 @@ def get_default_adj():
     return get_lang_config()["pronouns"]["adj_default"]
 
 
-def load_lang_resource(location: str, *, root_directory=None):
+def load_lang_resource(location: str, *, root_directory=None, cache=True):
     """
-    Get a resource from the resources/lang folder for the loaded language
+    Get a resource from the resources/lang folder for the loaded language. Each file is only read
+    once per language, after that everyone gets the same object. Don't change it, copy it first.
     :param location: If the language code is required, substitute `{lang}`. Relative location
     from the resources/lang/[language]/ folder. Don't include a slash.
     :param root_directory: for testing only.
+    :param cache: False to read the file without keeping it, for callers that keep what they build from it
     :return: Whatever resource was there, from either the locale or fallback
     :exception FileNotFoundError: If requested resource doesn't exist in selected locale or fallback
     """
-    location = os.path.normpath(location)
     locale, fallback = str(i18n.config.get("locale")), str(i18n.config.get("fallback"))
+    key = (str(root_directory), locale, fallback, location)
+    try:
+        resource = _resource_cache[key]
+    except KeyError:
+        pass
+    else:
+        _resource_cache_stats["hits"] += 1
+        return resource
+
+    text = _read_lang_resource(location, locale, fallback, root_directory)
+    resource = ujson.loads(text)
+    if not cache:
+        return resource
+    _resource_cache[key] = resource
+    _resource_cache_stats["misses"] += 1
+    _resource_cache_stats["size"] += len(text)
+    return resource
+
+
+def _read_lang_resource(
+    location: str, locale: str, fallback: str, root_directory=None
+) -> str:
+    location = os.path.normpath(location)
     if root_directory is None:
         root_directory = os.path.join("resources", "lang")
     resource_directory = os.path.join(root_directory, locale)
@@ -88,14 +117,31 @@ def load_lang_resource(location: str, *, root_directory=None):
             "r",
             encoding="utf-8",
         ) as string_file:
-            return ujson.loads(string_file.read())
+            return string_file.read()
     except FileNotFoundError:
         with open(
             os.path.join(fallback_directory, location.replace("{lang}", fallback)),
             "r",
             encoding="utf-8",
         ) as string_file:
-            return ujson.loads(string_file.read())
+            return string_file.read()
+
+
+def clear_lang_resource_cache():
+    """
+    Forgets every loaded lang resource, so they're read again when next asked for.
+    Call this when the language changes, or the files change on disk.
+    """
+    _resource_cache.clear()
+    _resource_cache_stats.update(hits=0, misses=0, size=0)
+
+
+def get_lang_resource_cache_stats() -> Dict[str, int]:
+    """
+    :return: The number of cached resources, how many calls found theirs in the cache ("hits") or
+    had to read it ("misses"), and the size of the cached files in characters ("size")
+    """
+    return dict(_resource_cache_stats, resources=len(_resource_cache))
 
 
 def get_lang_config() -> Dict:
@@ -1,5 +1,7 @@
 import html
 import math
+import weakref
+from collections import OrderedDict
 from functools import lru_cache
 from math import ceil
 from typing import (
@@ -37,6 +39,7 @@ from scripts.utility import (
     ui_scale_dimensions,
     ui_scale_value,
     clamp,
+    inflate_mask,
 )
 
 
@@ -368,23 +371,15 @@ class UIImageButton(pygame_gui.elements.UIButton):
             # set in utility.py:update_mask
             val = pygame.mask.from_surface(val, threshold=250)
 
-            inflated_mask = pygame.Mask(
+            self._mask = inflate_mask(
+                val,
+                self.mask_padding,
+                self.mask_padding,
                 (
                     self.relative_rect[2] + self.mask_padding * 2,
                     self.relative_rect[3] + self.mask_padding * 2,
-                )
+                ),
             )
-            inflated_mask.draw(val, (self.mask_padding, self.mask_padding))
-            for _ in range(self.mask_padding):
-                outline = inflated_mask.outline()
-                for point in outline:
-                    for dx in range(-1, 2):
-                        for dy in range(-1, 2):
-                            try:
-                                inflated_mask.set_at((point[0] + dx, point[1] + dy), 1)
-                            except IndexError:
-                                continue
-            self._mask = inflated_mask
         self.mask_info[0] = (
             self.rect[0] - self.mask_padding,
             self.rect[1] - self.mask_padding,
@@ -826,6 +821,55 @@ class UIModifiedHorizScrollBar(pygame_gui.elements.UIHorizontalScrollBar):
         self.rebuild()
 
 
+SCALED_SPRITE_CACHE_SIZE = 1024
+"""How many scaled cat sprites UISpriteButton keeps around"""
+
+_scaled_sprites: "OrderedDict[tuple, Tuple[weakref.ref, pygame.Surface]]" = (
+    OrderedDict()
+)
+"""Cat sprites scaled for a UISpriteButton, keyed by the id of the sprite, the size and whether it was
+smoothscaled. Least recently used first. Each one holds a weak reference to its sprite, so a new sprite
+that gets the id of an old one isn't shown as the old one."""
+
+
+def scale_cat_sprite(sprite: pygame.Surface, size: Tuple[int, int]) -> pygame.Surface:
+    """
+    Premultiplies a cat sprite and scales it to the size it's shown at, or fetches it if this sprite was
+    scaled to this size before. A cat gets a new sprite whenever its look changes, so the sprite itself
+    tells which version of the cat it shows.
+    :param sprite: The sprite to scale
+    :param size: The size it's shown at
+    :return: The scaled sprite, already premultiplied. It's shared, so it mustn't be drawn on.
+    """
+    # if it's going to be small on the screen, smoothscale out the crunch
+    smooth = (
+        size[1] <= ui_scale_value(sprite.get_height())
+        or size[0] <= ui_scale_value(sprite.get_height())
+    ) and not game_setting_get("no sprite antialiasing")
+    key = (id(sprite), tuple(size), smooth)
+
+    cached = _scaled_sprites.get(key)
+    if cached is not None and cached[0]() is sprite:
+        _scaled_sprites.move_to_end(key)
+        return cached[1]
+
+    scaled = sprite.premul_alpha()
+    scaled = (
+        pygame.transform.smoothscale(scaled, size)
+        if smooth
+        else pygame.transform.scale(scaled, size)
+    )
+    # UIImage premultiplies the images it's given. Do that here instead, so it's only done once and
+    # the sprites look the same as they always have.
+    scaled = scaled.convert_alpha().premul_alpha()
+
+    _scaled_sprites[key] = (weakref.ref(sprite), scaled)
+    _scaled_sprites.move_to_end(key)
+    if len(_scaled_sprites) > SCALED_SPRITE_CACHE_SIZE:
+        _scaled_sprites.popitem(last=False)
+    return scaled
+
+
 class UISpriteButton:
     """This is for use with the cat sprites. It wraps together a UIImage and Transparent Button.
     For most functions, this can be used exactly like other pygame_gui elements."""
@@ -869,22 +913,10 @@ class UISpriteButton:
             mask=mask,
             mask_padding=mask_padding,
         )
-        input_sprite = sprite.premul_alpha()
-        # if it's going to be small on the screen, smoothscale out the crunch
-        input_sprite = (
-            pygame.transform.smoothscale(input_sprite, relative_rect.size)
-            if (
-                (
-                    relative_rect.height <= ui_scale_value(sprite.get_height())
-                    or relative_rect.width <= ui_scale_value(sprite.get_height())
-                )
-                and not game_setting_get("no sprite antialiasing")
-            )
-            else pygame.transform.scale(input_sprite, relative_rect.size)
-        )
         self.image = pygame_gui.elements.UIImage(
             relative_rect,
-            input_sprite,
+            scale_cat_sprite(sprite, relative_rect.size),
+            image_is_alpha_premultiplied=True,
             visible=visible,
             manager=manager,
             container=container,
@@ -892,7 +924,6 @@ class UISpriteButton:
             anchors=anchors,
             starting_height=starting_height,
         )
-        del input_sprite
         self.button.join_focus_sets(self.image)
         self.image.check_hover = self.__image_check_hover
 
@@ -927,6 +958,16 @@ class UISpriteButton:
     def set_image(self, new_image):
         self.image.set_image(new_image)
 
+    def set_sprite(self, sprite: pygame.Surface):
+        """
+        Shows a different cat sprite, scaled the same way as the sprite this button was made with.
+        :param sprite: The new cat sprite
+        """
+        self.image.set_image(
+            scale_cat_sprite(sprite, self.image.rect.size),
+            image_is_alpha_premultiplied=True,
+        )
+
     """This is to simplify event handling. Rather that writing 
             'if event.ui_element = cat_sprite_object.button'
             you can treat is as any other single pygame UI element and write:
@@ -1639,6 +1680,11 @@ class UICatListDisplay(UIContainer):
         self.cat_chunks = []
         self.boxes = []
 
+        self._favor_shown: Dict[str, bool] = {}
+        """Whether each favourite indicator shows the favourite marker or nothing"""
+        self._names_theme = None
+        """The text theme the names on display were made with"""
+
         self.show_names = show_names
 
         self._favor_circle = pygame.transform.scale(
@@ -1647,6 +1693,9 @@ class UICatListDisplay(UIContainer):
         )
         if game_setting_get("dark mode"):
             self._favor_circle.set_alpha(150)
+        self._no_favor_circle = pygame.Surface(
+            self._favor_circle.get_size(), pygame.SRCALPHA
+        )
 
         self.generate_grid()
 
@@ -1705,6 +1754,10 @@ class UICatListDisplay(UIContainer):
         [sprite.kill() for sprite in self.cat_sprites.values()]
         [name.kill() for name in self.cat_names.values()]
         [favor.kill() for favor in self.favor_indicator.values()]
+        self.cat_sprites.clear()
+        self.cat_names.clear()
+        self.favor_indicator.clear()
+        self._favor_shown.clear()
         self.next_button = None
         self.prev_button = None
         self.first_button = None
@@ -1734,7 +1787,8 @@ class UICatListDisplay(UIContainer):
 
     def _display_cats(self):
         """
-        creates the cat display
+        creates the cat display. The sprites, names and favourite indicators already on display are
+        given the cats of the new page, and only the ones left over are killed.
         """
         self.current_page = max(1, min(self.current_page, len(self.cat_chunks)))
 
@@ -1745,31 +1799,51 @@ class UICatListDisplay(UIContainer):
             self.total_pages = len(self.cat_chunks)
             display_cats = self.cat_chunks[self.current_page - 1]
 
-        [sprite.kill() for sprite in self.cat_sprites.values()]
-        [name.kill() for name in self.cat_names.values()]
-        [favor.kill() for favor in self.favor_indicator.values()]
+        # names can't change theme, so make them again if the theme changed
+        if self.text_theme != self._names_theme:
+            [name.kill() for name in self.cat_names.values()]
+            self.cat_names.clear()
+            self._names_theme = self.text_theme
 
         show_fav = get_clan_setting("show fav")
 
-        # FAVOURITE ICON
-        if show_fav:
-            fav_indexes = [
-                display_cats.index(cat) for cat in display_cats if cat.favourite
-            ]
-            [self.create_favor_indicator(i, self.boxes[i]) for i in fav_indexes]
-
-        # CAT SPRITE
-        [
-            self.create_cat_button(i, kitty, self.boxes[i])
-            for i, kitty in enumerate(display_cats)
-        ]
-
-        # CAT NAME
-        if self.show_names:
-            [
+        for i, kitty in enumerate(display_cats):
+            if f"sprite{i}" in self.cat_sprites:
+                self.update_favor_indicator(i, show_fav and kitty.favourite)
+                self.update_cat_button(i, kitty)
+            else:
+                # FAVOURITE ICON, made first so it's drawn under the sprite
+                self.create_favor_indicator(i, self.boxes[i])
+                self.update_favor_indicator(i, show_fav and kitty.favourite)
+                # CAT SPRITE
+                self.create_cat_button(i, kitty, self.boxes[i])
+
+            # CAT NAME
+            if not self.show_names:
+                continue
+            if f"name{i}" in self.cat_names:
+                self.update_name(i, kitty)
+            else:
                 self.create_name(i, kitty, self.boxes[i])
-                for i, kitty in enumerate(display_cats)
-            ]
+
+        for i in range(len(display_cats), len(self.boxes)):
+            self.kill_cat(i)
+
+    def kill_cat(self, i):
+        """
+        kills the sprite, name and favourite indicator in a spot of the grid, if there are any
+        :param i: the spot in the grid
+        """
+        sprite = self.cat_sprites.pop(f"sprite{i}", None)
+        if sprite:
+            sprite.kill()
+        name = self.cat_names.pop(f"name{i}", None)
+        if name:
+            name.kill()
+        favor = self.favor_indicator.pop(f"favor{i}", None)
+        if favor:
+            favor.kill()
+        self._favor_shown.pop(f"favor{i}", None)
 
     def create_cat_button(self, i, kitty, container):
         self.cat_sprites[f"sprite{i}"] = UISpriteButton(
@@ -1785,6 +1859,14 @@ class UICatListDisplay(UIContainer):
             anchors={"centerx": "centerx"},
         )
 
+    def update_cat_button(self, i, kitty):
+        sprite = self.cat_sprites[f"sprite{i}"]
+        sprite.set_sprite(kitty.sprite)
+        sprite.button.set_id(kitty.ID)
+        sprite.button.cat_object = kitty
+        if self.tool_tip_name:
+            sprite.button.set_tooltip(str(kitty.name))
+
     def create_name(self, i, kitty, container):
         self.cat_names[f"name{i}"] = pygame_gui.elements.UILabel(
             pygame.Rect((0, 0), (container.rect[2], ui_scale_value(30))),
@@ -1797,15 +1879,34 @@ class UICatListDisplay(UIContainer):
             },
         )
 
+    def update_name(self, i, kitty):
+        self.cat_names[f"name{i}"].set_text(
+            shorten_text_to_fit(str(kitty.name), 220, 30)
+        )
+
     def create_favor_indicator(self, i, container):
         self.favor_indicator[f"favor{i}"] = pygame_gui.elements.UIImage(
             ui_scale(pygame.Rect((0, 15), (50, 50))),
-            self._favor_circle,
+            self._no_favor_circle,
             object_id=f"favor_circle{i}",
             container=container,
             starting_height=1,
             anchors={"centerx": "centerx"},
         )
+        self._favor_shown[f"favor{i}"] = False
+
+    def update_favor_indicator(self, i, favourite: bool):
+        """
+        shows or clears the favourite marker in a spot of the grid
+        :param i: the spot in the grid
+        :param favourite: whether the cat in this spot should be marked as a favourite
+        """
+        if self._favor_shown[f"favor{i}"] == favourite:
+            return
+        self.favor_indicator[f"favor{i}"].set_image(
+            self._favor_circle if favourite else self._no_favor_circle
+        )
+        self._favor_shown[f"favor{i}"] = favourite
 
     def _update_arrow_buttons(self):
         """
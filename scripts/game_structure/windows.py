@@ -21,6 +21,7 @@ from scripts.cat.cats import Cat
 from scripts.cat.history import History
 from scripts.cat.names import Name
 from scripts.cat.save_load import save_cats
+from scripts.game_structure.game.save_load.clan_files import reset_clan_files
 from scripts.game_structure import image_cache
 from scripts.game_structure.game.switches import (
     Switch,
@@ -535,6 +536,8 @@ class DeleteCheck(UIWindow):
         if event.type == pygame_gui.UI_BUTTON_START_PRESS:
             if event.ui_element == self.delete_it_button:
                 rempath = get_save_dir() + "/" + self.clan_name
+                # an open packed save file can't be deleted on Windows
+                reset_clan_files()
                 shutil.rmtree(rempath)
                 if os.path.exists(rempath + "clan.json"):
                     os.remove(rempath + "clan.json")
@@ -1667,13 +1670,13 @@ class RelationshipLog(UIWindow):
             relationship.opposite_relationship
             and len(relationship.opposite_relationship.log) > 0
         ):
-            opposite_log = relationship.opposite_relationship.log.copy()
+            opposite_log = list(relationship.opposite_relationship.log)
             opposite_log.reverse()
             opposite_log_string = (
                 f"{f'<br>-----------------------------<br>'.join(opposite_log)}<br>"
             )
 
-        log = relationship.log.copy()
+        log = list(relationship.log)
         log.reverse()
         log_string = (
             f"{f'<br>-----------------------------<br>'.join(log)}<br>"
@@ -0,0 +1,424 @@
+"""
+Headless moon-skip runner.
+
+Loads a save without opening a game window and runs `Events.one_moon` back-to-back,
+then reports how fast it went. Run it from the root of the repository:
+
+    python -m scripts.headless --moons 50
+    python -m scripts.headless --clan Thunder --moons 200 --seed 3 --json
+    python -m scripts.headless --memory
+
+pygame still has to be imported (a lot of game modules touch it at import time), so this
+forces SDL's dummy video and audio drivers before anything else gets loaded. No window is
+ever shown and no audio device is opened.
+
+By default the save on disk is left untouched: autosave is switched off for the run, and
+nothing is written unless `--save` is given. The clan's own autosave setting is put back
+before saving, so `--save` doesn't turn it off for good.
+"""
+
+import os
+
+# these have to be set before pygame is imported anywhere
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import contextlib
+import gc
+import logging
+import random
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+import ujson
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+
+def _peak_rss() -> Optional[int]:
+    """
+    :return: Peak resident set size of this process in bytes, or None if the platform can't tell us.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def load_clan(clan_name: str = None) -> str:
+    """
+    Loads a clan the same way the game does on startup, minus the UI and sprites.
+    :param clan_name: The save folder to load. Defaults to the currently selected clan.
+    :return: The name of the clan that was loaded
+    """
+    from scripts.clan import clan_class
+    from scripts.game_structure import game
+    from scripts.game_structure.game.save_load import read_clans
+    from scripts.game_structure.game.switches import switch_set_value, Switch
+    from scripts.game_structure.load_cat import load_cats, version_convert
+
+    clan_list = read_clans()
+    if not clan_list:
+        raise FileNotFoundError("No clans found in the save directory.")
+    if clan_name is not None:
+        if clan_name not in clan_list:
+            raise FileNotFoundError(f"There is no clan called {clan_name}.")
+        clan_list.remove(clan_name)
+        clan_list.insert(0, clan_name)
+
+    switch_set_value(Switch.clan_list, clan_list)
+    switch_set_value(Switch.clan_name, clan_list[0])
+
+    game.cur_events_list.clear()
+    game.patrol_cats.clear()
+    game.patrolled.clear()
+    game.clan = None
+
+    load_cats()
+    version_info = clan_class.load_clan()
+    version_convert(version_info)
+    game.load_events()
+
+    return clan_list[0]
+
+
+def save_clan():
+    """Writes the loaded clan back to disk, the same way autosave does."""
+    from scripts.cat.cats import Cat
+    from scripts.cat.save_load import save_cats
+    from scripts.game_structure import game
+    from scripts.game_structure.game.switches import switch_get_value, Switch
+
+    save_cats(switch_get_value(Switch.clan_name), Cat, game)
+    game.clan.save_clan()
+    game.clan.save_pregnancy(game.clan)
+    game.save_events()
+
+
+def run_moons(
+    moons: int,
+    clan_name: str = None,
+    *,
+    seed: int = None,
+    autosave: bool = False,
+    save: bool = False,
+    trace_memory: bool = False,
+    profile: bool = False,
+    quiet: bool = False,
+) -> Dict:
+    """
+    Loads a clan and skips the given amount of moons.
+    :param moons: How many moons to skip
+    :param clan_name: The clan to load, defaults to the currently selected clan
+    :param seed: Seed for `random`, so runs can be repeated
+    :param autosave: If False, the clan's autosave setting is turned off for the run
+    :param save: If True, the clan is saved once all moons are done
+    :param trace_memory: If True, use tracemalloc to find the peak Python heap size. This slows the run down.
+    :param profile: If True, time each phase of the moon skip with the moon profiler
+    :param quiet: If True, anything the game prints while loading and skipping is thrown away
+    :return: A dict with the results of the run
+    """
+    if seed is not None:
+        random.seed(seed)
+    if trace_memory:
+        tracemalloc.start()
+
+    phases = {}
+    output = open(os.devnull, "w", encoding="utf-8") if quiet else sys.stdout
+
+    with contextlib.redirect_stdout(output):
+        start = time.perf_counter()
+        # imported here so the cost of importing the game shows up in the report
+        from scripts.cat.cats import Cat
+        from scripts.clan_package.settings import get_clan_setting, set_clan_setting
+        from scripts.events import events_class
+        from scripts.game_structure import game
+        from scripts.game_structure.localization import get_lang_resource_cache_stats
+        from scripts.housekeeping.moon_profiler import moon_profiler
+
+        phases["import"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        clan_name = load_clan(clan_name)
+        phases["load"] = time.perf_counter() - start
+
+        # the setting is saved with the clan, so it's put back before anything could save it
+        clan_autosave = get_clan_setting("autosave")
+        if not autosave:
+            set_clan_setting("autosave", False)
+
+        if profile:
+            moon_profiler.enable()
+
+        cats_at_start = len(Cat.all_cats)
+        moon_times: List[float] = []
+        gc.collect()
+        start = time.perf_counter()
+        try:
+            for _ in range(moons):
+                moon_start = time.perf_counter()
+                events_class.one_moon()
+                moon_times.append(time.perf_counter() - moon_start)
+        finally:
+            set_clan_setting("autosave", clan_autosave)
+        phases["moons"] = time.perf_counter() - start
+
+        moon_phases = None
+        if profile:
+            moon_phases = moon_profiler.summary
+            moon_profiler.disable()
+
+        if save:
+            start = time.perf_counter()
+            save_clan()
+            phases["save"] = time.perf_counter() - start
+
+    if quiet:
+        output.close()
+
+    report = {
+        "clan": clan_name,
+        "moons": moons,
+        "clan_age": game.clan.age,
+        "cats_at_start": cats_at_start,
+        "cats_at_end": len(Cat.all_cats),
+        "alive_in_clan_at_end": sum(
+            1 for c in Cat.all_cats.values() if c.status.alive_in_player_clan
+        ),
+        "moons_per_second": (
+            moons / phases["moons"] if moons and phases["moons"] else 0.0
+        ),
+        "phases": phases,
+        "moon_times": {
+            "min": min(moon_times, default=0.0),
+            "mean": sum(moon_times) / len(moon_times) if moon_times else 0.0,
+            "max": max(moon_times, default=0.0),
+        },
+        "peak_rss": _peak_rss(),
+        "peak_traced": None,
+        "moon_phases": moon_phases,
+        "profile_log": moon_profiler.output_path if profile else None,
+        "lang_resources": get_lang_resource_cache_stats(),
+    }
+
+    if trace_memory:
+        report["peak_traced"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return report
+
+
+def measure_memory(clan_name: str = None, *, quiet: bool = False) -> Dict:
+    """
+    Loads a clan under tracemalloc and works out how much memory it takes per cat, both
+    with the relationships as they're stored and with a Relationship made for every pair.
+    It also copies every Relationship into an instance with and without __slots__, to
+    show what the slots save.
+    :param clan_name: The clan to load, defaults to the currently selected clan
+    :param quiet: If True, anything the game prints while loading is thrown away
+    :return: A dict with the results
+    """
+    output = open(os.devnull, "w", encoding="utf-8") if quiet else sys.stdout
+
+    with contextlib.redirect_stdout(output):
+        from scripts.cat.cats import Cat
+        from scripts.cat_relations.relationship import Relationship
+
+        class _Unslotted:
+            """Keeps the same attributes in an instance __dict__, like before"""
+
+        def _copies(relationships, cls):
+            copies = []
+            for relationship in relationships:
+                copy = object.__new__(cls)
+                for name in Relationship.__slots__:
+                    if name != "__weakref__":
+                        setattr(copy, name, getattr(relationship, name))
+                copies.append(copy)
+            return copies
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            clan_name = load_clan(clan_name)
+            gc.collect()
+            loaded = tracemalloc.get_traced_memory()[0]
+            relationships = [
+                relationship
+                for cat in Cat.all_cats.values()
+                for relationship in cat.relationships.values()
+            ]
+            made = tracemalloc.get_traced_memory()[0]
+
+            slotted = _copies(relationships, Relationship)
+            slotted_bytes = tracemalloc.get_traced_memory()[0] - made
+            del slotted
+            gc.collect()
+            start = tracemalloc.get_traced_memory()[0]
+            unslotted = _copies(relationships, _Unslotted)
+            unslotted_bytes = tracemalloc.get_traced_memory()[0] - start
+            del unslotted
+        finally:
+            tracemalloc.stop()
+
+    if quiet:
+        output.close()
+
+    cats = len(Cat.all_cats) or 1
+    count = len(relationships) or 1
+    return {
+        "clan": clan_name,
+        "cats": len(Cat.all_cats),
+        "relationships": len(relationships),
+        "bytes_per_cat_loaded": loaded // cats,
+        "bytes_per_cat_made": made // cats,
+        "bytes_per_relationship_slotted": slotted_bytes // count,
+        "bytes_per_relationship_unslotted": unslotted_bytes // count,
+    }
+
+
+def format_memory_report(report: Dict) -> str:
+    """
+    :param report: A report from `measure_memory`
+    :return: The report as readable text
+    """
+    return "\n".join(
+        [
+            f"Clan: {report['clan']}",
+            f"Cats: {report['cats']}, relationships: {report['relationships']}",
+            f"Bytes per cat as stored: {report['bytes_per_cat_loaded']}",
+            "Bytes per cat with every Relationship made: "
+            f"{report['bytes_per_cat_made']}",
+            "Bytes per Relationship instance: "
+            f"{report['bytes_per_relationship_slotted']} with __slots__, "
+            f"{report['bytes_per_relationship_unslotted']} without",
+        ]
+    )
+
+
+def format_report(report: Dict) -> str:
+    """
+    :param report: A report from `run_moons`
+    :return: The report as readable text
+    """
+
+    def _mib(value):
+        return "n/a" if value is None else f"{value / (1024 * 1024):.1f} MiB"
+
+    lines = [
+        f"Clan: {report['clan']} (now {report['clan_age']} moons old)",
+        f"Cats: {report['cats_at_start']} at start, {report['cats_at_end']} at end "
+        f"({report['alive_in_clan_at_end']} alive in the clan)",
+        f"Moons skipped: {report['moons']}",
+        f"Moons per second: {report['moons_per_second']:.3f}",
+        "Phases:",
+    ]
+    lines.extend(
+        f"    {name:<8}{seconds:9.3f}s" for name, seconds in report["phases"].items()
+    )
+    lines.append(
+        "Per moon: min {min:.3f}s, mean {mean:.3f}s, max {max:.3f}s".format(
+            **report["moon_times"]
+        )
+    )
+    lines.append(f"Peak RSS: {_mib(report['peak_rss'])}")
+    lines.append(
+        "Lang resources: {resources} cached ({size} characters), "
+        "{hits} hits, {misses} misses".format(**report["lang_resources"])
+    )
+    if report["peak_traced"] is not None:
+        lines.append(f"Peak Python heap: {_mib(report['peak_traced'])}")
+    if report["moon_phases"]:
+        from scripts.housekeeping.moon_profiler import MoonProfiler
+
+        lines.append("Slowest moon phases (all moons):")
+        lines.extend(
+            f"    {line}"
+            for line in MoonProfiler.format_phases(report["moon_phases"], 15)
+        )
+        lines.append(f"Per-moon reports: {report['profile_log']}")
+    return "\n".join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m scripts.headless",
+        description="Skip moons on a save without opening the game, and time it.",
+    )
+    parser.add_argument(
+        "--clan", help="clan to load, defaults to the currently selected clan"
+    )
+    parser.add_argument(
+        "--moons", type=int, default=10, help="number of moons to skip (default: 10)"
+    )
+    parser.add_argument("--seed", type=int, help="seed the random number generator")
+    parser.add_argument(
+        "--autosave",
+        action="store_true",
+        help="keep the clan's autosave setting instead of turning it off",
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="save the clan once the run is done"
+    )
+    parser.add_argument(
+        "--tracemalloc",
+        action="store_true",
+        help="measure the peak Python heap (slows the run down)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="time each phase of the moon skip and list the slowest ones",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="show everything the game prints while it runs",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="measure how much memory the clan takes per cat instead of skipping moons",
+    )
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+
+    if args.memory:
+        report = measure_memory(args.clan, quiet=not args.verbose)
+        if args.json:
+            print(ujson.dumps(report, indent=4))
+        else:
+            print(format_memory_report(report))
+        return 0
+
+    report = run_moons(
+        args.moons,
+        args.clan,
+        seed=args.seed,
+        autosave=args.autosave,
+        save=args.save,
+        trace_memory=args.tracemalloc,
+        profile=args.profile,
+        quiet=not args.verbose,
+    )
+
+    if args.json:
+        print(ujson.dumps(report, indent=4))
+    else:
+        print(format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
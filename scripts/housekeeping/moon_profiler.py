@@ -0,0 +1,213 @@
+"""
+Opt-in timing of the moon skip.
+
+`Events.one_moon` wraps each of its phases in `moon_profiler.phase(...)`. While the
+profiler is disabled (the default) those calls hand back a do-nothing context manager,
+so the moon skip pays next to nothing for them.
+
+Once enabled, every moon produces a report of how long each phase took. Phases that run
+once per cat (everything inside `one_moon_cat`) are added up, and you also get how often
+they ran and the slowest single call. Nested phases are keyed by their full path,
+e.g. `one_moon_cat/thoughts`.
+
+Reports are appended as JSON lines to `moonprofile_<time>.jsonl` in the log directory.
+Only the most recent ones are kept in memory, with the latest in `moon_profiler.last_report`
+for the debug console, and the phases of every moon are added up in `moon_profiler.summary`.
+"""
+
+import logging
+import time
+from collections import deque
+from contextlib import nullcontext
+from typing import Deque, Dict, Iterable, List, Optional
+
+import ujson
+
+from scripts.housekeeping.datadir import get_log_dir
+
+logger = logging.getLogger(__name__)
+
+MAX_REPORTS = 100
+"""How many of the most recent reports are kept in memory"""
+
+_NULL_CONTEXT = nullcontext()
+
+
+class _Phase:
+    """Context manager that times a single run of a phase."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "MoonProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.profiler.stack.append(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        elapsed = time.perf_counter() - self.start
+        key = "/".join(self.profiler.stack)
+        self.profiler.stack.pop()
+        self.profiler.record(key, elapsed)
+        return False
+
+
+class _Moon:
+    """Context manager that collects every phase of a single moon skip into one report."""
+
+    __slots__ = ("profiler", "report", "start")
+
+    def __init__(self, profiler: "MoonProfiler"):
+        self.profiler = profiler
+        self.report = {}
+        self.start = 0.0
+
+    def __enter__(self) -> Dict:
+        self.profiler.phases = {}
+        self.profiler.stack = []
+        self.start = time.perf_counter()
+        return self.report
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.report["total"] = time.perf_counter() - self.start
+        self.report["completed"] = exc_type is None
+        self.report["phases"] = self.profiler.phases
+        self.profiler.finish_moon(self.report)
+        return False
+
+
+class MoonProfiler:
+    """Collects per-phase timings for the moon skip. Use the `moon_profiler` instance."""
+
+    def __init__(self):
+        self.enabled = False
+        self.output_path: Optional[str] = None
+        self.write_to_log = True
+        self.last_report: Optional[Dict] = None
+        self.reports: Deque[Dict] = deque(maxlen=MAX_REPORTS)
+        """The most recent reports since the profiler was last enabled. The rest are only in the log."""
+        self.summary: Dict[str, Dict[str, float]] = {}
+        """The phases of every moon since the profiler was last enabled, added up"""
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.stack: List[str] = []
+
+    def enable(self, write_to_log: bool = True):
+        """
+        Starts profiling moon skips.
+        :param write_to_log: If True, each report is also appended to a file in the log directory
+        """
+        if self.enabled:
+            return
+        self.enabled = True
+        self.write_to_log = write_to_log
+        self.reports.clear()
+        self.summary = {}
+        self.output_path = (
+            f"{get_log_dir()}/moonprofile_{time.strftime('%Y%m%d_%H%M%S')}.jsonl"
+            if write_to_log
+            else None
+        )
+
+    def disable(self):
+        """Stops profiling moon skips. The last report is kept."""
+        self.enabled = False
+        self.phases = {}
+        self.stack = []
+
+    def moon(self):
+        """
+        Wrap a whole moon skip in this. Yields a dict that the caller can add extra information to,
+        which ends up in the report.
+        """
+        if not self.enabled:
+            return nullcontext({})
+        return _Moon(self)
+
+    def phase(self, name: str):
+        """
+        Wrap a phase of the moon skip in this to time it.
+        :param name: Name of the phase. Nested phases are joined with a slash.
+        """
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return _Phase(self, name)
+
+    def record(self, key: str, elapsed: float):
+        """Adds a single timed run to the phase with the given key"""
+        entry = self.phases.get(key)
+        if entry is None:
+            self.phases[key] = {"total": elapsed, "calls": 1, "max": elapsed}
+            return
+        entry["total"] += elapsed
+        entry["calls"] += 1
+        if elapsed > entry["max"]:
+            entry["max"] = elapsed
+
+    def finish_moon(self, report: Dict):
+        """Stores the report of a finished moon, and writes it to the log if needed"""
+        self.last_report = report
+        self.reports.append(report)
+        self._add_phases(self.summary, report["phases"])
+        self.phases = {}
+        self.stack = []
+
+        if not self.output_path:
+            return
+        try:
+            with open(self.output_path, "a", encoding="utf-8") as write_file:
+                write_file.write(ujson.dumps(report) + "\n")
+        except OSError:
+            logger.warning(
+                "Couldn't write moon profile to %s", self.output_path, exc_info=True
+            )
+
+    @staticmethod
+    def _add_phases(
+        summary: Dict[str, Dict[str, float]], phases: Dict[str, Dict[str, float]]
+    ):
+        """Adds the phases of one report to a summary"""
+        for key, entry in phases.items():
+            if key not in summary:
+                summary[key] = dict(entry)
+                continue
+            summary[key]["total"] += entry["total"]
+            summary[key]["calls"] += entry["calls"]
+            summary[key]["max"] = max(summary[key]["max"], entry["max"])
+
+    @staticmethod
+    def summarize(reports: Iterable[Dict]) -> Dict[str, Dict[str, float]]:
+        """
+        Adds up the phases of several reports.
+        :param reports: Reports from `finish_moon`
+        :return: Dict of phase key to its total time, number of calls and slowest call
+        """
+        summary = {}
+        for report in reports:
+            MoonProfiler._add_phases(summary, report["phases"])
+        return summary
+
+    @staticmethod
+    def format_phases(
+        phases: Dict[str, Dict[str, float]], limit: int = None
+    ) -> List[str]:
+        """
+        :param phases: Phases from a report or from `summarize`
+        :param limit: Only include the slowest phases
+        :return: One line of text per phase, slowest first
+        """
+        ordered = sorted(
+            phases.items(), key=lambda item: item[1]["total"], reverse=True
+        )
+        if limit is not None:
+            ordered = ordered[:limit]
+        return [
+            f"{entry['total']:8.3f}s {int(entry['calls']):6d}x  {key}"
+            for key, entry in ordered
+        ]
+
+
+moon_profiler = MoonProfiler()
@@ -1,4 +1,5 @@
-from typing import Dict
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional
 
 import i18n
 import pygame
@@ -40,6 +41,19 @@ from scripts.utility import (
 )
 
 
+class EventRow:
+    """The widgets that show one event in the event list. Rows are reused for other events as the list is
+    scrolled."""
+
+    def __init__(self, panel: pygame_gui.elements.UIPanel, text_box):
+        self.panel = panel
+        self.text_box = text_box
+        self.cat_button: Optional[IDImageButton] = None
+        self.background_colour = panel.background_colour
+        """The panel's colour from the theme, for rows that aren't striped"""
+        self.striped = False
+
+
 class EventsScreen(Screens):
     current_display = "all events"
     selected_display = "all events"
@@ -79,8 +93,14 @@ class EventsScreen(Screens):
         self.alert = {}
 
         self.event_display = None
-        self.event_display_containers = []
-        self.event_display_boxes = []
+        self.event_rows: Dict[int, EventRow] = {}
+        """The rows on display, by their index in display_events"""
+        self.spare_event_rows: List[EventRow] = []
+        """Hidden rows, ready to show the next event that scrolls into view"""
+        self.event_row_heights = {}
+        """The height of each event's row, for events that have been laid out"""
+        self.event_row_width = None
+        self.event_scroll_offset = None
         self.cat_profile_buttons = []
         self.involved_cat_container = None
         self.involved_cat_buttons = []
@@ -139,6 +159,8 @@ class EventsScreen(Screens):
                 )
             elif element in self.involved_cat_buttons:
                 self.make_cat_buttons(element)
+                # the row may have grown to fit the cat buttons
+                self.update_visible_events(force=True)
             elif element in self.cat_profile_buttons:
                 self.save_scroll_position()
                 switch_set_value(Switch.cat, element.cat_id)
@@ -387,6 +409,11 @@ class EventsScreen(Screens):
         """
         if self.event_display:
             self.event_display.kill()
+        self.event_rows = {}
+        self.spare_event_rows = []
+        self.involved_cat_buttons = []
+        self.open_involved_cat_button = None
+        self.event_scroll_offset = None
 
         rect = pygame.Rect(
             ui_scale_offset((211, 275)),
@@ -400,6 +427,7 @@ class EventsScreen(Screens):
             starting_height=1,
             manager=MANAGER,
             allow_scroll_y=True,
+            should_grow_automatically=False,
         )
         self.events_frame.join_focus_sets(self.event_display)
 
@@ -562,11 +590,12 @@ class EventsScreen(Screens):
             x for x in game.cur_events_list if "other_clans" in x.types
         ]
         self.misc_events = [x for x in game.cur_events_list if "misc" in x.types]
+        self.event_row_heights = {}
 
     def update_events_display(self):
         """
-        Kills and recreates the event display, updates the clan info, sets the event display scroll position if it was
-        previously saved
+        Shows the events of the current tab, updates the clan info, sets the event display scroll position if it was
+        previously saved. Only the rows in or near view are laid out, see update_visible_events.
         """
 
         # UPDATE CLAN INFO
@@ -578,29 +607,63 @@ class EventsScreen(Screens):
             "screens.events.age", text_kwargs={"count": game.clan.age}
         )
 
-        self.make_event_scrolling_container()
-
-        for ele in self.event_display_containers:
-            ele.kill()
-        self.event_display_containers = []
-
-        for ele in self.event_display_boxes:
-            ele.kill()
-        self.event_display_boxes = []
+        if not self.event_display or not self.event_display.alive():
+            self.make_event_scrolling_container()
 
+        if self.involved_cat_container:
+            self.involved_cat_container.kill()
+            self.involved_cat_container = None
         for ele in self.cat_profile_buttons:
             ele.kill()
         self.cat_profile_buttons = []
+        self.open_involved_cat_button = None
 
-        for ele in self.involved_cat_buttons:
-            ele.kill()
-        self.involved_cat_buttons = []
+        for index in list(self.event_rows):
+            self.release_event_row(index)
 
         # Stop if Clan is new, so that events from previously loaded Clan don't show up
         if game.clan.age == 0:
-            return
+            self.display_events = []
+
+        for event_object in [
+            event for event in self.display_events if not isinstance(event.text, str)
+        ]:
+            print(
+                f"Incorrectly Formatted Event: {event_object.text}, {type(event_object)}"
+            )
+            self.display_events.remove(event_object)
 
-        default_rect = pygame.Rect(
+        # heights only hold for the width they were laid out at
+        row_width = self.event_row_rect()[2]
+        if row_width != self.event_row_width:
+            self.event_row_width = row_width
+            self.event_row_heights = {}
+
+        # start the new list from the top
+        self.event_display.scrollable_container.set_relative_position((0, 0))
+        self.update_visible_events(force=True)
+
+        # this HAS TO UPDATE before saved scroll position can be set
+        self.event_display.scrollable_container.update(1)
+
+        # don't ask me why we have to redefine these dimensions, we just do
+        # otherwise the scroll position save will break
+        self.event_display.set_dimensions(
+            (
+                self.event_display.get_relative_rect()[2],
+                self.event_display.get_relative_rect()[3],
+            )
+        )
+
+        # set saved scroll position
+        if switch_get_value(Switch.saved_scroll_positions).get(self.current_display):
+            self.event_display.vert_scroll_bar.set_scroll_from_start_percentage(
+                switch_get_value(Switch.saved_scroll_positions)[self.current_display]
+            )
+
+    def event_row_rect(self) -> pygame.Rect:
+        """The size of an event row before it's fitted to its text"""
+        return pygame.Rect(
             ui_scale_offset((5, 0)),
             (
                 self.event_display.get_relative_rect()[2]
@@ -610,110 +673,175 @@ class EventsScreen(Screens):
             ),
         )
 
-        catbutton_rect = ui_scale(pygame.Rect((0, 0), (34, 34)))
-        catbutton_rect.topright = ui_scale_offset((-10, 5))
-
-        anchor = {"top": "top"}
+    def event_row_height(self, index: int) -> int:
+        """
+        :param index: Index of the event in display_events
+        :return: The height of the event's row. Rows that haven't been laid out yet are given the average height.
+        """
+        row = self.event_rows.get(index)
+        if row:
+            return row.panel.get_relative_rect()[3]
+        height = self.event_row_heights.get(self.display_events[index])
+        if height is None:
+            if self.event_row_heights:
+                height = sum(self.event_row_heights.values()) // len(
+                    self.event_row_heights
+                )
+            else:
+                height = ui_scale_value(60)
+        return height
 
-        alternate_color = (
-            pygame.Color(87, 76, 55)
-            if game_setting_get("dark mode")
-            else pygame.Color(167, 148, 111)
-        )
+    def update_visible_events(self, force=False):
+        """
+        Lays out the rows in or near view of the event display and hides the rest. Runs every frame, but only does
+        anything once the list has been scrolled.
+        :param force: Lay the rows out again even if the list hasn't been scrolled
+        """
+        if not self.event_display or not self.event_display.alive():
+            return
+        scrollable = self.event_display.scrollable_container
+        offset = -scrollable.get_relative_rect()[1]
+        if offset == self.event_scroll_offset and not force:
+            return
+        start_offset = offset
+
+        # rows within a screen's height of the view are kept ready, so scrolling doesn't show gaps
+        view_height = self.event_display.get_relative_rect()[3]
+        while True:
+            tops = [0]
+            for index in range(len(self.display_events)):
+                tops.append(tops[-1] + self.event_row_height(index))
+            first = max(bisect_right(tops, offset - view_height) - 1, 0)
+            last = min(
+                bisect_left(tops, offset + view_height * 2), len(self.display_events)
+            )
 
-        for i, event_object in enumerate(self.display_events):
-            if not isinstance(event_object.text, str):
-                print(
-                    f"Incorrectly Formatted Event: {event_object.text}, {type(event_object)}"
-                )
-                self.display_events.remove(event_object)
-                continue
+            for index in list(self.event_rows):
+                if not first <= index < last:
+                    self.release_event_row(index)
+
+            new_rows = [i for i in range(first, last) if i not in self.event_rows]
+            if not new_rows:
+                break
+            for index in new_rows:
+                estimated_height = self.event_row_height(index)
+                self.show_event_row(index)
+                # keep the events in view still if rows above them turn out taller or shorter than guessed
+                if tops[index] < offset:
+                    offset += self.event_row_height(index) - estimated_height
+
+        for index, row in self.event_rows.items():
+            row.panel.set_relative_position((self.event_row_rect()[0], tops[index]))
+
+        total_height = tops[-1]
+        offset = max(min(offset, total_height - view_height), 0)
+        if offset != start_offset or total_height != scrollable.get_relative_rect()[3]:
+            scrollable.set_relative_position((0, -offset))
+            self.event_display.set_scrollable_area_dimensions(
+                (scrollable.get_relative_rect()[2], total_height)
+            )
+        self.event_scroll_offset = offset
 
-            display_element_container = pygame_gui.elements.UIPanel(
-                default_rect,
+    def show_event_row(self, index: int):
+        """
+        Puts an event into a row, reusing a hidden row if there is one
+        :param index: Index of the event in display_events
+        """
+        event_object = self.display_events[index]
+        row_rect = self.event_row_rect()
+
+        if self.spare_event_rows:
+            row = self.spare_event_rows.pop()
+            row.panel.show()
+            row.text_box.set_text(
+                event_object.text, text_kwargs=getattr(event_object, "cat_dict")
+            )
+        else:
+            panel = pygame_gui.elements.UIPanel(
+                row_rect,
                 5,
                 MANAGER,
                 container=self.event_display,
                 element_id="event_panel",
                 object_id="#dark" if game_setting_get("dark mode") else None,
                 margins={"top": 0, "bottom": 0, "left": 0, "right": 0},
-                anchors=anchor,
             )
-
-            self.event_display_containers.append(display_element_container)
-
-            if i % 2 == 0:
-                display_element_container.background_colour = alternate_color
-                display_element_container.rebuild()
-
             # TEXT BOX
-            display_element_event = pygame_gui.elements.UITextBox(
+            text_box = pygame_gui.elements.UITextBox(
                 event_object.text,
                 ui_scale(pygame.Rect((0, 0), (509, -1))),
                 object_id=get_text_box_theme("#text_box_30_horizleft"),
                 starting_height=1,
-                container=display_element_container,
+                container=panel,
                 manager=MANAGER,
                 text_kwargs=getattr(event_object, "cat_dict"),
                 anchors={"left": "left", "right": "right"},
             )
+            row = EventRow(panel, text_box)
 
-            self.event_display_boxes.append(display_element_event)
-
-            if event_object.cats_involved:
-                involved_cat_button = IDImageButton(
+        striped = index % 2 == 0
+        if striped != row.striped:
+            row.striped = striped
+            row.panel.background_colour = (
+                (
+                    pygame.Color(87, 76, 55)
+                    if game_setting_get("dark mode")
+                    else pygame.Color(167, 148, 111)
+                )
+                if striped
+                else row.background_colour
+            )
+            row.panel.rebuild()
+
+        text_height = row.text_box.get_relative_rect()[3]
+        height = text_height
+        if event_object.cats_involved:
+            catbutton_rect = ui_scale(pygame.Rect((0, 0), (34, 34)))
+            catbutton_rect.topright = ui_scale_offset((-10, 5))
+            catbutton_rect.top += text_height
+            if row.cat_button:
+                row.cat_button.set_relative_position(catbutton_rect.topleft)
+                row.cat_button.show()
+                row.cat_button.enable()
+            else:
+                row.cat_button = IDImageButton(
                     catbutton_rect,
                     Icon.CAT_HEAD,
                     get_button_dict(ButtonStyles.ICON, (34, 34)),
                     ids=event_object.cats_involved,
                     layer_starting_height=3,
                     object_id="@buttonstyles_icon",
-                    parent_element=display_element_container,
-                    container=display_element_container,
+                    parent_element=row.panel,
+                    container=row.panel,
                     manager=MANAGER,
-                    anchors={
-                        "right": "right",
-                        "top_target": display_element_event,
-                    },
-                )
-                self.involved_cat_buttons.append(involved_cat_button)
-
-            display_element_container.set_dimensions(
-                (
-                    default_rect[2],
-                    (
-                        display_element_event.get_relative_rect()[3]
-                        + (
-                            involved_cat_button.get_relative_rect()[3]
-                            + ui_scale_value(10)
-                        )
-                        if event_object.cats_involved
-                        else display_element_event.get_relative_rect()[3]
-                    ),
+                    anchors={"right": "right"},
                 )
-            )
-
-            anchor = {"top_target": display_element_container}
+                self.involved_cat_buttons.append(row.cat_button)
+            row.cat_button.ids = event_object.cats_involved
+            height += row.cat_button.get_relative_rect()[3] + ui_scale_value(10)
+        elif row.cat_button:
+            row.cat_button.hide()
 
-        del catbutton_rect
+        row.panel.set_dimensions((row_rect[2], height))
+        self.event_row_heights[event_object] = height
+        self.event_rows[index] = row
 
-        # this HAS TO UPDATE before saved scroll position can be set
-        self.event_display.scrollable_container.update(1)
-
-        # don't ask me why we have to redefine these dimensions, we just do
-        # otherwise the scroll position save will break
-        self.event_display.set_dimensions(
-            (
-                self.event_display.get_relative_rect()[2],
-                self.event_display.get_relative_rect()[3],
-            )
-        )
-
-        # set saved scroll position
-        if switch_get_value(Switch.saved_scroll_positions).get(self.current_display):
-            self.event_display.vert_scroll_bar.set_scroll_from_start_percentage(
-                switch_get_value(Switch.saved_scroll_positions)[self.current_display]
-            )
+    def release_event_row(self, index: int):
+        """
+        Hides the row showing an event, so it can be reused for another
+        :param index: Index of the event in display_events
+        """
+        row = self.event_rows.pop(index)
+        if row.cat_button and row.cat_button == self.open_involved_cat_button:
+            if self.involved_cat_container:
+                self.involved_cat_container.kill()
+                self.involved_cat_container = None
+            for ele in self.cat_profile_buttons:
+                ele.kill()
+            self.cat_profile_buttons = []
+            self.open_involved_cat_button = None
+        row.panel.hide()
+        self.spare_event_rows.append(row)
 
     def update_list_buttons(self):
         """
@@ -727,6 +855,7 @@ class EventsScreen(Screens):
     def on_use(self):
         super().on_use()
         self.loading_screen_on_use(self.events_thread, self.timeskip_done)
+        self.update_visible_events()
 
     def timeskip_done(self):
         """Various sorting and other tasks that must be done with the timeskip is over."""
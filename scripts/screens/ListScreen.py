@@ -5,6 +5,7 @@ import pygame
 import pygame_gui
 from pygame_gui.core import ObjectID
 
+from scripts.cat.cat_index import name_search
 from scripts.cat.cats import Cat
 from scripts.clan_package.settings import switch_clan_setting
 from scripts.clan_package.settings.clan_settings import (
@@ -79,6 +80,10 @@ class ListScreen(Screens):
         self.current_group = "your_clan"
         self.full_cat_list = []
         self.current_listed_cats = []
+        self.sorted_cat_list = None
+        """The full cat list as it was last sorted, it's sorted again if it's replaced"""
+        self.sorted_by = None
+        """The sort type the cat lists were last sorted by"""
 
         self.list_screen_container = None
 
@@ -488,6 +493,8 @@ class ListScreen(Screens):
     def exit_screen(self):
         self.cat_display.clear_display()
         self.cat_display = None
+        self.sorted_cat_list = None
+        self.sorted_by = None
         self.list_screen_container.kill()
         self.update_heading_text(self.clan_name)
 
@@ -563,8 +570,16 @@ class ListScreen(Screens):
         self.current_listed_cats = []
 
         # make sure cat list is the same everywhere else in the game.
-        Cat.sort_cats(self.full_cat_list)
-        Cat.sort_cats(Cat.all_cats_list)
+        # paging and searching don't change the order, so only sort when the list or sort type changes
+        sort_type = switch_get_value(Switch.sort_type)
+        if (
+            self.full_cat_list is not self.sorted_cat_list
+            or sort_type != self.sorted_by
+        ):
+            Cat.sort_cats(self.full_cat_list)
+            Cat.sort_cats(Cat.all_cats_list)
+            self.sorted_cat_list = self.full_cat_list
+            self.sorted_by = sort_type
 
         # adding in the guide if necessary, this ensures the guide isn't affected by sorting as we always want them to
         # be the first cat on the list
@@ -581,11 +596,9 @@ class ListScreen(Screens):
 
         search_text = search_text.strip()
         if search_text not in ("", "name search"):
-            self.current_listed_cats = [
-                cat
-                for cat in self.full_cat_list
-                if search_text.lower() in str(cat.name).lower()
-            ]
+            self.current_listed_cats = name_search.search(
+                self.full_cat_list, search_text
+            )
         else:
             self.current_listed_cats = self.full_cat_list.copy()
 
@@ -2136,6 +2136,7 @@ class MakeClanScreen(Screens):
         game.mediated.clear()
         game.patrolled.clear()
         save_load.faded_ids.clear()
+        save_load.faded_cat_cache.clear()
         Cat.outside_cats.clear()
         Patrol.used_patrols.clear()
         convert_camp = {1: "camp1", 2: "camp2", 3: "camp3", 4: "camp4"}
@@ -4,6 +4,7 @@ import i18n
 import pygame.transform
 import pygame_gui.elements
 
+from scripts.cat.cat_index import name_search
 from scripts.cat.cats import Cat
 from scripts.game_structure import image_cache, constants
 from scripts.game_structure import game
@@ -691,8 +692,9 @@ class RelationshipScreen(Screens):
         # Filter for search
         search_cats = []
         if search_text.strip() != "":
+            search_text = search_text.lower()
             for cat in self.filtered_cats:
-                if search_text.lower() in str(cat.cat_to.name).lower():
+                if search_text in name_search.lower_name(cat.cat_to):
                     search_cats.append(cat)
             self.filtered_cats = search_cats
 
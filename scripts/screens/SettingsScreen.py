@@ -21,6 +21,7 @@ from scripts.game_structure.game.settings import (
 # please don't do this. we have to.
 import scripts.game_structure.game.settings.settings as all_settings
 from scripts.game_structure import game
+from scripts.game_structure.localization import clear_lang_resource_cache
 from scripts.game_structure.ui_elements import (
     UIImageButton,
     UISurfaceImageButton,
@@ -199,6 +200,7 @@ class SettingsScreen(Screens):
                         self.checkboxes[MANAGER.get_locale()].enable()
                         MANAGER.set_locale(key)
                         i18n.config.set("locale", key)
+                        clear_lang_resource_cache()
                         self.checkboxes[key].disable()
                         game_setting_set("language", key)
                     else:
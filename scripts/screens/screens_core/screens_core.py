@@ -1,4 +1,9 @@
-from typing import Optional, Tuple
+import hashlib
+import logging
+import os
+import re
+from collections.abc import Mapping
+from typing import Dict, Optional, Sequence, Tuple, Union
 
 import pygame
 import pygame_gui
@@ -9,6 +14,7 @@ from scripts.game_structure.game.settings import game_setting_get
 from scripts.game_structure import game
 from scripts.game_structure.screen_settings import MANAGER
 from scripts.game_structure.ui_elements import UISurfaceImageButton, UIImageButton
+from scripts.housekeeping.datadir import get_cache_dir
 from scripts.housekeeping.version import get_version_info
 from scripts.ui.generate_box import get_box, BoxStyles
 from scripts.ui.generate_button import get_button_dict, ButtonStyles
@@ -22,6 +28,11 @@ from scripts.utility import (
     ui_scale_value,
 )
 
+logger = logging.getLogger(__name__)
+
+BG_CACHE_VERSION = 1
+"""Change this when the way backgrounds are made changes, so old cached backgrounds aren't used"""
+
 game_frame: Optional[pygame.Surface] = None
 core_vignette = pygame.image.load("resources/images/vignette.png")
 vignette: Optional[pygame.Surface] = None
@@ -444,87 +455,51 @@ def rebuild_bgs():
         "dark": {"default": bg_dark},
     }
 
-    temp_screen_size = scripts.game_structure.screen_settings.screen.get_size()
-
     default_fullscreen_bgs = {
-        "light": {
-            "default": pygame.transform.scale(bg, temp_screen_size),
-            "mainmenu_bg": pygame.transform.scale(
-                pygame.image.load("resources/images/menu_logoless.png").convert(),
-                temp_screen_size,
-            ),
-            "starclan": pygame.transform.scale(
-                pygame.image.load("resources/images/starclanbg.png").convert_alpha(),
-                temp_screen_size,
-            ),
-            "darkforest": pygame.transform.scale(
-                pygame.image.load("resources/images/darkforestbg.png").convert_alpha(),
-                temp_screen_size,
-            ),
-            "unknown_residence": pygame.transform.scale(
-                pygame.image.load("resources/images/urbg.png").convert(),
-                temp_screen_size,
-            ),
-        },
-        "dark": {
-            "default": pygame.transform.scale(bg_dark, temp_screen_size),
-            "mainmenu_bg": pygame.transform.scale(
-                pygame.image.load("resources/images/menu_logoless.png").convert(),
-                temp_screen_size,
-            ),
-            "starclan": pygame.transform.scale(
-                pygame.image.load("resources/images/starclanbg.png").convert_alpha(),
-                temp_screen_size,
-            ),
-            "darkforest": pygame.transform.scale(
-                pygame.image.load("resources/images/darkforestbg.png").convert_alpha(),
-                temp_screen_size,
-            ),
-            "unknown_residence": pygame.transform.scale(
-                pygame.image.load("resources/images/urbg.png").convert(),
-                temp_screen_size,
-            ),
-        },
+        "light": FullscreenBackgrounds("light"),
+        "dark": FullscreenBackgrounds("dark"),
     }
 
-    for theme in ("light", "dark"):
-        for name, bg in default_fullscreen_bgs[theme].items():
-            if name not in (
-                "default",
-                "mainmenu_bg",
-                "darkforest",
-                "unknown_residence",
-                "starclan",
-            ):
-                default_fullscreen_bgs[theme][name] = process_blur_bg(
-                    default_fullscreen_bgs[theme][name], theme=theme
-                )
-            elif name == "default":
-                default_fullscreen_bgs[theme][name] = process_blur_bg(
-                    default_fullscreen_bgs[theme][name],
-                    theme=theme,
-                    vignette_strength=0,
-                    fade_color=None,
-                )
-            elif name in ("mainmenu_bg", "darkforest", "unknown_residence"):
-                default_fullscreen_bgs[theme][name] = process_blur_bg(
-                    default_fullscreen_bgs[theme][name], theme=theme, blur_radius=10
-                )
-            elif name == "starclan":
-                default_fullscreen_bgs[theme][name] = process_blur_bg(
-                    default_fullscreen_bgs[theme][name], theme=theme, blur_radius=2
-                )
-
     camp_bgs = get_camp_bgs()
 
     for theme in ("light", "dark"):
+        backgrounds = default_fullscreen_bgs[theme]
+        backgrounds.add(
+            "default",
+            constants.CONFIG["theme"][f"{theme}_mode_background"],
+            vignette_strength=0,
+            fade_color=None,
+        )
+        backgrounds.add(
+            "mainmenu_bg", "resources/images/menu_logoless.png", blur_radius=10
+        )
+        backgrounds.add(
+            "starclan", "resources/images/starclanbg.png", alpha=True, blur_radius=2
+        )
+        backgrounds.add(
+            "darkforest",
+            "resources/images/darkforestbg.png",
+            alpha=True,
+            blur_radius=10,
+        )
+        backgrounds.add(
+            "unknown_residence", "resources/images/urbg.png", blur_radius=10
+        )
         for name, camp_bg in camp_bgs[theme].items():
-            default_fullscreen_bgs[theme][name] = process_blur_bg(camp_bg, theme=theme)
+            backgrounds.add(name, camp_bg)
 
 
 def get_camp_bgs():
+    """
+    :return: The camp background files of the Clan's biome and camp for each season, by theme
+    """
     camp_bg_base_dir = "resources/images/camp_bg/"
-    leaves = ["newleaf", "greenleaf", "leafbare", "leaffall"]
+    leaves = {
+        "Newleaf": "newleaf",
+        "Greenleaf": "greenleaf",
+        "Leaf-bare": "leafbare",
+        "Leaf-fall": "leaffall",
+    }
     available_biome = ["forest", "mountainous", "plains", "beach"]
 
     try:
@@ -534,54 +509,118 @@ def get_camp_bgs():
         camp_nr = "camp1"
         biome = available_biome[0]
 
-    all_backgrounds = []
-    for light_dark in ("light", "dark"):
-        for leaf in leaves:
-            platform_dir = (
-                f"{camp_bg_base_dir}/{biome}/{leaf}_{camp_nr}_{light_dark}.png"
-            )
-            all_backgrounds.append(platform_dir)
-
     return {
-        "light": {
-            "Newleaf": pygame.transform.scale(
-                pygame.image.load(all_backgrounds[0]).convert(),
-                scripts.game_structure.screen_settings.screen.get_size(),
-            ),
-            "Greenleaf": pygame.transform.scale(
-                pygame.image.load(all_backgrounds[1]).convert(),
-                scripts.game_structure.screen_settings.screen.get_size(),
-            ),
-            "Leaf-bare": pygame.transform.scale(
-                pygame.image.load(all_backgrounds[2]).convert(),
-                scripts.game_structure.screen_settings.screen.get_size(),
-            ),
-            "Leaf-fall": pygame.transform.scale(
-                pygame.image.load(all_backgrounds[3]).convert(),
-                scripts.game_structure.screen_settings.screen.get_size(),
-            ),
-        },
-        "dark": {
-            "Newleaf": pygame.transform.scale(
-                pygame.image.load(all_backgrounds[4]).convert(),
-                scripts.game_structure.screen_settings.screen.get_size(),
-            ),
-            "Greenleaf": pygame.transform.scale(
-                pygame.image.load(all_backgrounds[5]).convert(),
-                scripts.game_structure.screen_settings.screen.get_size(),
-            ),
-            "Leaf-bare": pygame.transform.scale(
-                pygame.image.load(all_backgrounds[6]).convert(),
-                scripts.game_structure.screen_settings.screen.get_size(),
-            ),
-            "Leaf-fall": pygame.transform.scale(
-                pygame.image.load(all_backgrounds[7]).convert(),
-                scripts.game_structure.screen_settings.screen.get_size(),
-            ),
-        },
+        light_dark: {
+            season: f"{camp_bg_base_dir}/{biome}/{leaf}_{camp_nr}_{light_dark}.png"
+            for season, leaf in leaves.items()
+        }
+        for light_dark in ("light", "dark")
     }
 
 
+class FullscreenBackgrounds(Mapping):
+    """
+    The default fullscreen backgrounds of one theme, made the first time they're asked for.
+
+    Made backgrounds are also saved in the cache folder, so they only have to be blurred again when the
+    resolution or anything else they're made from changes. Only the newest version of each is kept.
+    """
+
+    def __init__(self, theme: str):
+        self.theme = theme
+        self._sources: Dict[str, tuple] = {}
+        self._made: Dict[str, pygame.Surface] = {}
+
+    def add(
+        self,
+        name: str,
+        source: Union[str, Sequence[int]],
+        alpha: bool = False,
+        **blur_args,
+    ):
+        """
+        Adds a background without making it yet
+        :param name: The background's name
+        :param source: The image file to make the background from, or a colour to fill it with
+        :param alpha: Whether the image file's transparency should be kept
+        :param blur_args: Any other arguments for process_blur_bg
+        """
+        self._sources[name] = (source, alpha, blur_args)
+        self._made.pop(name, None)
+
+    def __getitem__(self, name: str) -> pygame.Surface:
+        bg = self._made.get(name)
+        if bg is None:
+            if name not in self._sources:
+                raise KeyError(name)
+            bg = self._made[name] = self._make(name)
+        return bg
+
+    def __iter__(self):
+        return iter(self._sources)
+
+    def __len__(self):
+        return len(self._sources)
+
+    def _cache_path(self, name: str) -> str:
+        source, alpha, blur_args = self._sources[name]
+        if isinstance(source, str):
+            stat = os.stat(source)
+            source = (source, stat.st_mtime_ns, stat.st_size)
+        else:
+            source = tuple(source)
+        width, height = scripts.game_structure.screen_settings.screen.get_size()
+        key = repr(
+            (
+                BG_CACHE_VERSION,
+                source,
+                alpha,
+                sorted(blur_args.items()),
+                (width, height),
+                scripts.game_structure.screen_settings.game_screen_size,
+                scripts.game_structure.screen_settings.screen_scale,
+                constants.CONFIG["theme"]["fullscreen_background"][self.theme],
+            )
+        )
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return f"{get_cache_dir()}/backgrounds/{self.theme}_{name}_{width}x{height}_{digest}.bmp"
+
+    def _make(self, name: str) -> pygame.Surface:
+        path = self._cache_path(name)
+        if os.path.exists(path):
+            try:
+                return pygame.image.load(path).convert_alpha()
+            except pygame.error:
+                logger.warning("Couldn't load cached background %s", path)
+
+        source, alpha, blur_args = self._sources[name]
+        if isinstance(source, str):
+            bg = pygame.image.load(source)
+            bg = bg.convert_alpha() if alpha else bg.convert()
+        else:
+            bg = pygame.Surface(
+                scripts.game_structure.screen_settings.screen.get_size()
+            )
+            bg.fill(source)
+        bg = process_blur_bg(bg, theme=self.theme, **blur_args)
+
+        # only the newest version of each background is kept, whatever resolution it was made for.
+        # They're big, so ones made for other window sizes would soon fill the cache folder.
+        folder = os.path.dirname(path)
+        stale = re.compile(
+            re.escape(f"{self.theme}_{name}_") + r"\d+x\d+_[0-9a-f]{16}\.bmp"
+        )
+        try:
+            os.makedirs(folder, exist_ok=True)
+            for old_file in os.listdir(folder):
+                if stale.fullmatch(old_file):
+                    os.remove(os.path.join(folder, old_file))
+            pygame.image.save(bg, path)
+        except (OSError, pygame.error):
+            logger.warning("Couldn't cache background %s", path, exc_info=True)
+        return bg
+
+
 def process_blur_bg(
     bg,
     theme: str = None,
@@ -627,18 +666,20 @@ def process_blur_bg(
 
 def feather_surface(surface, feather_width):
     """
-    Run a per-pixel effect to make a fun fade-to-transparent border
+    Make a fun fade-to-transparent border, drawn one ring of pixels at a time
     :param surface: The surface to add a feathered edge to
     :param feather_width: How fat to make the edge
     :return: None
     """
     width, height = surface.get_size()
-    for x in range(width):
-        for y in range(height):
-            distance = min(x, y, width - x - 1, height - y - 1)
-            if distance < feather_width:
-                alpha = int(255 * (distance / feather_width))
-                surface.set_at((x, y), (0, 0, 0, alpha))
+    for distance in range(min(feather_width, (min(width, height) + 1) // 2)):
+        alpha = int(255 * (distance / feather_width))
+        pygame.draw.rect(
+            surface,
+            (0, 0, 0, alpha),
+            (distance, distance, width - distance * 2, height - distance * 2),
+            1,
+        )
 
 
 rebuild_core()
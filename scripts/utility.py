@@ -9,11 +9,13 @@ TODO: Docs
 import logging
 import os
 import re
+from collections import OrderedDict
+from functools import lru_cache
 from itertools import combinations
 from math import floor
 from random import choice, choices, randint, random, sample, randrange, getrandbits
 from sys import exit as sys_exit
-from typing import List, Tuple, TYPE_CHECKING, Type, Union, Optional
+from typing import Dict, List, Tuple, TYPE_CHECKING, Type, Union, Optional
 
 import i18n
 import pygame
@@ -32,10 +34,13 @@ from scripts.game_structure.localization import (
 
 logger = logging.getLogger(__name__)
 from scripts.game_structure import image_cache, localization, constants
+from scripts.cat.cat_index import cat_index
 from scripts.cat.enums import CatAge, CatRank, CatSocial, CatGroup, CatStanding
 from scripts.cat.names import names
+from scripts.cat.sprite_cache import SpriteDiskCache, sprite_fingerprint
 from scripts.cat.sprites import sprites
 from scripts.game_structure import game
+from scripts.housekeeping.datadir import get_cache_dir
 import scripts.game_structure.screen_settings  # must be done like this to get updates when we change screen size etc
 
 if TYPE_CHECKING:
@@ -55,15 +60,13 @@ def get_alive_clan_queens(living_cats):
     ]
 
     queen_dict = {}
-    for cat in living_kits.copy():
-        parents = cat.get_parents()
+    kits_without_queen = []
+    for cat in living_kits:
         # Fetch parent object, only alive and not outside.
-        parents = [
-            cat.fetch_cat(i)
-            for i in parents
-            if cat.fetch_cat(i) and cat.fetch_cat(i).status.alive_in_player_clan
-        ]
+        parents = [cat.fetch_cat(i) for i in cat.get_parents()]
+        parents = [i for i in parents if i and i.status.alive_in_player_clan]
         if not parents:
+            kits_without_queen.append(cat)
             continue
 
         if (
@@ -72,20 +75,10 @@ def get_alive_clan_queens(living_cats):
             or all(i.gender == "male" for i in parents)
             or parents[0].gender == "female"
         ):
-            if parents[0].ID in queen_dict:
-                queen_dict[parents[0].ID].append(cat)
-                living_kits.remove(cat)
-            else:
-                queen_dict[parents[0].ID] = [cat]
-                living_kits.remove(cat)
-        elif len(parents) == 2:
-            if parents[1].ID in queen_dict:
-                queen_dict[parents[1].ID].append(cat)
-                living_kits.remove(cat)
-            else:
-                queen_dict[parents[1].ID] = [cat]
-                living_kits.remove(cat)
-    return queen_dict, living_kits
+            queen_dict.setdefault(parents[0].ID, []).append(cat)
+        else:
+            queen_dict.setdefault(parents[1].ID, []).append(cat)
+    return queen_dict, kits_without_queen
 
 
 def find_alive_cats_with_rank(
@@ -102,11 +95,7 @@ def find_alive_cats_with_rank(
     :param bool sort: default False, set to True if you would like list sorted by descending moon age
     """
 
-    alive_cats = [
-        i
-        for i in Cat.all_cats.values()
-        if i.status.rank in ranks and i.status.alive_in_player_clan
-    ]
+    alive_cats = cat_index.with_rank(Cat.all_cats, ranks)
 
     if working:
         alive_cats = [i for i in alive_cats if not i.not_working()]
@@ -135,12 +124,7 @@ def get_living_clan_cat_count(Cat):
     Returns the int of all living cats within the Clan
     :param Cat: Cat class
     """
-    count = 0
-    for the_cat in Cat.all_cats.values():
-        if not the_cat.status.alive_in_player_clan:
-            continue
-        count += 1
-    return count
+    return cat_index.count_alive_in_clan(Cat.all_cats)
 
 
 def get_cats_same_age(Cat, cat, age_range=10):
@@ -151,9 +135,7 @@ def get_cats_same_age(Cat, cat, age_range=10):
     :param int age_range: The allowed age difference between the two cats, default 10
     """
     cats = []
-    for inter_cat in Cat.all_cats.values():
-        if not inter_cat.status.alive_in_player_clan:
-            continue
+    for inter_cat in cat_index.alive_in_clan(Cat.all_cats):
         if inter_cat.ID == cat.ID:
             continue
 
@@ -175,9 +157,7 @@ def get_cats_same_age(Cat, cat, age_range=10):
 def get_free_possible_mates(cat):
     """Returns a list of available cats, which are possible mates for the given cat."""
     cats = []
-    for inter_cat in cat.all_cats.values():
-        if not inter_cat.status.alive_in_player_clan:
-            continue
+    for inter_cat in cat_index.alive_in_clan(cat.all_cats):
         if inter_cat.ID == cat.ID:
             continue
 
@@ -1073,9 +1053,7 @@ def get_personality_compatibility(cat1, cat2):
 def get_cats_of_romantic_interest(cat):
     """Returns a list of cats, those cats are love interest of the given cat"""
     cats = []
-    for inter_cat in cat.all_cats.values():
-        if not inter_cat.status.alive_in_player_clan:
-            continue
+    for inter_cat in cat_index.alive_in_clan(cat.all_cats):
         if inter_cat.ID == cat.ID:
             continue
 
@@ -1129,24 +1107,9 @@ def get_num_of_cats_with_relation_amount_towards(cat, amount, all_cats):
     return return_dict
 
 
-def filter_relationship_type(
-    group: list, filter_types: List[str], event_id: str = None, patrol_leader=None
-):
-    """
-    filters for specific types of relationships between groups of cat objects, returns bool
-    :param group: the group of cats to be tested (make sure they're in the correct order (i.e. if testing for
-    parent/child, the cat being tested as parent must be index 0)
-    :param filter_types: the relationship types to check for.
-    :param event_id: if the event has an ID, include it here
-    :param patrol_leader: if you are testing a patrol, ensure you include the self.patrol_leader here
-    """
-    if not filter_types:
-        return True
-
-    filter_list = filter_types.copy()
-
-    # keeping this list here just for quick reference of what tags are handled here
-    all_possible_tags = [
+# keeping this list here just for quick reference of what tags are handled by filter_relationship_type
+RELATIONSHIP_STATUS_TAGS = frozenset(
+    [
         "siblings",
         "not_siblings",
         "littermates",
@@ -1163,12 +1126,30 @@ def filter_relationship_type(
         "app/mentor",
         "not_app",
     ]
-    for tier_list in rel_type_tiers.values():
-        all_possible_tags.extend(tier_list)
-        all_possible_tags.extend([f"{l}_only" for l in tier_list])
-    if not set(filter_list).issubset(set(all_possible_tags)):
+    + [tier for tier_list in rel_type_tiers.values() for tier in tier_list]
+    + [f"{tier}_only" for tier_list in rel_type_tiers.values() for tier in tier_list]
+)
+
+
+def filter_relationship_type(
+    group: list, filter_types: List[str], event_id: str = None, patrol_leader=None
+):
+    """
+    filters for specific types of relationships between groups of cat objects, returns bool
+    :param group: the group of cats to be tested (make sure they're in the correct order (i.e. if testing for
+    parent/child, the cat being tested as parent must be index 0)
+    :param filter_types: the relationship types to check for.
+    :param event_id: if the event has an ID, include it here
+    :param patrol_leader: if you are testing a patrol, ensure you include the self.patrol_leader here
+    """
+    if not filter_types:
+        return True
+
+    filter_list = filter_types.copy()
+
+    if not RELATIONSHIP_STATUS_TAGS.issuperset(filter_list):
         print(
-            f"WARNING: {[tag for tag in filter_list if tag not in all_possible_tags]} is not a valid relationship_status tag!"
+            f"WARNING: {[tag for tag in filter_list if tag not in RELATIONSHIP_STATUS_TAGS]} is not a valid relationship_status tag!"
         )
 
     if patrol_leader:
@@ -1324,12 +1305,10 @@ def filter_relationship_type(
                 # if this is a two cat group, then we only look for the first cat's rel toward the second cat.
                 # groups > 2 will require that all cats feel the same way toward each other.
                 continue
-            group_ids = [cat.ID for cat in group]
-
             relevant_relationships = [
-                rel
-                for rel in inter_cat.relationships.values()
-                if rel.cat_to.ID in group_ids and rel.cat_to.ID != inter_cat.ID
+                inter_cat.relationships[cat.ID]
+                for cat in group
+                if cat.ID != inter_cat.ID and cat.ID in inter_cat.relationships
             ]
 
             # list of every cat's tier list
@@ -1620,7 +1599,7 @@ def change_relationship_values(
                     count=single_cat_to.moons,
                 )
                 if log_text not in rel.log:
-                    rel.log.append(log_text)
+                    rel.add_log(log_text)
 
 
 # ---------------------------------------------------------------------------- #
@@ -2412,8 +2391,7 @@ def shorten_text_to_fit(
 
     if font_type == "clangen":
         font_type = "resources/fonts/clangen.ttf"
-    # Create the font object
-    font = pygame.font.Font(font_type, font_size)
+    font = _load_font(font_type, font_size)
 
     # Add dynamic name lengths by checking the actual width of the text
     total_width = 0
@@ -2438,6 +2416,15 @@ def shorten_text_to_fit(
     return short_name
 
 
+@lru_cache(maxsize=16)
+def _load_font(font_type: str, font_size: int) -> pygame.font.Font:
+    """
+    Loads a font for measuring text, or reuses it if it was loaded before.
+    Loading the font file is much slower than measuring with it.
+    """
+    return pygame.font.Font(font_type, font_size)
+
+
 # ---------------------------------------------------------------------------- #
 #                                    Sprites                                   #
 # ---------------------------------------------------------------------------- #
@@ -2544,27 +2531,41 @@ def update_mask(cat):
         cat.sprite_mask = None
         return
 
-    val = pygame.mask.from_surface(
-        pygame.transform.scale(cat.sprite, ui_scale_dimensions((50, 50))), threshold=250
-    )
-
-    inflated_mask = pygame.Mask(
-        (
-            val.get_size()[0] + 10,
-            val.get_size()[1] + 10,
+    # the mask only depends on the sprite and the screen scale, and cats that look alike share both
+    size = ui_scale_dimensions((50, 50))
+    key = (_sprite_key(cat)[2], size)
+    mask = _mask_cache.get(key)
+    if mask is not None:
+        _mask_cache.move_to_end(key)
+    else:
+        val = pygame.mask.from_surface(
+            pygame.transform.scale(cat.sprite, size), threshold=250
         )
-    )
-    inflated_mask.draw(val, (5, 5))
-    for _ in range(3):
-        outline = inflated_mask.outline()
-        for point in outline:
-            for dx in range(-1, 2):
-                for dy in range(-1, 2):
-                    try:
-                        inflated_mask.set_at((point[0] + dx, point[1] + dy), 1)
-                    except IndexError:
-                        continue
-    cat.sprite_mask = inflated_mask
+        mask = inflate_mask(val, 5, 3)
+        _mask_cache[key] = mask
+        if len(_mask_cache) > SPRITE_CACHE_SIZE:
+            _mask_cache.popitem(last=False)
+    cat.sprite_mask = mask
+
+
+def inflate_mask(
+    mask: pygame.Mask, padding: int, steps: int, size: Tuple[int, int] = None
+) -> pygame.Mask:
+    """
+    Grows a mask outwards, so clicks just next to the shape still count.
+    :param mask: The mask to grow
+    :param padding: How many empty pixels to put around the mask, to make room for it to grow
+    :param steps: How many pixels to grow by. Diagonal neighbours count as one pixel away.
+    :param size: Size of the new mask, defaults to the mask's size plus the padding on each side
+    :return: The grown mask, with the original mask at (padding, padding)
+    """
+    if size is None:
+        size = (mask.get_size()[0] + padding * 2, mask.get_size()[1] + padding * 2)
+    inflated_mask = pygame.Mask(size)
+    # every pixel that a square kernel centred on it touches is at most `steps` pixels away
+    kernel = pygame.Mask((steps * 2 + 1, steps * 2 + 1), fill=True)
+    mask.convolve(kernel, inflated_mask, (padding - steps, padding - steps))
+    return inflated_mask
 
 
 def clan_symbol_sprite(clan, return_string=False, force_light=False):
@@ -2596,6 +2597,24 @@ def clan_symbol_sprite(clan, return_string=False, force_light=False):
         return sprites.get_symbol(clan.chosen_symbol, force_light=force_light)
 
 
+SPRITE_CACHE_SIZE = 1024
+"""How many composed cat sprites generate_sprite keeps around"""
+
+_sprite_cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+"""Composed cat sprites, keyed by everything that goes into them. Least recently used first."""
+
+_mask_cache: "OrderedDict[tuple, pygame.Mask]" = OrderedDict()
+"""Click masks of cat sprites, keyed by the sprite's key and the mask size. Least recently used first.
+Cats that look alike share the same mask, so it mustn't be changed."""
+
+_sprite_disk_cache: Optional[SpriteDiskCache] = None
+"""Composed cat sprites kept between sessions, if enabled"""
+
+_recolored_layers: Dict[tuple, pygame.Surface] = {}
+"""Scar and accessory layers with their lineart recolored for an afterlife, keyed by
+sprite size, layer name and afterlife group"""
+
+
 def generate_sprite(
     cat,
     life_state=None,
@@ -2615,6 +2634,54 @@ def generate_sprite(
                     If false, use the cat.not_working() to determine the no_working art.
     """
 
+    cat_sprite, dead, key = _sprite_key(
+        cat,
+        life_state=life_state,
+        scars_hidden=scars_hidden,
+        acc_hidden=acc_hidden,
+        always_living=always_living,
+        disable_sick_sprite=disable_sick_sprite,
+    )
+
+    cached = _sprite_cache.get(key)
+    if cached is not None:
+        _sprite_cache.move_to_end(key)
+        # hand out copies, so nobody can draw on the cached sprite
+        return cached.copy()
+
+    new_sprite = None
+    if _sprite_disk_cache is not None:
+        new_sprite = _sprite_disk_cache.get(key, int(sprites.size))
+
+    if new_sprite is None:
+        new_sprite = _compose_sprite(cat, cat_sprite, dead, scars_hidden, acc_hidden)
+        if new_sprite is None:
+            # Placeholder image
+            new_sprite = image_cache.load_image(
+                f"sprites/error_placeholder.png"
+            ).convert_alpha()
+        elif _sprite_disk_cache is not None:
+            _sprite_disk_cache.put(key, new_sprite)
+
+    _sprite_cache[key] = new_sprite
+    if len(_sprite_cache) > SPRITE_CACHE_SIZE:
+        _sprite_cache.popitem(last=False)
+    return new_sprite.copy()
+
+
+def _sprite_key(
+    cat,
+    life_state=None,
+    scars_hidden=False,
+    acc_hidden=False,
+    always_living=False,
+    disable_sick_sprite=False,
+) -> Tuple[str, bool, tuple]:
+    """
+    Works out which pose a cat's sprite uses and everything else that decides what it looks like.
+    Takes the same arguments as generate_sprite.
+    :return: The pose, whether the cat is drawn as dead, and a key for the sprite caches
+    """
     if life_state is not None:
         age = life_state
     else:
@@ -2659,6 +2726,105 @@ def generate_sprite(
         else:
             cat_sprite = str(cat.pelt.cat_sprites[age])
 
+    dead_group = cat.status.group if dead else None
+    key = (
+        sprites.size,
+        cat_sprite,
+        dead_group,
+        dead,
+        cat.pelt.name,
+        cat.pelt.colour,
+        cat.pelt.tortie_base,
+        cat.pelt.tortie_pattern,
+        cat.pelt.tortie_colour,
+        cat.pelt.tortie_marking,
+        cat.pelt.tint,
+        cat.pelt.white_patches,
+        cat.pelt.white_patches_tint,
+        cat.pelt.points,
+        cat.pelt.vitiligo,
+        cat.pelt.eye_colour,
+        cat.pelt.eye_colour2,
+        cat.pelt.skin,
+        cat.pelt.reverse,
+        () if scars_hidden else tuple(cat.pelt.scars),
+        () if acc_hidden or not cat.pelt.accessory else tuple(cat.pelt.accessory),
+        False if dead else bool(game_setting_get("shaders")),
+        _fade_stage(cat) if dead else None,
+    )
+    return cat_sprite, dead, key
+
+
+def enable_sprite_disk_cache(folder: str = None) -> SpriteDiskCache:
+    """
+    Starts keeping composed cat sprites on disk, so later sessions can load them instead of drawing
+    them again. Call after sprites.load_all.
+    :param folder: Where to keep them, defaults to the sprites folder in the cache folder
+    :return: The disk cache
+    """
+    global _sprite_disk_cache
+    if folder is None:
+        folder = f"{get_cache_dir()}/sprites"
+    _sprite_disk_cache = SpriteDiskCache(
+        folder, sprite_fingerprint(sprites.spritesheet_files)
+    )
+    return _sprite_disk_cache
+
+
+def disable_sprite_disk_cache():
+    """Stops keeping composed cat sprites on disk. Sprites already there are left alone."""
+    global _sprite_disk_cache
+    _sprite_disk_cache = None
+
+
+def _recolor_black_pixels(
+    sprite: pygame.Surface, color=None, source: pygame.Surface = None
+) -> pygame.Surface:
+    """
+    Recolors the opaque black pixels of a sprite, leaving the sprite itself untouched.
+    :param sprite: lineart to recolor
+    :param color: color to apply to all black pixels
+    :param source: surface of the same size as sprite to take the new colors from instead of color
+    :return: The recolored copy
+    """
+    if color:
+        out = sprite.copy()
+        pixel_array = pygame.PixelArray(out)
+        pixel_array.replace((0, 0, 0), color, distance=0)
+        del pixel_array
+        return out
+
+    # from_threshold ignores alpha, so only keep the black pixels that are fully opaque
+    black = pygame.mask.from_threshold(sprite, (0, 0, 0, 255), (1, 1, 1, 255))
+    black = black.overlap_mask(pygame.mask.from_surface(sprite, 254), (0, 0))
+    return black.to_surface(setsurface=source, unsetsurface=sprite)
+
+
+def _fade_stage(cat) -> Optional[str]:
+    """
+    :return: Which fading fog stage a dead cat's sprite gets, or None if it doesn't get one
+    """
+    if cat.pelt.opacity <= 97 and not cat.prevent_fading and get_clan_setting("fading"):
+        if 80 >= cat.pelt.opacity > 45:
+            return "1"
+        elif cat.pelt.opacity <= 45:
+            return "2"
+        return "0"
+    return None
+
+
+def _compose_sprite(
+    cat, cat_sprite: str, dead: bool, scars_hidden: bool, acc_hidden: bool
+) -> pygame.Surface:
+    """
+    Draws a cat's sprite from all of its layers. Use generate_sprite, which caches the results.
+
+    :param cat_sprite: Index of the pose on the sprite sheets
+    :param dead: If True, use the afterlife lineart, fading and overlays
+    :param scars_hidden: If True, doesn't display the cat's scars
+    :param acc_hidden: If True, hide the accessory
+    :return: The sprite, or None if it couldn't be drawn
+    """
     new_sprite = pygame.Surface(
         (sprites.size, sprites.size), pygame.HWSURFACE | pygame.SRCALPHA
     )
@@ -2802,15 +2968,16 @@ def generate_sprite(
         )
 
         def _recolor_lineart(
-            sprite, color=None, source: pygame.Surface = None
+            name: str, color=None, source: pygame.Surface = None
         ) -> pygame.Surface:
             """
             Helper function to set the appropriate lineart color for the living status of the cat
-            :param sprite: lineart to recolor
+            :param name: name of the lineart sprite to recolor
             :param color: color to apply to all pixels
             :param source: source surface of same size as sprite to use instead of color
             :return:
             """
+            sprite = sprites.sprites[name]
             if not dead:
                 return sprite
 
@@ -2819,20 +2986,12 @@ def generate_sprite(
                     "Must provide either `color` or `source` for _recolor_lineart"
                 )
 
-            out = sprite.copy()
-            if color:
-                pixel_array = pygame.PixelArray(out)
-                pixel_array.replace((0, 0, 0), color, distance=0)
-                del pixel_array
-                return out
-
-            width, height = sprite.get_size()
-            for x in range(width):
-                for y in range(height):
-                    if sprite.get_at((x, y)) == pygame.Color(0, 0, 0):
-                        color = source.get_at((x, y))
-                        sprite.set_at((x, y), color)
-            return out
+            key = (sprites.size, name, cat.status.group)
+            recolored = _recolored_layers.get(key)
+            if recolored is None:
+                recolored = _recolor_black_pixels(sprite, color, source)
+                _recolored_layers[key] = recolored
+            return recolored
 
         # draw line art
         if game_setting_get("shaders") and not dead:
@@ -2860,7 +3019,7 @@ def generate_sprite(
                 if scar in cat.pelt.scars2:
                     new_sprite.blit(
                         _recolor_lineart(
-                            sprites.sprites["scars" + scar + cat_sprite],
+                            "scars" + scar + cat_sprite,
                             lineart_color,
                             gradient_surface,
                         ),
@@ -2885,9 +3044,7 @@ def generate_sprite(
                         if accessory in cat.pelt.plant_accessories:
                             new_sprite.blit(
                                 _recolor_lineart(
-                                    sprites.sprites[
-                                        "acc_herbs" + accessory + cat_sprite
-                                    ],
+                                    "acc_herbs" + accessory + cat_sprite,
                                     lineart_color,
                                     gradient_surface,
                                 ),
@@ -2896,9 +3053,7 @@ def generate_sprite(
                         elif accessory in cat.pelt.wild_accessories:
                             new_sprite.blit(
                                 _recolor_lineart(
-                                    sprites.sprites[
-                                        "acc_wild" + accessory + cat_sprite
-                                    ],
+                                    "acc_wild" + accessory + cat_sprite,
                                     lineart_color,
                                     gradient_surface,
                                 ),
@@ -2907,7 +3062,7 @@ def generate_sprite(
                         elif accessory in cat.pelt.collars:
                             new_sprite.blit(
                                 _recolor_lineart(
-                                    sprites.sprites["collars" + accessory + cat_sprite],
+                                    "collars" + accessory + cat_sprite,
                                     lineart_color,
                                     gradient_surface,
                                 ),
@@ -2915,20 +3070,8 @@ def generate_sprite(
                             )
 
         # Apply fading fog
-        if (
-            cat.pelt.opacity <= 97
-            and not cat.prevent_fading
-            and get_clan_setting("fading")
-            and dead
-        ):
-            stage = "0"
-            if 80 >= cat.pelt.opacity > 45:
-                # Stage 1
-                stage = "1"
-            elif cat.pelt.opacity <= 45:
-                # Stage 2
-                stage = "2"
-
+        stage = _fade_stage(cat) if dead else None
+        if stage is not None:
             new_sprite.blit(
                 sprites.sprites["fademask" + stage + cat_sprite],
                 (0, 0),
@@ -2996,11 +3139,7 @@ def generate_sprite(
 
     except (TypeError, KeyError):
         logger.exception("Failed to load sprite")
-
-        # Placeholder image
-        new_sprite = image_cache.load_image(
-            f"sprites/error_placeholder.png"
-        ).convert_alpha()
+        return None
 
     return new_sprite
 
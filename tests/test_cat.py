@@ -1,15 +1,22 @@
 import os
+import tempfile
 import unittest
 from copy import deepcopy
+from unittest.mock import patch
 
 from scripts.game_structure import game
 
 os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["SDL_AUDIODRIVER"] = "dummy"
 
+from scripts.cat import save_load
 from scripts.cat.cats import Cat
 from scripts.cat.enums import CatAge, CatRank, CatGroup, CatSocial
-from scripts.cat_relations.relationship import Relationship
+from scripts.cat_relations.inheritance import FamilyGraph, Inheritance
+from scripts.cat_relations.enums import RelTier, RelType
+from scripts.cat_relations.relationship import Relationship, tier_of
+from scripts.game_structure import constants
+from scripts.game_structure.game.save_load.clan_files import ClanFiles
 
 
 class TestCreationAge(unittest.TestCase):
@@ -88,6 +95,103 @@ class TestRelativesFunction(unittest.TestCase):
         self.assertTrue(grand_parent.is_grandparent(kit))
 
 
+class TestFamilyGraph(unittest.TestCase):
+    def test_children_in_all_cats_order(self):
+        parent = Cat(disable_random=True)
+        other_parent = Cat(disable_random=True)
+        kit1 = Cat(parent1=parent.ID, disable_random=True)
+        kit2 = Cat(parent1=other_parent.ID, disable_random=True)
+        kit3 = Cat(parent1=parent.ID, parent2=other_parent.ID, disable_random=True)
+        adopted = Cat(disable_random=True)
+        adopted.adoptive_parents = [parent.ID]
+
+        family = FamilyGraph()
+        family.sync(Cat.all_cats)
+        self.assertEqual(
+            family.children_of([other_parent.ID, parent.ID]),
+            [kit1.ID, kit2.ID, kit3.ID, adopted.ID],
+        )
+
+        adopted.adoptive_parents = []
+        family.update_cat(adopted)
+        self.assertEqual(family.children_of([parent.ID]), [kit1.ID, kit3.ID])
+
+        # new cats mean the graph is built again
+        kit4 = Cat(parent1=parent.ID, disable_random=True)
+        family.sync(Cat.all_cats)
+        self.assertEqual(family.children_of([parent.ID]), [kit1.ID, kit3.ID, kit4.ID])
+
+    def test_cousins_and_grand_kits(self):
+        grand_parent = Cat(disable_random=True)
+        parent1 = Cat(parent1=grand_parent.ID, disable_random=True)
+        parent2 = Cat(parent1=grand_parent.ID, disable_random=True)
+        kit1 = Cat(parent1=parent1.ID, disable_random=True)
+        kit2 = Cat(parent1=parent2.ID, disable_random=True)
+
+        self.assertTrue(kit1.is_cousin(kit2))
+        self.assertTrue(kit2.is_cousin(kit1))
+        self.assertTrue(grand_parent.is_grandparent(kit2))
+        self.assertEqual(Inheritance(grand_parent).get_grand_kits(), [kit1.ID, kit2.ID])
+
+    def test_adoption_updates_family(self):
+        parent = Cat(disable_random=True)
+        kit = Cat(parent1=parent.ID, disable_random=True)
+        adopted = Cat(disable_random=True)
+        parent.create_inheritance_new_cat()
+        kit.create_inheritance_new_cat()
+        self.assertFalse(kit.is_sibling(adopted))
+
+        adopted.adoptive_parents.append(parent.ID)
+        adopted.create_inheritance_new_cat()
+        self.assertTrue(parent.is_parent(adopted))
+        self.assertTrue(kit.is_sibling(adopted))
+
+
+class TestFadedCatCache(unittest.TestCase):
+    def setUp(self):
+        save_load.faded_cat_cache.clear()
+        self.addCleanup(save_load.faded_cat_cache.clear)
+
+    def _faded_cat(self):
+        # only fetch_cat should know about it, like a cat that faded
+        faded_cat = Cat(disable_random=True)
+        del Cat.all_cats[faded_cat.ID]
+        return faded_cat
+
+    def test_faded_cat_loaded_once(self):
+        faded_cat = self._faded_cat()
+        with patch.object(Cat, "load_faded_cat", return_value=faded_cat) as load:
+            self.assertIs(Cat.fetch_cat(faded_cat.ID), faded_cat)
+            self.assertIs(Cat.fetch_cat(faded_cat.ID), faded_cat)
+            self.assertEqual(load.call_count, 1)
+
+            # a changed file is read again
+            save_load.faded_cat_cache.discard(faded_cat.ID)
+            Cat.fetch_cat(faded_cat.ID)
+            self.assertEqual(load.call_count, 2)
+
+        self.assertEqual(save_load.faded_cat_cache.hits, 1)
+        self.assertEqual(save_load.faded_cat_cache.misses, 2)
+
+    def test_missing_cats_not_kept(self):
+        with patch.object(Cat, "load_faded_cat", return_value=False):
+            self.assertIsNone(Cat.fetch_cat("123456"))
+        self.assertEqual(len(save_load.faded_cat_cache), 0)
+
+    def test_least_recently_used_dropped(self):
+        cache = save_load.FadedCatCache(max_size=2)
+        cat1, cat2, cat3 = self._faded_cat(), self._faded_cat(), self._faded_cat()
+        cache.put(cat1)
+        cache.put(cat2)
+        cache.get(cat1.ID)
+        cache.put(cat3)
+
+        self.assertIs(cache.get(cat1.ID), cat1)
+        self.assertIsNone(cache.get(cat2.ID))
+        self.assertIs(cache.get(cat3.ID), cat3)
+        self.assertAlmostEqual(cache.hit_rate, 3 / 4)
+
+
 class TestPossibleMateFunction(unittest.TestCase):
     # test that is_potential_mate returns False for cats that are related to each other
     def test_relation(self):
@@ -403,6 +507,249 @@ class TestMateFunctions(unittest.TestCase):
         self.assertGreaterEqual(old_relation2.respect, relation2.respect)
 
 
+class TestRelationshipSaving(unittest.TestCase):
+    def test_relationship_dirty(self):
+        cat1 = Cat(disable_random=True)
+        cat2 = Cat(disable_random=True)
+        relation = Relationship(cat1, cat2)
+        self.assertTrue(relation.dirty)
+
+        relation.dirty = False
+        relation.like += 5
+        self.assertTrue(relation.dirty)
+
+        relation.dirty = False
+        relation.mates = True
+        self.assertTrue(relation.dirty)
+
+        relation.dirty = False
+        relation.add_log("test")
+        self.assertTrue(relation.dirty)
+
+    def test_relationship_file_only_written_when_changed(self):
+        cat1 = Cat(disable_random=True)
+        cat2 = Cat(disable_random=True)
+        cat1.relationships[cat2.ID] = Relationship(cat1, cat2)
+
+        with tempfile.TemporaryDirectory() as clan_dir:
+            clan_files = ClanFiles("test", clan_dir)
+            self.assertTrue(cat1.save_relationship_of_cat(clan_files))
+            self.assertFalse(cat1.save_relationship_of_cat(clan_files))
+
+            cat1.relationships[cat2.ID].trust += 10
+            self.assertTrue(cat1.save_relationship_of_cat(clan_files))
+
+            cat1.relationships.pop(cat2.ID)
+            self.assertTrue(cat1.save_relationship_of_cat(clan_files))
+
+    def test_relationships_made_when_needed(self):
+        cat1 = Cat(disable_random=True)
+        cat2 = Cat(disable_random=True)
+        cat3 = Cat(disable_random=True)
+        cat1.create_relationships_new_cat()
+
+        self.assertIn(cat2.ID, cat1.relationships)
+        self.assertIn(cat1.ID, cat3.relationships)
+        self.assertEqual(cat1.relationships._values, {})
+
+        cat1.relationships[cat2.ID].like += 5
+        cat1.relationships[cat2.ID].add_log("test")
+        relation = cat1.relationships[cat2.ID]
+        self.assertIs(relation, cat1.relationships[cat2.ID])
+        del relation
+
+        self.assertEqual(cat1.relationships[cat2.ID].like, 5)
+        self.assertEqual(cat1.relationships[cat2.ID].log, ["test"])
+        self.assertEqual(cat1.relationships[cat3.ID].like, 0)
+        self.assertEqual(list(cat1.relationships._values), [cat2.ID])
+
+    def test_reading_log_keeps_default(self):
+        cat1 = Cat(disable_random=True)
+        cat2 = Cat(disable_random=True)
+        cat1.create_one_relationship(cat2)
+        saved = cat1.relationships.to_list()
+
+        relation = cat1.relationships[cat2.ID]
+        self.assertEqual(len(relation.log), 0)
+        self.assertNotIn("test", relation.log)
+        self.assertEqual(cat1.relationships._values, {})
+        self.assertEqual(cat1.relationships.to_list(), saved)
+
+        relation.add_log("test")
+        self.assertEqual(list(relation.log), ["test"])
+        self.assertEqual(list(cat1.relationships._values), [cat2.ID])
+
+    def test_default_relationships_saved_in_full(self):
+        cat1 = Cat(disable_random=True)
+        cat2 = Cat(disable_random=True)
+        cat3 = Cat(disable_random=True)
+        cat1.create_one_relationship(cat2)
+        cat1.create_one_relationship(cat3).trust = 10
+
+        saved = cat1.relationships.to_list()
+        self.assertEqual(cat1.relationships._values.keys(), {cat3.ID})
+        # older versions of the game need every field
+        self.assertEqual(
+            saved[0],
+            {
+                "cat_from_id": cat1.ID,
+                "cat_to_id": cat2.ID,
+                "mates": False,
+                "family": False,
+                "romance": 0,
+                "like": 0,
+                "respect": 0,
+                "comfort": 0,
+                "trust": 0,
+                "log": [],
+            },
+        )
+        self.assertEqual(saved[1], cat1.relationships[cat3.ID].to_dict())
+        self.assertEqual(saved[1]["trust"], 10)
+
+
+def _old_tier(rel_type, value):
+    """How the tier properties used to work out a tier, before tier_of"""
+    group = None
+    for name, interval in constants.CONFIG["relationship"]["value_intervals"].items():
+        if value <= interval:
+            group = name
+            break
+
+    if rel_type == RelType.ROMANCE:
+        if group == "neutral":
+            return RelTier.UNINTERESTED
+        elif group == "low_pos":
+            return RelTier.FANCIES
+        elif group == "mid_pos":
+            return RelTier.ADORES
+        else:
+            return RelTier.LOVES
+
+    tiers = {
+        RelType.LIKE: (
+            RelTier.LOATHES,
+            RelTier.HATES,
+            RelTier.DISLIKES,
+            RelTier.KNOWS_OF,
+            RelTier.LIKES,
+            RelTier.ENJOYS,
+            RelTier.CHERISHES,
+        ),
+        RelType.RESPECT: (
+            RelTier.RESENTS,
+            RelTier.ENVIES,
+            RelTier.BEGRUDGES,
+            RelTier.ACKNOWLEDGES,
+            RelTier.PRAISES,
+            RelTier.RESPECTS,
+            RelTier.ADMIRES,
+        ),
+        RelType.COMFORT: (
+            RelTier.RUNS_FROM,
+            RelTier.FEARS,
+            RelTier.AVOIDS,
+            RelTier.CONSIDERS,
+            RelTier.RELATES_TO,
+            RelTier.UNDERSTANDS,
+            RelTier.KNOWS_DEEPLY,
+        ),
+        RelType.TRUST: (
+            RelTier.LOATHES,
+            RelTier.DISTRUSTS,
+            RelTier.DOUBTS,
+            RelTier.OBSERVES,
+            RelTier.LISTENS_TO,
+            RelTier.TRUSTS,
+            RelTier.CONFIDES_IN,
+        ),
+    }[rel_type]
+    if group == "extreme_neg":
+        return tiers[0]
+    elif group == "mid_neg":
+        return tiers[1]
+    elif group == "low_neg":
+        return tiers[2]
+    elif group == "neutral":
+        return tiers[3]
+    elif group == "low_pos":
+        return tiers[4]
+    elif group == "mid_pos":
+        return tiers[5]
+    else:
+        return tiers[6]
+
+
+class TestRelationshipTiers(unittest.TestCase):
+    rel_types = (
+        RelType.ROMANCE,
+        RelType.LIKE,
+        RelType.RESPECT,
+        RelType.COMFORT,
+        RelType.TRUST,
+    )
+    values = list(range(-100, 101)) + [-1000, -101, 101, 1000, -6.5, 24.5]
+
+    def test_same_as_before(self):
+        for rel_type in self.rel_types:
+            for value in self.values:
+                with self.subTest(rel_type=rel_type, value=value):
+                    self.assertEqual(
+                        tier_of(rel_type, value), _old_tier(rel_type, value)
+                    )
+
+    def test_intervals_changed(self):
+        intervals = dict(constants.CONFIG["relationship"]["value_intervals"])
+        intervals["neutral"] = 50
+        with patch.dict(
+            constants.CONFIG["relationship"], {"value_intervals": intervals}
+        ):
+            for rel_type in self.rel_types:
+                for value in self.values:
+                    with self.subTest(rel_type=rel_type, value=value):
+                        self.assertEqual(
+                            tier_of(rel_type, value), _old_tier(rel_type, value)
+                        )
+        self.assertEqual(tier_of(RelType.LIKE, 30), RelTier.ENJOYS)
+
+    def test_properties(self):
+        relation = Relationship(
+            Cat(disable_random=True),
+            Cat(disable_random=True),
+            romance=30,
+            like=-80,
+            respect=0,
+            trust=90,
+            comfort=-10,
+        )
+        self.assertEqual(relation.romance_tier, RelTier.ADORES)
+        self.assertEqual(relation.like_tier, RelTier.LOATHES)
+        self.assertEqual(relation.respect_tier, RelTier.ACKNOWLEDGES)
+        self.assertEqual(relation.trust_tier, RelTier.CONFIDES_IN)
+        self.assertEqual(relation.comfort_tier, RelTier.AVOIDS)
+
+    def test_used_interactions_reset_for_one_relationship(self):
+        cat1 = Cat(disable_random=True)
+        relation1 = Relationship(cat1, Cat(disable_random=True))
+        relation2 = Relationship(cat1, Cat(disable_random=True))
+        self.assertIs(relation1.used_interaction_ids, relation2.used_interaction_ids)
+
+        relation1.used_interaction_ids.append("shared")
+        self.addCleanup(relation2.used_interaction_ids.remove, "shared")
+        relation1.used_interaction_ids = []
+        relation1.used_interaction_ids.append("own")
+
+        self.assertEqual(relation1.used_interaction_ids, ["own"])
+        self.assertIn("shared", relation2.used_interaction_ids)
+        self.assertNotIn("own", relation2.used_interaction_ids)
+
+    def test_no_instance_dict(self):
+        relation = Relationship(Cat(disable_random=True), Cat(disable_random=True))
+        self.assertFalse(hasattr(relation, "__dict__"))
+        with self.assertRaises(AttributeError):
+            relation.not_an_attribute = True
+
+
 class TestUpdateMentor(unittest.TestCase):
     # test that an exiled cat apprentice becomes a former apprentice
     def test_exile_apprentice(self):
@@ -8,7 +8,12 @@ os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["SDL_AUDIODRIVER"] = "dummy"
 
 from scripts.cat.cats import Cat
-from scripts.conditions import medicine_cats_can_cover_clan
+from scripts.conditions import (
+    Illness,
+    Injury,
+    PermanentCondition,
+    medicine_cats_can_cover_clan,
+)
 
 
 class TestsMedCondition(unittest.TestCase):
@@ -76,3 +81,17 @@ class TestInjury(unittest.TestCase):
         with open(f"{resource_directory}Injuries.json", "r") as read_file:
             injuries = ujson.loads(read_file.read())
         return injuries
+
+
+class TestConditionSlots(unittest.TestCase):
+    def test_no_instance_dict(self):
+        conditions = (
+            Illness("test", "minor", 10, 10, 2, 1, 5, []),
+            Injury("test", "minor", 2, 1, 10),
+            PermanentCondition("test", "minor", 0),
+        )
+        for condition in conditions:
+            with self.subTest(condition=type(condition).__name__):
+                self.assertFalse(hasattr(condition, "__dict__"))
+                with self.assertRaises(AttributeError):
+                    condition.not_an_attribute = True
@@ -1,5 +1,6 @@
 import os
 import unittest
+from unittest.mock import patch
 import ujson
 
 from scripts.cat.enums import CatRank
@@ -471,3 +472,36 @@ class FreshkillPileTest(unittest.TestCase):
         self.assertEqual(freshkill_pile.nutrition_info[injured_cat.ID].percentage, 100)
         self.assertEqual(freshkill_pile.nutrition_info[sick_cat.ID].percentage, 100)
         self.assertLess(freshkill_pile.nutrition_info[healthy_cat.ID].percentage, 70)
+
+    def test_requirement_worked_out_once_per_round(self) -> None:
+        Cat.all_cats = {}
+        living_cats = []
+        for i in range(40):
+            cat = Cat(
+                status_dict={"rank": CatRank.WARRIOR}, moons=1, disable_random=True
+            )
+            cat.moons = 20 + i
+            living_cats.append(cat)
+            if i % 4 == 0:
+                kit = Cat(
+                    status_dict={"rank": CatRank.KITTEN}, moons=1, disable_random=True
+                )
+                kit.parent1 = cat.ID
+                living_cats.append(kit)
+
+        freshkill_pile = FreshkillPile()
+        freshkill_pile.living_cats = living_cats
+        current_amount = self.prey_requirement["warrior"] * 40
+        freshkill_pile.pile["expires_in_4"] = current_amount
+        freshkill_pile.total_amount = current_amount
+
+        with patch.object(
+            FreshkillPile,
+            "_update_needed_food",
+            autospec=True,
+            side_effect=FreshkillPile._update_needed_food,
+        ) as update_needed_food:
+            freshkill_pile.feed_cats(living_cats)
+
+        # going through every cat for every cat fed would make feeding quadratic
+        self.assertEqual(update_needed_food.call_count, 1)
@@ -5,7 +5,11 @@ os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["SDL_AUDIODRIVER"] = "dummy"
 
 from scripts.cat.cats import Cat
+from scripts.clan import Clan
+from scripts.events_module.generate_events import ShortEventBuckets
 from scripts.events_module.short.handle_short_events import HandleShortEvents
+from scripts.events_module.short.short_event import ShortEvent
+from scripts.game_structure import game
 
 
 class TestHandleEvent(unittest.TestCase):
@@ -199,3 +203,27 @@ class TestReset(unittest.TestCase):
         self.assertEqual(test.other_clan_name, default.other_clan_name)
         self.assertEqual(test.chosen_event, default.chosen_event)
         self.assertEqual(test.additional_event_text, default.additional_event_text)
+
+
+class TestShortEventBuckets(unittest.TestCase):
+    def setUp(self):
+        self.old_clan = game.clan
+        game.clan = Clan(name="test", biome="Forest", camp_bg="camp1")
+        game.clan.current_season = "Newleaf"
+
+    def tearDown(self):
+        game.clan = self.old_clan
+
+    def test_candidates(self):
+        forest = ShortEvent("forest", location=["forest"], sub_type=["war"])
+        beach = ShortEvent("beach", location=["beach"], sub_type=["war"])
+        leafbare = ShortEvent("leafbare", season=["leaf-bare"])
+        anywhere = ShortEvent("anywhere")
+        buckets = ShortEventBuckets([forest, beach, leafbare, anywhere])
+
+        self.assertEqual(buckets.candidates(["war"]), [forest])
+        self.assertEqual(buckets.candidates([]), [anywhere])
+        self.assertEqual(buckets.candidates(None), [forest, anywhere])
+
+        game.clan.current_season = "Leaf-bare"
+        self.assertEqual(buckets.candidates([]), [leafbare, anywhere])
@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import ujson
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts import headless
+from scripts.clan_package.settings import clan_settings as clan_settings_module
+from scripts.clan_package.settings import get_clan_setting, set_clan_setting
+from scripts.events import events_class
+from scripts.game_structure import game
+from scripts.game_structure.game.switches import switch_set_value, Switch
+
+
+class TestRunMoons(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        os.makedirs(os.path.join(self.folder.name, "Test"))
+
+        autosave = get_clan_setting("autosave")
+        self.addCleanup(set_clan_setting, "autosave", autosave)
+
+    def _load_clan(self, clan_name=None):
+        switch_set_value(Switch.clan_name, "Test")
+        set_clan_setting("autosave", True)
+        return "Test"
+
+    def _saved_autosave(self):
+        with open(
+            os.path.join(self.folder.name, "Test", "clan_settings.json"),
+            encoding="utf-8",
+        ) as read_file:
+            return ujson.loads(read_file.read())["autosave"]
+
+    def test_save_keeps_autosave(self):
+        autosave_during_moons = []
+        with patch.object(headless, "load_clan", self._load_clan), patch.object(
+            headless, "save_clan", clan_settings_module.save_clan_settings
+        ), patch.object(
+            clan_settings_module, "get_save_dir", lambda: self.folder.name
+        ), patch.object(
+            events_class,
+            "one_moon",
+            lambda: autosave_during_moons.append(get_clan_setting("autosave")),
+        ), patch.object(
+            game, "clan", SimpleNamespace(age=0)
+        ):
+            headless.run_moons(2, save=True, quiet=True)
+
+        self.assertEqual(autosave_during_moons, [False, False])
+        self.assertIs(self._saved_autosave(), True)
+
+    def test_autosave_put_back_if_moon_fails(self):
+        def one_moon():
+            raise RuntimeError("moon failed")
+
+        with patch.object(headless, "load_clan", self._load_clan), patch.object(
+            events_class, "one_moon", one_moon
+        ), patch.object(game, "clan", SimpleNamespace(age=0)):
+            with self.assertRaises(RuntimeError):
+                headless.run_moons(1, quiet=True)
+
+        self.assertIs(get_clan_setting("autosave"), True)
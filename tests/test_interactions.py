@@ -11,9 +11,15 @@ os.environ["SDL_AUDIODRIVER"] = "dummy"
 from scripts.cat.cats import Cat, Relationship
 from scripts.cat.skills import SkillPath, Skill
 from scripts.cat_relations.interaction import (
+    INTERACTION_MASTER_DICT,
     SingleInteraction,
+    cat_constraint_results,
+    cat_fulfills_interaction,
     cats_fulfill_single_interaction_constraints,
+    get_interaction_bucket,
+    rebuild_relationship_dicts,
 )
+from scripts.events_module.event_filters import event_for_location, event_for_season
 
 
 class RelationshipConstraints(unittest.TestCase):
@@ -497,3 +503,41 @@ class SingleInteractionCatConstraints(unittest.TestCase):
         self.assertTrue(
             cats_fulfill_single_interaction_constraints(clan, clan, all_to_clan)
         )
+
+
+class InteractionBuckets(unittest.TestCase):
+    def test_bucket_matches_filter(self):
+        rebuild_relationship_dicts()
+        for direction in ("increase", "decrease"):
+            for intensity in ("low", "medium", "high"):
+                master = INTERACTION_MASTER_DICT["like"][direction]
+                bucket = get_interaction_bucket("like", direction, intensity)
+                self.assertEqual(
+                    bucket,
+                    [
+                        interact
+                        for interact in master
+                        if interact.intensity == intensity
+                        and event_for_location(interact.biome)
+                        and event_for_season(interact.season)
+                    ],
+                )
+                self.assertIs(
+                    bucket, get_interaction_bucket("like", direction, intensity)
+                )
+
+    def test_constraint_results_follow_cat(self):
+        cat = Cat()
+        cat.personality.trait = "calm"
+        interaction = SingleInteraction("test")
+        interaction.main_trait_constraint = ["calm"]
+
+        results = cat_constraint_results(cat, True)
+        self.assertTrue(cat_fulfills_interaction(cat, interaction, True, results))
+        self.assertTrue(results[interaction])
+
+        # a changed cat gets the results for its new values
+        cat.personality.trait = "troublesome"
+        results = cat_constraint_results(cat, True)
+        self.assertFalse(cat_fulfills_interaction(cat, interaction, True, results))
+        self.assertIsNot(results, cat_constraint_results(cat, False))
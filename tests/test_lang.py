@@ -1,5 +1,6 @@
 # Tests for localization
 import os
+import tempfile
 import unittest
 
 import i18n
@@ -13,6 +14,9 @@ from scripts.game_structure.localization import (
     get_new_pronouns,
     determine_plural_pronouns,
     set_lang_config_directory,
+    load_lang_resource,
+    clear_lang_resource_cache,
+    get_lang_resource_cache_stats,
 )
 from scripts.utility import event_text_adjust
 
@@ -109,3 +113,68 @@ class TestLocalisation(unittest.TestCase):
                     ),
                     value[1]["subject"],
                 )
+
+
+class TestLangResourceCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        for locale, text in (("en", "english"), ("es", "spanish")):
+            os.mkdir(os.path.join(self.root, locale))
+            with open(
+                os.path.join(self.root, locale, "words.json"), "w", encoding="utf-8"
+            ) as write_file:
+                write_file.write(ujson.dumps([text]))
+        with open(
+            os.path.join(self.root, "en", "only_en.json"), "w", encoding="utf-8"
+        ) as write_file:
+            write_file.write(ujson.dumps(["fallback"]))
+        clear_lang_resource_cache()
+
+    def tearDown(self):
+        i18n.config.set("locale", "en")
+        clear_lang_resource_cache()
+        self.directory.cleanup()
+
+    def test_cached_per_locale(self):
+        first = load_lang_resource("words.json", root_directory=self.root)
+        self.assertIs(first, load_lang_resource("words.json", root_directory=self.root))
+        self.assertEqual(first, ["english"])
+
+        i18n.config.set("locale", "es")
+        self.assertEqual(
+            load_lang_resource("words.json", root_directory=self.root), ["spanish"]
+        )
+        self.assertEqual(
+            load_lang_resource("only_en.json", root_directory=self.root), ["fallback"]
+        )
+
+        stats = get_lang_resource_cache_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 3)
+        self.assertEqual(stats["resources"], 3)
+        self.assertGreater(stats["size"], 0)
+
+    def test_clear(self):
+        load_lang_resource("words.json", root_directory=self.root)
+        with open(
+            os.path.join(self.root, "en", "words.json"), "w", encoding="utf-8"
+        ) as write_file:
+            write_file.write(ujson.dumps(["changed"]))
+        self.assertEqual(
+            load_lang_resource("words.json", root_directory=self.root), ["english"]
+        )
+
+        clear_lang_resource_cache()
+        self.assertEqual(
+            load_lang_resource("words.json", root_directory=self.root), ["changed"]
+        )
+        self.assertEqual(get_lang_resource_cache_stats()["resources"], 1)
+
+    def test_uncached(self):
+        first = load_lang_resource("words.json", root_directory=self.root, cache=False)
+        self.assertIsNot(
+            first,
+            load_lang_resource("words.json", root_directory=self.root, cache=False),
+        )
+        self.assertEqual(get_lang_resource_cache_stats()["resources"], 0)
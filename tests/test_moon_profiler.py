@@ -0,0 +1,124 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat import save_load
+from scripts.events import Events, events_class
+from scripts.game_structure import game
+from scripts.housekeeping import moon_profiler as moon_profiler_module
+from scripts.housekeeping.moon_profiler import MoonProfiler, moon_profiler
+
+
+class TestMoonProfiler(unittest.TestCase):
+    def test_disabled_records_nothing(self):
+        profiler = MoonProfiler()
+        with profiler.moon() as report:
+            with profiler.phase("thoughts"):
+                pass
+        self.assertEqual(report, {})
+        self.assertIsNone(profiler.last_report)
+
+    def test_nested_phases(self):
+        profiler = MoonProfiler()
+        profiler.enable(write_to_log=False)
+        with profiler.moon():
+            for _ in range(3):
+                with profiler.phase("one_moon_cat"):
+                    with profiler.phase("thoughts"):
+                        pass
+            with profiler.phase("sort_cats"):
+                pass
+
+        phases = profiler.last_report["phases"]
+        self.assertEqual(
+            set(phases), {"one_moon_cat", "one_moon_cat/thoughts", "sort_cats"}
+        )
+        self.assertEqual(phases["one_moon_cat"]["calls"], 3)
+        self.assertEqual(phases["one_moon_cat/thoughts"]["calls"], 3)
+        self.assertGreaterEqual(
+            phases["one_moon_cat"]["total"], phases["one_moon_cat/thoughts"]["total"]
+        )
+        self.assertTrue(profiler.last_report["completed"])
+
+    def test_summarize(self):
+        profiler = MoonProfiler()
+        profiler.enable(write_to_log=False)
+        for _ in range(2):
+            with profiler.moon():
+                with profiler.phase("freshkill"):
+                    pass
+
+        summary = MoonProfiler.summarize(profiler.reports)
+        self.assertEqual(summary["freshkill"]["calls"], 2)
+        self.assertEqual(len(MoonProfiler.format_phases(summary)), 1)
+
+    def test_recent_reports_kept(self):
+        profiler = MoonProfiler()
+        profiler.enable(write_to_log=False)
+        for moon in range(moon_profiler_module.MAX_REPORTS + 5):
+            with profiler.moon() as report:
+                report["moon"] = moon
+                with profiler.phase("freshkill"):
+                    pass
+
+        self.assertEqual(len(profiler.reports), moon_profiler_module.MAX_REPORTS)
+        self.assertEqual(
+            profiler.reports[-1]["moon"], moon_profiler_module.MAX_REPORTS + 4
+        )
+        # every moon is still in the summary
+        self.assertEqual(
+            profiler.summary["freshkill"]["calls"], moon_profiler_module.MAX_REPORTS + 5
+        )
+
+    def test_write_failure_logged(self):
+        profiler = MoonProfiler()
+        profiler.enable(write_to_log=False)
+        with tempfile.TemporaryDirectory() as folder:
+            # a folder can't be opened as a file
+            profiler.output_path = folder
+            with self.assertLogs(moon_profiler_module.logger, "WARNING") as logs:
+                with profiler.moon():
+                    pass
+
+        self.assertIn(folder, logs.output[0])
+        self.assertIsNotNone(logs.records[0].exc_info)
+        self.assertIsNotNone(profiler.last_report)
+
+
+class TestFadedCatHitRate(unittest.TestCase):
+    def setUp(self):
+        save_load.faded_cat_cache.clear()
+        self.addCleanup(save_load.faded_cat_cache.clear)
+        moon_profiler.enable(write_to_log=False)
+        self.addCleanup(moon_profiler.disable)
+
+    def _moon(self, lookups):
+        def one_moon(events):
+            for cat_id in lookups:
+                save_load.faded_cat_cache.get(cat_id)
+
+        with patch.object(Events, "_one_moon", one_moon), patch.object(
+            game, "clan", SimpleNamespace(age=0)
+        ):
+            events_class.one_moon()
+        return moon_profiler.last_report
+
+    def test_per_moon(self):
+        save_load.faded_cat_cache.put(SimpleNamespace(ID="1"))
+
+        report = self._moon(["2", "3", "4"])
+        self.assertEqual(report["faded_cat_lookups"], 3)
+        self.assertEqual(report["faded_cat_hit_rate"], 0.0)
+
+        report = self._moon(["1"])
+        self.assertEqual(report["faded_cat_lookups"], 1)
+        self.assertEqual(report["faded_cat_hit_rate"], 1.0)
+
+        report = self._moon([])
+        self.assertEqual(report["faded_cat_lookups"], 0)
+        self.assertEqual(report["faded_cat_hit_rate"], 0.0)
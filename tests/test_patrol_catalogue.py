@@ -0,0 +1,63 @@
+import os
+import unittest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.events_module.patrol.patrol_catalogue import (
+    PatrolCatalogue,
+    get_patrol_catalogue,
+)
+from scripts.events_module.patrol.patrol_event import PatrolEvent
+
+
+class TestPatrolCatalogue(unittest.TestCase):
+    def test_files_load_once(self):
+        catalogue = get_patrol_catalogue()
+        patrols = catalogue.patrols("general/hunting.json")
+
+        self.assertGreater(len(patrols), 0)
+        self.assertIs(patrols, catalogue.patrols("general/hunting.json"))
+        self.assertIs(catalogue, get_patrol_catalogue())
+        self.assertTrue(catalogue.indexed.issuperset(patrols))
+
+    def test_matching(self):
+        anywhere = PatrolEvent("anywhere", types=["hunting"])
+        forest_border = PatrolEvent(
+            "forest_border",
+            biome=["forest"],
+            season=["newleaf", "greenleaf"],
+            types=["border"],
+            min_cats=2,
+            max_cats=3,
+        )
+        cruel = PatrolEvent("cruel", types=["hunting"], tags=["cruel_season"])
+
+        catalogue = PatrolCatalogue("test")
+        catalogue._add_to_index([anywhere, forest_border, cruel])
+
+        self.assertEqual(
+            catalogue.matching("forest", "camp1", "newleaf", "border", 2, "classic"),
+            {forest_border},
+        )
+        self.assertEqual(
+            catalogue.matching("forest", "camp1", "newleaf", "border", 4, "classic"),
+            set(),
+        )
+        self.assertEqual(
+            catalogue.matching("beach", "camp1", "newleaf", "hunting", 1, "classic"),
+            {anywhere},
+        )
+        self.assertEqual(
+            catalogue.matching(
+                "beach", "camp1", "leaf-bare", "hunting", 1, "cruel_season"
+            ),
+            {anywhere, cruel},
+        )
+        # types that don't need a specific patrol type take anything that fits
+        self.assertEqual(
+            catalogue.matching(
+                "forest", "camp1", "greenleaf", "herb_gathering", 2, "classic"
+            ),
+            {anywhere, forest_border},
+        )
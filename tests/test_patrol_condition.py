@@ -10,6 +10,7 @@ from scripts.cat.cats import Cat
 from scripts.cat.history import History
 from scripts.clan import Clan
 from scripts.events_module.patrol.patrol import Patrol
+from scripts.events_module.patrol.patrol_catalogue import generate_patrol_events
 
 
 class TestCondition(unittest.TestCase):
@@ -123,7 +124,7 @@ class TestCondition(unittest.TestCase):
         patrol_cat.history = History(cat=patrol_cat)
         patrol = Patrol()
         patrol.add_patrol_cats([patrol_cat], clan)
-        patrol_event = patrol.generate_patrol_events([self.cold_patrol])
+        patrol_event = generate_patrol_events([self.cold_patrol])
 
         # WHEN - THEN
         injury_outcome = patrol_event[0].fail_outcomes[1]
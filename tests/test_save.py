@@ -1,8 +1,25 @@
 import os
 import shutil
+import tempfile
 import unittest
+from unittest.mock import patch
 
-from scripts.game_structure.game.save_load import read_clans
+from scripts.game_structure.game.save_load import (
+    read_clans,
+    safe_save_if_changed,
+    remember_saved_file,
+    forget_saved_files,
+)
+from scripts.game_structure.game.save_load import clan_files
+from scripts.game_structure.game.save_load.clan_files import (
+    ClanFiles,
+    PackedClanFiles,
+    get_clan_files,
+    is_packed,
+    pack_clan,
+    reset_clan_files,
+    unpack_clan,
+)
 
 os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["SDL_AUDIODRIVER"] = "dummy"
@@ -147,3 +164,192 @@ class MigrateSave(unittest.TestCase):
                     file_list,
                     "Save " + str(i) + " not migrated correctly",
                 )
+
+
+class SaveIfChanged(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "data.json")
+        forget_saved_files()
+
+    def tearDown(self):
+        forget_saved_files()
+        shutil.rmtree(self.directory)
+
+    def test_skips_unchanged(self):
+        self.assertTrue(safe_save_if_changed(self.path, {"a": 1}))
+        self.assertFalse(safe_save_if_changed(self.path, {"a": 1}))
+        self.assertTrue(safe_save_if_changed(self.path, {"a": 2}))
+
+    def test_rewrites_deleted_file(self):
+        safe_save_if_changed(self.path, {"a": 1})
+        os.remove(self.path)
+        self.assertTrue(safe_save_if_changed(self.path, {"a": 1}))
+        self.assertTrue(os.path.exists(self.path))
+
+    def test_remembered_file(self):
+        with open(self.path, "w", encoding="utf-8") as write_file:
+            write_file.write("some text")
+        remember_saved_file(self.path, "some text")
+        self.assertFalse(safe_save_if_changed(self.path, "some text"))
+
+        forget_saved_files()
+        self.assertTrue(safe_save_if_changed(self.path, "some text"))
+
+
+class PackedFiles(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.clan_files = PackedClanFiles("test", self.directory)
+
+    def tearDown(self):
+        self.clan_files.close()
+        shutil.rmtree(self.directory)
+
+    def test_read_write(self):
+        self.assertIsNone(self.clan_files.read("conditions/1_conditions.json"))
+        self.assertTrue(
+            self.clan_files.write("conditions/1_conditions.json", {"injuries": {}})
+        )
+        self.assertFalse(
+            self.clan_files.write("conditions/1_conditions.json", {"injuries": {}})
+        )
+        self.clan_files.commit()
+        self.assertEqual(
+            self.clan_files.read("conditions/1_conditions.json"),
+            '{\n    "injuries": {}\n}',
+        )
+
+    def test_folders(self):
+        self.clan_files.write("relationships/1_relations.json", [])
+        self.clan_files.write("relationships/2_relations.json", [])
+        self.clan_files.write("relationships_old.json", [])
+        self.assertTrue(self.clan_files.has_folder("relationships"))
+        self.assertFalse(self.clan_files.has_folder("history"))
+        self.assertEqual(
+            sorted(self.clan_files.list("relationships")),
+            ["relationships/1_relations.json", "relationships/2_relations.json"],
+        )
+
+        self.clan_files.delete("relationships/1_relations.json")
+        self.assertFalse(self.clan_files.exists("relationships/1_relations.json"))
+        self.assertTrue(self.clan_files.exists("relationships/2_relations.json"))
+
+    def test_prefetch(self):
+        self.clan_files.write("conditions/1_conditions.json", {"injuries": {}})
+        self.clan_files.commit()
+
+        self.clan_files.prefetch_json(
+            ["conditions/1_conditions.json", "conditions/2_conditions.json"]
+        )
+        self.assertEqual(
+            self.clan_files.read_json("conditions/1_conditions.json"), {"injuries": {}}
+        )
+        self.assertIsNone(self.clan_files.read_json("conditions/2_conditions.json"))
+
+
+class LooseFiles(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.clan_files = ClanFiles("test", self.directory)
+        forget_saved_files()
+
+    def tearDown(self):
+        self.clan_files.close()
+        forget_saved_files()
+        shutil.rmtree(self.directory)
+
+    def test_prefetch(self):
+        self.clan_files.write("relationships/1_relations.json", [{"like": 5}])
+
+        self.clan_files.prefetch_json(
+            ["relationships/1_relations.json", "relationships/2_relations.json"]
+        )
+        self.assertEqual(
+            self.clan_files.read_json("relationships/1_relations.json"), [{"like": 5}]
+        )
+        self.assertIsNone(self.clan_files.read_json("relationships/2_relations.json"))
+        # reading it filled in what's in the file, so writing the same thing is skipped
+        self.assertFalse(
+            self.clan_files.write("relationships/1_relations.json", [{"like": 5}])
+        )
+
+
+class PackClan(unittest.TestCase):
+    files = {
+        "clan_cats.json": '[\n    {"ID": "1"}\n]',
+        "relationships/1_relations.json": '[{"like": 5}]',
+        "conditions/1_conditions.json": '{\n    "injuries": {}\n}',
+        "history/1_history.json": "{}\n",
+        "history/2_history.json": '{"name": "Sandstorm \u2013 \u00e9"}',
+    }
+    """Cat files of the test clan, by name"""
+    other_files = {"Testclan.json": "{}", "clan_settings.json": "{}"}
+    """Files in the clan folder that are never packed"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        patcher = patch.object(clan_files, "get_save_dir", lambda: self.directory)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(reset_clan_files)
+
+        for name, text in {**self.files, **self.other_files}.items():
+            path = os.path.join(self.directory, "Test", name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as write_file:
+                write_file.write(text)
+        self.original = self._loose_bytes()
+
+    def _loose_bytes(self):
+        """:return: Every file in the clan folder and what's in it"""
+        contents = {}
+        clan_folder = os.path.join(self.directory, "Test")
+        for folder, _, filenames in os.walk(clan_folder):
+            for filename in filenames:
+                path = os.path.join(folder, filename)
+                with open(path, "rb") as read_file:
+                    contents[os.path.relpath(path, clan_folder)] = read_file.read()
+        return contents
+
+    def _assert_packed(self):
+        self.assertTrue(is_packed("Test"))
+        left = self._loose_bytes()
+        self.assertEqual(
+            sorted(left), sorted(list(self.other_files) + [clan_files.PACKED_FILE_NAME])
+        )
+        for folder in clan_files.CAT_FILE_FOLDERS:
+            self.assertFalse(
+                os.path.exists(os.path.join(self.directory, "Test", folder))
+            )
+
+        stored = get_clan_files("Test")
+        self.assertTrue(stored.packed)
+        for name, text in self.files.items():
+            self.assertEqual(stored.read(name), text)
+        self.assertEqual(
+            sorted(stored.list("history")),
+            ["history/1_history.json", "history/2_history.json"],
+        )
+
+    def test_round_trip(self):
+        self.assertEqual(pack_clan("Test"), len(self.files))
+        self._assert_packed()
+
+        self.assertEqual(unpack_clan("Test"), len(self.files))
+        self.assertFalse(is_packed("Test"))
+        self.assertFalse(get_clan_files("Test").packed)
+        self.assertEqual(self._loose_bytes(), self.original)
+
+    def test_pack_packed_clan(self):
+        pack_clan("Test")
+        self.assertEqual(pack_clan("Test"), 0)
+        self._assert_packed()
+
+        unpack_clan("Test")
+        self.assertEqual(self._loose_bytes(), self.original)
+
+    def test_unpack_loose_clan(self):
+        self.assertEqual(unpack_clan("Test"), 0)
+        self.assertEqual(self._loose_bytes(), self.original)
@@ -0,0 +1,103 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+# screens_core can only be imported once the game is
+from scripts.game_structure import game  # noqa: F401
+from scripts.screens.screens_core import screens_core
+from scripts.screens.screens_core.screens_core import (
+    FullscreenBackgrounds,
+    feather_surface,
+)
+
+
+def _feather_per_pixel(surface, feather_width):
+    """How feather_surface used to draw the edge, one pixel at a time"""
+    width, height = surface.get_size()
+    for x in range(width):
+        for y in range(height):
+            distance = min(x, y, width - x - 1, height - y - 1)
+            if distance < feather_width:
+                alpha = int(255 * (distance / feather_width))
+                surface.set_at((x, y), (0, 0, 0, alpha))
+
+
+class TestFeatherSurface(unittest.TestCase):
+    def test_same_as_per_pixel(self):
+        for size in ((7, 9), (8, 10), (5, 5), (6, 6), (1, 4), (12, 3)):
+            for feather_width in (1, 2, 3, 15):
+                with self.subTest(size=size, feather_width=feather_width):
+                    rings = pygame.Surface(size, pygame.SRCALPHA)
+                    feather_surface(rings, feather_width)
+                    pixels = pygame.Surface(size, pygame.SRCALPHA)
+                    _feather_per_pixel(pixels, feather_width)
+
+                    self.assertEqual(
+                        pygame.image.tobytes(rings, "RGBA"),
+                        pygame.image.tobytes(pixels, "RGBA"),
+                    )
+
+
+class TestFullscreenBackgrounds(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        patcher = patch.object(screens_core, "get_cache_dir", lambda: self.folder.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @property
+    def cached_files(self):
+        return sorted(os.listdir(os.path.join(self.folder.name, "backgrounds")))
+
+    @staticmethod
+    def _backgrounds(**blur_args):
+        backgrounds = FullscreenBackgrounds("light")
+        backgrounds.add("test", (10, 20, 30), **blur_args)
+        return backgrounds
+
+    def test_reloaded_from_cache(self):
+        made = self._backgrounds()["test"]
+        self.assertEqual(len(self.cached_files), 1)
+
+        with patch.object(screens_core, "process_blur_bg") as process_blur_bg:
+            loaded = self._backgrounds()["test"]
+        process_blur_bg.assert_not_called()
+        self.assertEqual(
+            pygame.image.tobytes(loaded, "RGBA"), pygame.image.tobytes(made, "RGBA")
+        )
+
+    def test_made_again_when_inputs_change(self):
+        self._backgrounds()["test"]
+        old_files = self.cached_files
+
+        with patch.object(
+            screens_core, "process_blur_bg", wraps=screens_core.process_blur_bg
+        ) as process_blur_bg:
+            self._backgrounds(blur_radius=2)["test"]
+        process_blur_bg.assert_called_once()
+        self.assertEqual(len(self.cached_files), 1)
+        self.assertNotEqual(self.cached_files, old_files)
+
+    def test_other_resolutions_removed(self):
+        folder = os.path.join(self.folder.name, "backgrounds")
+        os.makedirs(folder)
+        for filename in (
+            "light_test_3840x2160_0123456789abcdef.bmp",
+            "light_testing_3840x2160_0123456789abcdef.bmp",
+            "dark_test_3840x2160_0123456789abcdef.bmp",
+        ):
+            with open(os.path.join(folder, filename), "wb") as write_file:
+                write_file.write(b"old")
+
+        self._backgrounds()["test"]
+        self.assertNotIn("light_test_3840x2160_0123456789abcdef.bmp", self.cached_files)
+        self.assertIn("light_testing_3840x2160_0123456789abcdef.bmp", self.cached_files)
+        self.assertIn("dark_test_3840x2160_0123456789abcdef.bmp", self.cached_files)
+        self.assertEqual(len(self.cached_files), 3)
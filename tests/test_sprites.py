@@ -0,0 +1,158 @@
+import gc
+import os
+import tempfile
+import unittest
+
+import pygame
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from scripts.cat.sprite_cache import SpriteDiskCache
+from scripts.cat.sprites import Sprites
+from scripts.game_structure import ui_elements
+from scripts.game_structure.ui_elements import scale_cat_sprite
+
+
+class TestSprites(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        if pygame.display.get_surface() is None:
+            pygame.display.set_mode((1, 1))
+
+    def test_sheets_load_when_needed(self):
+        sprites = Sprites()
+        sprites.load_all()
+        self.assertEqual(sprites.spritesheets, {})
+        self.assertIn("eyesYELLOW0", sprites.sprites)
+
+        eyes = sprites.sprites["eyesYELLOW0"]
+        self.assertEqual(list(sprites.spritesheets), ["eyes"])
+        self.assertIs(eyes, sprites.sprites["eyesYELLOW0"])
+
+        sheet = pygame.image.load("sprites/eyes.png").convert_alpha()
+        self.assertEqual(
+            pygame.image.tobytes(eyes, "RGBA"),
+            pygame.image.tobytes(
+                sheet.subsurface(0, 0, sprites.size, sprites.size), "RGBA"
+            ),
+        )
+
+    def test_load_all_once(self):
+        sprites = Sprites()
+        sprites.load_all()
+        symbols = list(sprites.clan_symbols)
+        count = len(sprites.sprites)
+
+        sprites.load_all()
+        self.assertEqual(sprites.clan_symbols, symbols)
+        self.assertEqual(len(sprites.sprites), count)
+
+    def test_unknown_sprite(self):
+        sprites = Sprites()
+        sprites.load_all()
+        self.assertIsNone(sprites.sprites.get("not a sprite"))
+        with self.assertRaises(KeyError):
+            sprites.sprites["not a sprite"]
+
+
+class TestSpriteDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+
+    @staticmethod
+    def _sprite(color):
+        sprite = pygame.Surface((2, 2), pygame.SRCALPHA)
+        sprite.fill(color)
+        return sprite
+
+    def test_round_trip(self):
+        cache = SpriteDiskCache(self.folder.name, "one")
+        sprite = self._sprite((10, 20, 30, 40))
+        cache.put(("a",), sprite)
+
+        loaded = SpriteDiskCache(self.folder.name, "one").get(("a",), 2)
+        self.assertEqual(
+            pygame.image.tobytes(loaded, "RGBA"), pygame.image.tobytes(sprite, "RGBA")
+        )
+        self.assertIsNone(cache.get(("b",), 2))
+
+    def test_least_recently_used_evicted(self):
+        # room for two 2x2 sprites
+        cache = SpriteDiskCache(self.folder.name, "one", max_bytes=32)
+        cache.put(("a",), self._sprite((1, 1, 1, 1)))
+        cache.put(("b",), self._sprite((2, 2, 2, 2)))
+        cache.get(("a",), 2)
+        cache.put(("c",), self._sprite((3, 3, 3, 3)))
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(cache.get(("a",), 2))
+        self.assertIsNone(cache.get(("b",), 2))
+        self.assertEqual(len(os.listdir(cache.folder)), 2)
+
+    def test_new_fingerprint_clears_old_sprites(self):
+        SpriteDiskCache(self.folder.name, "one").put(("a",), self._sprite((1, 1, 1, 1)))
+        cache = SpriteDiskCache(self.folder.name, "two")
+
+        self.assertIsNone(cache.get(("a",), 2))
+        self.assertEqual(os.listdir(self.folder.name), ["two"])
+
+
+class TestScaleCatSprite(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        if pygame.display.get_surface() is None:
+            pygame.display.set_mode((1, 1))
+
+    @staticmethod
+    def _sprite():
+        sprite = pygame.Surface((4, 4), pygame.SRCALPHA)
+        sprite.fill((200, 100, 50, 255))
+        sprite.fill((200, 100, 50, 128), pygame.Rect(0, 0, 2, 4))
+        return sprite
+
+    def test_scaled_once(self):
+        sprite = self._sprite()
+        scaled = scale_cat_sprite(sprite, (8, 8))
+
+        self.assertIs(scale_cat_sprite(sprite, (8, 8)), scaled)
+        self.assertEqual(scaled.get_size(), (8, 8))
+        self.assertIsNot(scale_cat_sprite(sprite, (2, 2)), scaled)
+
+    def test_new_sprite_scaled_again(self):
+        sprite = self._sprite()
+        scaled = scale_cat_sprite(sprite, (8, 8))
+
+        new_sprite = self._sprite()
+        new_sprite.fill((0, 0, 0, 255))
+        new_scaled = scale_cat_sprite(new_sprite, (8, 8))
+        self.assertIsNot(new_scaled, scaled)
+        self.assertEqual(new_scaled.get_at((7, 7)), pygame.Color(0, 0, 0, 255))
+
+    def test_dead_sprite_not_served(self):
+        sprite = self._sprite()
+        stale = scale_cat_sprite(sprite, (8, 8))
+        key = next(
+            key
+            for key, (_, scaled) in ui_elements._scaled_sprites.items()
+            if scaled is stale
+        )
+        dead_sprite = ui_elements._scaled_sprites[key][0]
+        del sprite
+        gc.collect()
+        self.assertIsNone(dead_sprite())
+
+        # a new sprite can get the id the dropped one had
+        new_sprite = self._sprite()
+        new_sprite.fill((0, 0, 0, 255))
+        new_key = (id(new_sprite),) + key[1:]
+        ui_elements._scaled_sprites[new_key] = (dead_sprite, stale)
+        self.addCleanup(ui_elements._scaled_sprites.pop, new_key, None)
+
+        new_scaled = scale_cat_sprite(new_sprite, (8, 8))
+        self.assertIsNot(new_scaled, stale)
+        self.assertEqual(new_scaled.get_at((7, 7)), pygame.Color(0, 0, 0, 255))
+        self.assertIs(ui_elements._scaled_sprites[new_key][1], new_scaled)
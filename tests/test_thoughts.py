@@ -170,3 +170,30 @@ class TestFamilyThoughts(unittest.TestCase):
         # when
 
         # then
+
+
+class TestThoughtIndex(unittest.TestCase):
+    def test_thoughts_for_place(self):
+        locations = (
+            "thoughts/alive/warrior.json",
+            "thoughts/alive/general.json",
+        )
+        placed = Thoughts.thoughts_for_place(
+            locations, CatRank.WARRIOR, "Forest", "Newleaf", "camp2"
+        )
+
+        self.assertIs(
+            placed,
+            Thoughts.thoughts_for_place(
+                locations, CatRank.WARRIOR, "Forest", "Newleaf", "camp2"
+            ),
+        )
+        self.assertGreater(len(placed), 0)
+        for thought, r_c_in in placed:
+            self.assertTrue(
+                Thoughts.thought_fits_place(thought, "Forest", "Newleaf", "camp2")
+            )
+            self.assertEqual(r_c_in, Thoughts.needs_random_cat(thought))
+            statuses = thought.get("main_status_constraint")
+            if statuses and "any" not in statuses and "lost" not in statuses:
+                self.assertIn(CatRank.WARRIOR, statuses)
@@ -1,18 +1,32 @@
 import os
+import tempfile
 import unittest
 
+import pygame
+
 from scripts.cat.enums import CatRank
 
 os.environ["SDL_VIDEODRIVER"] = "dummy"
 os.environ["SDL_AUDIODRIVER"] = "dummy"
 
+from scripts.cat.cat_index import name_search
 from scripts.cat.cats import Cat
+from scripts.cat.names import Name
 from scripts.cat_relations.relationship import Relationship
+from scripts import utility
 from scripts.utility import (
     get_highest_romantic_relation,
     get_personality_compatibility,
     get_num_of_cats_with_relation_amount_towards,
     get_alive_clan_queens,
+    find_alive_cats_with_rank,
+    get_living_clan_cat_count,
+    generate_sprite,
+    enable_sprite_disk_cache,
+    disable_sprite_disk_cache,
+    _recolor_black_pixels,
+    inflate_mask,
+    update_mask,
 )
 
 
@@ -409,3 +423,216 @@ class TestGetQueens(unittest.TestCase):
         self.assertEqual(
             [self.test_cat2.ID], list(get_alive_clan_queens(living_cats)[0].keys())
         )
+
+
+class TestFindCatsWithRank(unittest.TestCase):
+    def setUp(self) -> None:
+        self.warrior = Cat(status_dict={"rank": CatRank.WARRIOR}, disable_random=True)
+        self.kitten = Cat(status_dict={"rank": CatRank.KITTEN}, disable_random=True)
+        self.elder = Cat(status_dict={"rank": CatRank.ELDER}, disable_random=True)
+
+    def tearDown(self) -> None:
+        for cat in (self.warrior, self.kitten, self.elder):
+            Cat.all_cats.pop(cat.ID, None)
+
+    def test_same_as_looking_through_all_cats(self):
+        ranks = [CatRank.ELDER, CatRank.WARRIOR, "kitten"]
+        expected = [
+            cat
+            for cat in Cat.all_cats.values()
+            if cat.status.rank in ranks and cat.status.alive_in_player_clan
+        ]
+        self.assertEqual(find_alive_cats_with_rank(Cat, ranks), expected)
+        self.assertEqual(
+            get_living_clan_cat_count(Cat),
+            len([c for c in Cat.all_cats.values() if c.status.alive_in_player_clan]),
+        )
+
+    def test_rank_change(self):
+        self.assertIn(self.kitten, find_alive_cats_with_rank(Cat, [CatRank.KITTEN]))
+
+        self.kitten.status._change_rank(CatRank.APPRENTICE)
+        self.assertNotIn(self.kitten, find_alive_cats_with_rank(Cat, [CatRank.KITTEN]))
+        self.assertIn(self.kitten, find_alive_cats_with_rank(Cat, [CatRank.APPRENTICE]))
+
+    def test_death_and_new_cats(self):
+        count = get_living_clan_cat_count(Cat)
+
+        self.elder.dead = True
+        self.assertNotIn(self.elder, find_alive_cats_with_rank(Cat, [CatRank.ELDER]))
+        self.assertEqual(get_living_clan_cat_count(Cat), count - 1)
+
+        new_cat = Cat(status_dict={"rank": CatRank.ELDER}, disable_random=True)
+        self.addCleanup(Cat.all_cats.pop, new_cat.ID, None)
+        self.assertIn(new_cat, find_alive_cats_with_rank(Cat, [CatRank.ELDER]))
+        self.assertEqual(get_living_clan_cat_count(Cat), count)
+
+
+class TestNameSearch(unittest.TestCase):
+    def setUp(self) -> None:
+        self.warrior = Cat(status_dict={"rank": CatRank.WARRIOR}, disable_random=True)
+        self.warrior.name = Name(prefix="Ripple", suffix="tail", cat=self.warrior)
+        self.kitten = Cat(status_dict={"rank": CatRank.KITTEN}, disable_random=True)
+        self.kitten.name = Name(prefix="Sand", suffix="tail", cat=self.kitten)
+
+    def tearDown(self) -> None:
+        for cat in (self.warrior, self.kitten):
+            Cat.all_cats.pop(cat.ID, None)
+
+    def test_search(self):
+        cats = [self.kitten, self.warrior]
+        self.assertEqual(name_search.search(cats, "TAIL"), [self.warrior])
+        self.assertEqual(name_search.search(cats, "kit"), [self.kitten])
+        self.assertEqual(name_search.search(cats, ""), cats)
+
+    def test_name_changes(self):
+        cats = [self.kitten, self.warrior]
+        self.assertEqual(name_search.search(cats, "ripple"), [self.warrior])
+
+        self.warrior.name.prefix = "Sand"
+        self.assertEqual(name_search.search(cats, "ripple"), [])
+        self.assertEqual(name_search.search(cats, "sand"), cats)
+
+        self.kitten.status._change_rank(CatRank.APPRENTICE)
+        self.assertEqual(name_search.lower_name(self.kitten), "sandpaw")
+
+
+def _clear_sprite_caches():
+    """Throws away every cached cat sprite, mask and recolored layer"""
+    utility._sprite_cache.clear()
+    utility._mask_cache.clear()
+    utility._recolored_layers.clear()
+
+
+class TestGenerateSprite(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        from scripts.cat.sprites import sprites
+
+        if not sprites.sprites:
+            sprites.load_all()
+
+    def setUp(self):
+        _clear_sprite_caches()
+
+    @staticmethod
+    def _pixels(surface):
+        return pygame.image.tobytes(surface, "RGBA")
+
+    def test_cached_sprite_matches(self):
+        cat = Cat(disable_random=True)
+        first = generate_sprite(cat)
+        second = generate_sprite(cat)
+        self.assertIsNot(first, second)
+        self.assertEqual(self._pixels(first), self._pixels(second))
+
+    def test_changed_look_not_cached(self):
+        cat = Cat(disable_random=True)
+        cat.pelt.scars = []
+        without_scar = generate_sprite(cat)
+        cat.pelt.scars = ["ONE"]
+        with_scar = generate_sprite(cat)
+        self.assertNotEqual(self._pixels(without_scar), self._pixels(with_scar))
+
+        _clear_sprite_caches()
+        self.assertEqual(self._pixels(generate_sprite(cat)), self._pixels(with_scar))
+
+    def test_disk_cache(self):
+        cat = Cat(disable_random=True)
+        with tempfile.TemporaryDirectory() as folder:
+            disk_cache = enable_sprite_disk_cache(folder)
+            try:
+                drawn = generate_sprite(cat)
+                self.assertEqual(len(disk_cache), 1)
+
+                _clear_sprite_caches()
+                loaded = generate_sprite(cat)
+            finally:
+                disable_sprite_disk_cache()
+        self.assertEqual(self._pixels(drawn), self._pixels(loaded))
+
+    def test_unknown_residence_leaves_sheet_alone(self):
+        from scripts.cat.enums import CatGroup
+        from scripts.cat.pelts import Pelt
+        from scripts.cat.sprites import sprites
+
+        cat = Cat(disable_random=True)
+        cat.dead = True
+        cat.status.send_to_afterlife(CatGroup.UNKNOWN_RESIDENCE_ID)
+        cat.pelt.scars = [Pelt.scars2[0]]
+        # this one has black lineart to recolor
+        cat.pelt.accessory = ["DAISY"]
+
+        cat_sprite = str(cat.pelt.cat_sprites["adult"])
+        layers = (
+            "scars" + Pelt.scars2[0] + cat_sprite,
+            "acc_herbsDAISY" + cat_sprite,
+        )
+        before = [self._pixels(sprites.sprites[name]) for name in layers]
+        first = generate_sprite(cat, life_state="adult")
+        _clear_sprite_caches()
+        second = generate_sprite(cat, life_state="adult")
+
+        self.assertEqual(
+            before, [self._pixels(sprites.sprites[name]) for name in layers]
+        )
+        self.assertEqual(self._pixels(first), self._pixels(second))
+
+
+class TestRecolorBlackPixels(unittest.TestCase):
+    def test_matches_per_pixel(self):
+        sprite = pygame.Surface((4, 3), pygame.SRCALPHA)
+        sprite.fill((0, 0, 0, 0))
+        sprite.set_at((0, 0), (0, 0, 0, 255))
+        sprite.set_at((1, 0), (0, 0, 0, 128))
+        sprite.set_at((2, 1), (1, 0, 0, 255))
+        sprite.set_at((3, 2), (0, 0, 0, 255))
+        source = pygame.Surface((4, 3), pygame.SRCALPHA)
+        for x in range(4):
+            for y in range(3):
+                source.set_at((x, y), (x * 60, y * 80, 90, 255))
+
+        expected = sprite.copy()
+        for x in range(4):
+            for y in range(3):
+                if sprite.get_at((x, y)) == pygame.Color(0, 0, 0):
+                    expected.set_at((x, y), source.get_at((x, y)))
+
+        recolored = _recolor_black_pixels(sprite, source=source)
+        self.assertEqual(
+            pygame.image.tobytes(recolored, "RGBA"),
+            pygame.image.tobytes(expected, "RGBA"),
+        )
+        self.assertEqual(sprite.get_at((0, 0)), pygame.Color(0, 0, 0, 255))
+
+
+class TestMasks(unittest.TestCase):
+    def test_inflate_mask(self):
+        mask = pygame.Mask((5, 5))
+        mask.set_at((2, 2))
+        inflated = inflate_mask(mask, 5, 3)
+
+        self.assertEqual(inflated.get_size(), (15, 15))
+        self.assertEqual(inflated.count(), 7 * 7)
+        self.assertEqual(inflated.get_bounding_rects(), [pygame.Rect(4, 4, 7, 7)])
+
+    def test_inflate_mask_clips(self):
+        mask = pygame.Mask((4, 4), fill=True)
+        inflated = inflate_mask(mask, 1, 3, (5, 5))
+        self.assertEqual(inflated.count(), 5 * 5)
+
+    def test_lookalikes_share_mask(self):
+        from scripts.cat.sprites import sprites
+
+        if not sprites.sprites:
+            sprites.load_all()
+        _clear_sprite_caches()
+        cat1 = Cat(disable_random=True)
+        cat2 = Cat(disable_random=True)
+        cat2.pelt = cat1.pelt
+
+        update_mask(cat1)
+        update_mask(cat2)
+        self.assertIsNotNone(cat1.sprite_mask)
+        self.assertIs(cat1.sprite_mask, cat2.sprite_mask)
+        self.assertGreater(cat1.sprite_mask.count(), 0)